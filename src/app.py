@@ -1,9 +1,10 @@
-from game import *
+from ohhell.game import Game
 
 def main():
 	# Game object and user interface will exist here
 	print("Welcome!")
 	game = Game("Oh Hell")
+	game.play()
 	
 if __name__ == '__main__':
 	main()
\ No newline at end of file
@@ -0,0 +1,470 @@
+import os
+import re
+import sys
+import math
+import shutil
+import timeit
+import statistics
+import subprocess
+import importlib.util
+
+# Local imports
+from ohhell.card import Card
+from ohhell.pile import Pile
+from ohhell.bitpile import BitPile
+from ohhell.arraypile import ArrayPile
+from ohhell.hand import SortedHand
+from ohhell.shuffle import ShuffleEngine
+from ohhell.dealer import Dealer
+from ohhell.deck import Deck
+from ohhell.player import Player
+from ohhell.gamestate import Gamestate
+from ohhell.actionlog import ActionLog, pack, MOVE
+from ohhell.transposition import TranspositionTable
+from ohhell import codec
+
+# Import time budgets in microseconds, checked by bench_startup(). They leave about 2x
+# headroom for noisy machines and are there to catch heavy imports (unittest ~40 ms,
+# numpy ~100 ms) creeping into the engine. Never loosen them without a reason in the
+# commit message.
+IMPORT_BUDGETS = {
+	"ohhell"				: 5000,
+	"ohhell.card"			: 10000,
+	"ohhell.gamestate"		: 30000,
+	"ohhell.headless"		: 50000,
+}
+# Wall time budget for "python3 -m ohhell --quiet" in milliseconds, interpreter start included
+HEADLESS_BUDGET = 200
+
+"""=================================================================================
+Benchmarks
+=================================================================================""" 
+
+""" Benchmarks
+Micro-benchmarks for the hot paths of the engine. Run with "make benchmark" and compare
+	the numbers across changes. Each benchmark prints one line per measurement in
+	nanoseconds per operation (best of 5 repeats).
+
+@author Chris P.
+@created 2021-01-09 YMD
+"""
+
+""" LegacyCard Class
+Copy of the original Card implementation (a plain object with a __dict__ that recomputes
+	its ID on every comparison). Kept here as the "before" number for bench_card()
+"""
+class LegacyCard:
+	def __init__(self, value, suit):
+		if value < 2 or value > 14:
+			value = 2
+		if suit < 0 or suit > 3:
+			suit = 0
+		self.value = value
+		self.suit = suit
+
+	@classmethod
+	def fromID(cls, id_):
+		if id_ < 0 or id_ > 51:
+			id_ = 0
+		return cls(((id_ % 13) + 2),math.floor(id_ / 13))
+
+	def getID(self):
+		return ((self.value - 2) + (self.suit * 13))
+
+	def __eq__(self, other):
+		return self.getID() == other.getID()
+
+	def __lt__(self, other):
+		return self.getID() < other.getID()
+
+""" measure(label, stmt, setup_globals, number)
+Times stmt and prints the best result in nanoseconds per operation
+@param label : String - the name printed in front of the result
+@param stmt : String - the statement to time
+@param setup_globals : dict - the names stmt needs
+@param number : int - how many times stmt is run per repeat
+@return : float - best time in nanoseconds per operation
+"""
+def measure(label, stmt, setup_globals, number=100000):
+	best = min(timeit.repeat(stmt, globals=setup_globals, number=number, repeat=5))
+	result = best / number * 1e9
+	print("{:<40} {:>10.1f} ns".format(label, result))
+	return result
+
+""" bench_card()
+Card creation and comparison, legacy objects against the shared flyweight table
+"""
+def bench_card():
+	print("-- Card")
+	a, b = LegacyCard(7,2), LegacyCard(9,3)
+	c, d = Card(7,2), Card(9,3)
+	measure("LegacyCard.fromID", "LegacyCard.fromID(31)", {"LegacyCard": LegacyCard})
+	measure("Card.fromID", "Card.fromID(31)", {"Card": Card})
+	measure("LegacyCard(value, suit)", "LegacyCard(7,2)", {"LegacyCard": LegacyCard})
+	measure("Card(value, suit)", "Card(7,2)", {"Card": Card})
+	measure("LegacyCard ==", "a == b", {"a": a, "b": b})
+	measure("Card ==", "c == d", {"c": c, "d": d})
+	measure("LegacyCard <", "a < b", {"a": a, "b": b})
+	measure("Card <", "c < d", {"c": c, "d": d})
+	print("{:<40} {:>10} B".format("LegacyCard size", sys.getsizeof(a) + sys.getsizeof(a.__dict__)))
+	print("{:<40} {:>10} B".format("Card size", sys.getsizeof(c)))
+
+""" bench_bitpile()
+Membership, add and remove on a 13 card hand, list Pile against BitPile
+"""
+def bench_bitpile():
+	print("-- BitPile")
+	ids = [0, 4, 9, 14, 17, 22, 27, 30, 35, 38, 44, 47, 51]
+	pile, bits = Pile.fromList(ids), BitPile.fromList(ids)
+	miss, hit = Card.fromID(50), Card.fromID(47)
+	names = {"pile": pile, "bits": bits, "miss": miss, "hit": hit}
+	measure("Pile: card in hand (miss)", "miss in pile", names)
+	measure("BitPile: card in hand (miss)", "miss in bits", names)
+	measure("Pile: remove + append", "pile.remove(hit); pile.append(hit)", names)
+	measure("BitPile: remove + append", "bits.remove(hit); bits.append(hit)", names)
+	measure("Pile: len", "len(pile)", names)
+	measure("BitPile: len", "len(bits)", names)
+	measure("BitPile: union", "bits | bits", names)
+
+""" bench_codec()
+Encoding and decoding a full deck
+"""
+def bench_codec():
+	print("-- Codec")
+	deck = Pile.fromList(range(0, 52))
+	data = codec.toBytes(deck)
+	names = {"deck": deck, "data": data, "view": memoryview(data), "codec": codec, "Pile": Pile}
+	measure("str(Pile) 52 cards", "str(deck)", names, 10000)
+	measure("Pile.fromList 52 cards", "Pile.fromList(data)", names, 10000)
+	measure("codec.fromBytes 52 cards (memoryview)", "codec.fromBytes(view)", names, 10000)
+	measure("codec.toBytes 52 cards", "codec.toBytes(deck)", names, 10000)
+	measure("codec.toShort 52 cards", "codec.toShort(deck)", names, 10000)
+
+""" bench_arraypile()
+push/pop on the top of a 104 card (two deck) pile, list Pile against ArrayPile
+"""
+def bench_arraypile():
+	print("-- ArrayPile")
+	ids = list(range(0, 52)) * 2
+	names = {"pile": Pile.fromList(ids), "arr": ArrayPile.fromList(ids)}
+	measure("Pile: pop + push (104 cards)", "pile.push(pile.pop())", names)
+	measure("ArrayPile: pop + push (104 cards)", "arr.push(arr.pop())", names)
+	measure("ArrayPile: draw 7 + push back", "[arr.push(c) for c in arr.draw(7)]", names)
+
+""" bench_hand()
+Dealing a 13 card hand one card at a time, push-then-sort Pile against SortedHand
+"""
+def bench_hand():
+	print("-- SortedHand")
+	cards = [Card.fromID(i) for i in [47, 3, 20, 51, 0, 33, 12, 26, 8, 40, 17, 30, 44]]
+	names = {"cards": cards, "Pile": Pile, "SortedHand": SortedHand}
+	measure("Pile: push + sort per card (13 cards)", "p = Pile()\nfor c in cards:\n\tp.push(c); p.sort()", names, 10000)
+	measure("SortedHand: push per card (13 cards)", "h = SortedHand()\nfor c in cards:\n\th.push(c)", names, 10000)
+	hand = SortedHand()
+	for card in cards:
+		hand.push(card)
+	names = {"hand": hand, "card": Card(5,2)}
+	measure("SortedHand: highest(suit)", "hand.highest(2)", names)
+	measure("SortedHand: lowestAbove(card)", "hand.lowestAbove(card)", names)
+
+""" bench_shuffle()
+Single deck shuffles against the batched numpy permutations
+"""
+def bench_shuffle():
+	print("-- ShuffleEngine")
+	engine = ShuffleEngine(1)
+	names = {"engine": engine, "cards": list(range(0, 52))}
+	measure("ShuffleEngine.shuffle 52 cards", "engine.shuffle(cards)", names, 10000)
+	if importlib.util.find_spec("numpy") is not None:
+		measure("ShuffleEngine.permutations(10000)", "engine.permutations(10000)", names, 10)
+
+""" bench_dealer()
+Dealing a 7 player, 7 card round: one deckToPlayer call per card against Dealer.deal
+"""
+def bench_dealer():
+	print("-- Dealer")
+	def newGame():
+		deck = Deck(52)
+		deck.extend([Card.fromID(i) for i in range(0, 52)])
+		return Gamestate(deck, [Player(str(i), str(i)) for i in range(0, 7)])
+	def perCard():
+		gamestate = newGame()
+		for card in gamestate.deck.cards[:49]:
+			gamestate.deckToPlayer(card, gamestate.players[card.id % 7])
+	dealer = Dealer(ShuffleEngine(1))
+	def oneShot():
+		dealer.deal(newGame(), 7)
+	names = {"newGame": newGame, "perCard": perCard, "oneShot": oneShot}
+	measure("new game only", "newGame()", names, 1000)
+	measure("new game + deckToPlayer x 49", "perCard()", names, 1000)
+	measure("new game + Dealer.deal (with shuffle)", "oneShot()", names, 1000)
+
+""" bench_actionlog()
+Recording and undoing moves, and the memory a long history takes
+"""
+def bench_actionlog():
+	print("-- ActionLog")
+	log = ActionLog()
+	names = {"log": log, "pack": pack, "MOVE": MOVE}
+	measure("ActionLog.push(pack(...)) + pop", "log.push(pack(MOVE, 0, 3, 17)); log.pop()", names)
+	for i in range(0, 1000000):
+		log.push(pack(MOVE, 0, i % 7 + 1, i % 52))
+	print("{:<40} {:>10.1f} bytes/action".format("ActionLog, 1M moves", log.nbytes() / len(log)))
+	deck = Deck(52)
+	deck.extend([Card.fromID(i) for i in range(0, 52)])
+	gamestate = Gamestate(deck, [Player(str(i), str(i)) for i in range(0, 7)])
+	names = {"gamestate": gamestate}
+	measure("Gamestate: dealHands(7) + revertLastAction", "gamestate.dealHands(7); gamestate.revertLastAction()", names, 10000)
+
+""" bench_fork()
+Copying a dealt 4 player game for lookahead: copy.deepcopy of the Gamestate against
+	Gamestate.fork() and forks of the FlatState
+"""
+def bench_fork():
+	print("-- Fork")
+	import copy
+	deck = Deck(52)
+	deck.extend([Card.fromID(i) for i in range(0, 52)])
+	players = [Player(str(i), str(i)) for i in range(0, 4)]
+	gamestate = Gamestate(deck, players)
+	Dealer(ShuffleEngine(1)).deal(gamestate, 13)
+	gamestate.playerToPile(players[0], 0, players[0].hand.cards[0])
+	state = gamestate.fork()
+	names = {"copy": copy, "gamestate": gamestate, "state": state}
+	measure("copy.deepcopy(gamestate)", "copy.deepcopy(gamestate)", names, 100)
+	measure("Gamestate.fork()", "gamestate.fork()", names, 10000)
+	fork = measure("FlatState.fork()", "state.fork()", names)
+	measure("FlatState.fork() + move", "state.fork().move(2, -1, 20)", names)
+	print("{:<40} {:>10.0f} forks/s".format("FlatState.fork() rate", 1e9 / fork))
+	child = state.fork()
+	size = sum(sys.getsizeof(part) for part in (child, child.where, child.points))
+	print("{:<40} {:>10} B".format("FlatState fork size (not shared)", size))
+
+""" bench_hash()
+Keying a position: hashing str(gamestate) against the incremental Zobrist hash, and
+	what keeping the hash up to date adds to a move
+"""
+def bench_hash():
+	print("-- Hash")
+	deck = Deck(52)
+	deck.extend([Card.fromID(i) for i in range(0, 52)])
+	players = [Player(str(i), str(i)) for i in range(0, 4)]
+	gamestate = Gamestate(deck, players)
+	Dealer(ShuffleEngine(1)).deal(gamestate, 13)
+	card = players[0].hand.cards[0]
+	table = TranspositionTable()
+	table.store(gamestate.hash, 4, 1.0)
+	names = {"gamestate": gamestate, "players": players, "card": card, "table": table}
+	measure("hash(str(gamestate))", "hash(str(gamestate))", names, 10000)
+	measure("gamestate.hash", "gamestate.hash", names)
+	measure("playerToPile + revertLastAction", "gamestate.playerToPile(players[0], 0, card); gamestate.revertLastAction()", names, 10000)
+	measure("TranspositionTable.store", "table.store(gamestate.hash, 4, 1.0)", names)
+	measure("TranspositionTable.lookup", "table.lookup(gamestate.hash, 2)", names)
+
+""" bench_journal()
+Writing 1000 dealt 4 player games to a journal, then scanning and replaying them
+"""
+def bench_journal():
+	print("-- Journal")
+	import tempfile
+	from ohhell.journal import JournalWriter, JournalReader
+	from ohhell.headless import newGame
+	path = os.path.join(tempfile.mkdtemp(), "bench.ohj")
+	engine = ShuffleEngine(1)
+	start = timeit.default_timer()
+	with JournalWriter(path) as writer:
+		for i in range(0, 1000):
+			writer.startGame({"game": i})
+			Dealer(engine).deal(newGame(4, 1, writer.log()), 13)
+	print("{:<40} {:>10.1f} us/game".format("write 1000 games", (timeit.default_timer() - start) * 1000))
+	with JournalReader(path) as reader:
+		names = {"reader": reader, "MOVE": MOVE}
+		measure("scan every record ({} words)".format(len(reader)), "sum(1 for r in reader.records if r & 15 == MOVE)", names, 1)
+		games = reader.games()
+		names = {"reader": reader, "game": games[-1], "state": newGame(4).fork()}
+		measure("replay one game onto a FlatState fork", "reader.replay(game, state.fork())", names, 1000)
+	os.remove(path)
+	os.rmdir(os.path.dirname(path))
+
+def bench_render():
+	print("-- DeltaRenderer")
+	from ohhell.render import DeltaRenderer
+	from ohhell.headless import newGame
+	gamestate = newGame(7, 2)
+	Dealer(ShuffleEngine(1)).deal(gamestate, 7)
+	renderer = DeltaRenderer(gamestate)
+	renderer.render()
+	player = gamestate.players[0]
+	names = {"gamestate": gamestate, "renderer": renderer, "player": player}
+	measure("str(gamestate), 7 players 2 decks", "str(gamestate)", names, 1000)
+	measure("move and revert, str(gamestate)", "gamestate.playerToPile(player, 0, player.hand.cards[0]); gamestate.revertLastAction(); str(gamestate)", names, 1000)
+	measure("move and revert, renderer.render()", "gamestate.playerToPile(player, 0, player.hand.cards[0]); gamestate.revertLastAction(); renderer.render()", names, 1000)
+
+def bench_events():
+	print("-- Events")
+	from ohhell.headless import newGame
+	gamestate = newGame(4)
+	names = {"gamestate": gamestate}
+	measure("deal and revert, no subscribers", "gamestate.dealHands(13); gamestate.revertLastAction()", names, 1000)
+	gamestate.subscribe(lambda event: None)
+	measure("deal and revert, one per event", "gamestate.dealHands(13); gamestate.revertLastAction()", names, 1000)
+	gamestate.unsubscribe(gamestate.events.subscribers[0][0])
+	gamestate.subscribe(lambda events: None, batched=True)
+	measure("deal and revert, batched", "gamestate.dealHands(13); gamestate.revertLastAction()", names, 1000)
+
+def bench_rules():
+	print("-- Oh Hell rules")
+	from ohhell.game import Game
+	from ohhell.rules import trickWinner, GreedyStrategy, OhHellRules
+	engines = ShuffleEngine(1).spawn(100)
+	start = timeit.default_timer()
+	for engine in engines:
+		Game("Oh Hell", 7, engine).play()
+	print("{:<40} {:>10.1f} us/game".format("full 7 player game", (timeit.default_timer() - start) * 10000))
+	# The rules without the Gamestate: the 343 plays and 49 tricks of a 7 player game
+	game = Game("Oh Hell", 7, ShuffleEngine(2))
+	game.dealer.deal(game.gamestate, 7)
+	rules = game.rules
+	rules.trump = 3
+	rules.bids = [1] * 7
+	rules.tricks = [0] * 7
+	names = {"moves": rules.moves, "trickWinner": trickWinner,
+		"strategy": GreedyStrategy(), "rules": rules, "played": [0, 13, 26, 39, 5, 18, 31]}
+	code = "for trick in range(0, 49):\n\tfor i in range(0, 7):\n\t\tstrategy.play(rules, i, moves.legalMoves(i, 0), 0)\n\ttrickWinner(0, 3, played)"
+	measure("rules of one 7 player game", code, names, 100)
+
+def bench_moves():
+	print("-- MoveGenerator")
+	from ohhell.moves import MoveGenerator
+	from ohhell.headless import newGame
+	gamestate = newGame(7)
+	Dealer(ShuffleEngine(1)).deal(gamestate, 7)
+	player = gamestate.players[0]
+	gamestate.playerToPile(player, 0, player.hand.cards[0])
+	moves = MoveGenerator(gamestate)
+	names = {"moves": moves, "hand": gamestate.players[1].hand}
+	measure("legalMoves, cached", "moves.legalMoves(1)", names)
+	measure("legalMoves, hand changed", "hand.version += 1; moves.legalMoves(1)", names)
+	measure("legalMask, cached", "moves.legalMask(1)", names)
+	measure("allLegalMoves, 7 players cached", "moves.allLegalMoves()", names)
+
+def bench_advisor():
+	print("-- BidAdvisor")
+	if importlib.util.find_spec("numpy") is None:
+		print("numpy is not installed, skipped")
+		return
+	from ohhell.advisor import BidAdvisor
+	from ohhell.headless import newGame
+	gamestate = newGame(7)
+	Dealer(ShuffleEngine(1)).deal(gamestate, 7)
+	hand = gamestate.players[0].hand
+	advisor = BidAdvisor(samples=2000)
+	names = {"advisor": advisor, "hand": hand}
+	measure("7 cards, 7 players, 2000 deals", "advisor.clear(); advisor.distribution(hand, 3, 0, 7)", names, 10)
+	measure("7 cards, 7 players, cached", "advisor.distribution(hand, 3, 0, 7)", names, 10000)
+
+""" bench_solver()
+DoubleDummySolver over many seeded deals: the time of a solve depends a lot on the deal,
+	so the median and the worst deal are printed, in milliseconds, with the nodes
+	searched for the worst
+"""
+def bench_solver():
+	print("-- DoubleDummySolver")
+	from ohhell.solver import DoubleDummySolver
+	from ohhell.headless import newGame
+	deals = []
+	for seed in range(0, 40):
+		gamestate = newGame(4)
+		Dealer(ShuffleEngine(seed)).deal(gamestate, 7)
+		gamestate.setGameAttribute("leader", seed % 4)
+		deals.append(gamestate)
+	for label, target in (("one player", 0), ("every player", None)):
+		results = []
+		for gamestate in deals:
+			solver = DoubleDummySolver()
+			start = timeit.default_timer()
+			solver.solveGame(gamestate, target)
+			results.append(((timeit.default_timer() - start) * 1000, solver.nodes))
+		results.sort()
+		median = statistics.median(elapsed for elapsed, nodes in results)
+		worst, nodes = results[-1]
+		print("{:<40} {:>10.1f} ms  (median, worst {:.1f} ms with {} nodes)".format("7 cards, 4 players, " + label, median, worst, nodes))
+
+def bench_knowledge():
+	print("-- Knowledge")
+	from ohhell.game import Game
+	from ohhell.card import Card
+	from ohhell.knowledge import Knowledge
+	engines = ShuffleEngine(1).spawn(100)
+	start = timeit.default_timer()
+	for engine in engines:
+		game = Game("Oh Hell", 7, engine)
+		Knowledge.attachAll(game.gamestate)
+		game.play()
+	print("{:<40} {:>10.1f} us/game".format("full 7 player game, every player", (timeit.default_timer() - start) * 10000))
+	game = Game("Oh Hell", 7, ShuffleEngine(2))
+	game.dealer.deal(game.gamestate, 7)
+	knowledge = game.gamestate.players[0].knowledge
+	knowledge.attach(game.gamestate, 0)
+	names = {"knowledge": knowledge, "tracker": knowledge.tracker, "card": Card(9, 0)}
+	measure("observePlay", "tracker.observePlay(1, 7, -2)", names)
+	measure("mayHold", "knowledge.mayHold(1, card)", names)
+	measure("canBeat, 6 opponents", "knowledge.canBeat(card, 0)", names)
+
+""" importTime(module, pycache)
+Imports module in a fresh interpreter with -X importtime. Bytecode is cached under
+	pycache the way an installed package has it, so the budgets measure imports and not
+	compiling the source, even where PYTHONDONTWRITEBYTECODE is set
+@param pycache : String - directory for the cached bytecode, see bench_startup()
+@return : int - the cumulative import time of module in microseconds
+"""
+def importTime(module, pycache):
+	env = dict(os.environ)
+	env.pop("PYTHONDONTWRITEBYTECODE", None)
+	result = subprocess.run([sys.executable, "-X", "importtime", "-X", "pycache_prefix=" + pycache, "-c", "import " + module],
+		cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, env=env)
+	times = re.findall(r"import time:\s+\d+ \|\s+(\d+) \| (\S+)", result.stderr)
+	return max(int(total) for total, name in times if name == module)
+
+""" bench_startup()
+Import times of the engine and wall time of the headless entry point against the budgets
+	above. Prints OVER BUDGET and returns False when one is exceeded
+"""
+def bench_startup():
+	print("-- Startup")
+	import tempfile
+	pycache = tempfile.mkdtemp()
+	ok = True
+	for module, budget in IMPORT_BUDGETS.items():
+		result = min(importTime(module, pycache) for i in range(0, 5))
+		over = result > budget
+		ok = ok and not over
+		print("{:<40} {:>10} us  (budget {} us){}".format("import " + module, result, budget, "  OVER BUDGET" if over else ""))
+
+	best = None
+	for i in range(0, 5):
+		start = timeit.default_timer()
+		subprocess.run([sys.executable, "-m", "ohhell", "--quiet"], cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+		elapsed = (timeit.default_timer() - start) * 1000
+		best = elapsed if best is None else min(best, elapsed)
+	over = best > HEADLESS_BUDGET
+	print("{:<40} {:>10.1f} ms  (budget {} ms){}".format("python3 -m ohhell --quiet", best, HEADLESS_BUDGET, "  OVER BUDGET" if over else ""))
+	shutil.rmtree(pycache)
+	return ok and not over
+
+BENCHMARKS = [bench_card, bench_bitpile, bench_codec, bench_arraypile, bench_hand, bench_shuffle, bench_dealer, bench_actionlog, bench_fork, bench_hash, bench_journal, bench_render, bench_events, bench_rules, bench_moves, bench_advisor, bench_solver, bench_knowledge, bench_startup]
+
+""" main(argv)
+Runs every benchmark, or only the ones named on the command line (e.g. "startup")
+@return : int - exit code, 1 if a budget was exceeded
+"""
+def main(argv):
+	names = ["bench_" + name for name in argv]
+	ok = True
+	for bench in BENCHMARKS:
+		if not names or bench.__name__ in names:
+			ok = bench() is not False and ok
+	return 0 if ok else 1
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))
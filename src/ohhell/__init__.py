@@ -0,0 +1,61 @@
+"""=================================================================================
+ohhell Package
+================================================================================="""
+
+""" ohhell Package
+The card game engine. Importing the package does nothing but define this table; each
+	class is imported the first time it is used, so a worker that only needs a
+	Gamestate doesn't pay for the game loop, the simulation helpers or numpy.
+
+	from ohhell import Gamestate		# imports ohhell.gamestate on first use
+	from ohhell.card import Card		# plain module imports work as usual
+
+	The unit tests live in ohhell.tests and are never imported by the engine.
+
+@author Chris P.
+@created 2021-01-22 YMD
+"""
+
+# Public name -> module that defines it
+_EXPORTS = {
+	"Card"				: "card",
+	"Pile"				: "pile",
+	"BitPile"			: "bitpile",
+	"ArrayPile"			: "arraypile",
+	"SortedHand"		: "hand",
+	"Deck"				: "deck",
+	"DeckSimulation"	: "deck_simulation",
+	"Player"			: "player",
+	"Gamestate"			: "gamestate",
+	"ActionLog"			: "actionlog",
+	"FlatState"			: "flatstate",
+	"TranspositionTable"	: "transposition",
+	"JournalWriter"		: "journal",
+	"JournalReader"		: "journal",
+	"DeltaRenderer"		: "render",
+	"EventBus"			: "events",
+	"ShuffleEngine"		: "shuffle",
+	"Dealer"			: "dealer",
+	"OhHellRules"		: "rules",
+	"MoveGenerator"		: "moves",
+	"BidAdvisor"		: "advisor",
+	"DoubleDummySolver"	: "solver",
+	"Knowledge"			: "knowledge",
+	"Tournament"		: "tournament",
+	"Game"				: "game",
+	"ERROR"				: "error",
+}
+
+__all__ = list(_EXPORTS)
+
+""" __getattr__(name)
+Module level __getattr__ (PEP 562) - imports the module that defines name on first use
+"""
+def __getattr__(name):
+	module = _EXPORTS.get(name)
+	if module is None:
+		raise AttributeError("module 'ohhell' has no attribute '{}'".format(name))
+	from importlib import import_module
+	value = getattr(import_module("." + module, __name__), name)
+	globals()[name] = value
+	return value
@@ -0,0 +1,7 @@
+import sys
+
+# Local imports
+from .headless import main
+
+if __name__ == '__main__':
+	sys.exit(main())
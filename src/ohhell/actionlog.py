@@ -0,0 +1,201 @@
+from array import array
+
+# Action types, 4 bits
+MOVE = 0			# a card moved from src to dst
+ATTRIBUTE = 1		# a game attribute was set or removed, value = (key, prior value, new value)
+ATTRIBUTES = 2		# every game attribute was removed, value = the old attributes
+REMOVE_CARD = 3		# a card was taken out of the game from src
+REMOVE_PILE = 4		# the (emptied) pile at src was taken off the table, value = the Pile
+POINT = 5			# the player at src scored, ref = points
+TURN = 6			# a new turn started
+ROUND = 7			# a new round started
+
+# Record layout, lowest bits first
+#	type	4 bits
+#	linked	1 bit	- part of the same action as the record before it
+#	src		12 bits	- location code + CODE_OFFSET (see Gamestate)
+#	dst		12 bits	- location code + CODE_OFFSET
+#	card	6 bits	- card ID
+#	ref		29 bits	- a small value or the key of a value kept beside the log
+LINKED = 1 << 4
+SRC_SHIFT = 5
+DST_SHIFT = 17
+CARD_SHIFT = 29
+REF_SHIFT = 35
+CODE_MASK = (1 << 12) - 1
+CODE_OFFSET = 1 << 11
+CARD_MASK = (1 << 6) - 1
+REF_MASK = (1 << 29) - 1
+POINT_OFFSET = 1 << 28
+
+# Types whose ref is the key of a value kept beside the log
+VALUE_TYPES = frozenset((ATTRIBUTE, ATTRIBUTES, REMOVE_PILE))
+
+# Stands in for "no value" in ATTRIBUTE values, None is a valid attribute value
+MISSING = object()
+
+""" pack(type_, src, dst, card, ref, linked)
+Packs an action into one 64 bit record
+@param type_ : int - one of the action types above
+@param src : int - location code the action came from (-2048 to 2047)
+@param dst : int - location code the action went to (-2048 to 2047)
+@param card : int - card ID
+@param ref : int - 0 to REF_MASK
+@param linked : boolean - the record belongs to the same action as the one before it
+@return : int - the record
+"""
+def pack(type_, src=0, dst=0, card=0, ref=0, linked=False):
+	return (type_ | (LINKED if linked else 0)
+		| (((src + CODE_OFFSET) & CODE_MASK) << SRC_SHIFT)
+		| (((dst + CODE_OFFSET) & CODE_MASK) << DST_SHIFT)
+		| (card << CARD_SHIFT) | (ref << REF_SHIFT))
+
+""" unpack(record)
+@param record : int - a record made by pack()
+@return : (int, boolean, int, int, int, int) - (type_, linked, src, dst, card, ref)
+"""
+def unpack(record):
+	return (record & 15, bool(record & LINKED),
+		((record >> SRC_SHIFT) & CODE_MASK) - CODE_OFFSET,
+		((record >> DST_SHIFT) & CODE_MASK) - CODE_OFFSET,
+		(record >> CARD_SHIFT) & CARD_MASK,
+		record >> REF_SHIFT)
+
+"""=================================================================================
+ActionLog Class
+================================================================================="""
+
+""" ActionLog Class
+The history of a game as fixed width records, 8 bytes an action, in a typed array.
+	Appending and taking the last action back are both O(1). The few actions that
+	need a Python object to be undone (the prior value of a game attribute, a removed
+	pile) keep it in self.values under the record's ref.
+
+	With a capacity the log is a ring buffer: once full, every push forgets the oldest
+	action (its records and values), so a long running game uses a fixed amount of
+	memory. An action is forgotten whole because part of one can't be undone: the
+	records linked to a forgotten one go with it, and an action of more records than
+	the capacity isn't kept at all. The log never starts with a linked record.
+
+	log = ActionLog()
+	log.push(pack(MOVE, 0, 1, card.id))
+	type_, linked, src, dst, card_id, value = log.pop()
+
+@author Chris P.
+@created 2021-01-25 YMD
+"""
+class ActionLog():
+	"""__init__
+	@param capacity : int - the most records to keep. Default is None, no limit
+	"""
+	def __init__(self, capacity=None):
+		self.capacity = capacity
+		self.records = array('Q') if capacity is None else array('Q', bytes(8 * capacity))
+		self.start = 0 # Index of the oldest record, only moves in a ring buffer
+		self.length = 0
+		self.values = {}
+		self.next_ref = 0
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" push(record)
+	Appends a record made by pack()
+	@param record : int - the record
+	"""
+	def push(self, record):
+		if self.capacity is None:
+			self.records.append(record)
+			self.length += 1
+			return
+		if self.length == self.capacity:
+			self._dropOldest()
+			# The rest of the oldest action can't be undone without its first record
+			while self.length > 0 and self.records[self.start] & LINKED:
+				self._dropOldest()
+		if self.length == 0 and record & LINKED:
+			self._forget(record) # Nor can the rest of an action longer than the log
+			return
+		self.records[(self.start + self.length) % self.capacity] = record
+		self.length += 1
+
+	""" pushValue(record, value)
+	Appends a record of one of the VALUE_TYPES and keeps value beside it
+	@param record : int - the record, made by pack() with ref 0
+	@param value : Any - the value needed to undo the action
+	"""
+	def pushValue(self, record, value):
+		ref = self.next_ref
+		self.next_ref = (ref + 1) & REF_MASK
+		self.values[ref] = value
+		self.push(record | (ref << REF_SHIFT))
+
+	""" pop()
+	Takes the last record off the log
+	@return : (int, boolean, int, int, int, Any) - (type_, linked, src, dst, card, value).
+		value is the value kept beside the record for VALUE_TYPES, the ref otherwise.
+		None if the log is empty
+	"""
+	def pop(self):
+		if self.length == 0:
+			return None
+		self.length -= 1
+		if self.capacity is None:
+			record = self.records.pop()
+		else:
+			record = self.records[(self.start + self.length) % self.capacity]
+		type_, linked, src, dst, card, ref = unpack(record)
+		if type_ in VALUE_TYPES:
+			return (type_, linked, src, dst, card, self.values.pop(ref))
+		return (type_, linked, src, dst, card, ref)
+
+	""" clear()
+	Forgets every record
+	"""
+	def clear(self):
+		if self.capacity is None:
+			del self.records[:]
+		self.start = 0
+		self.length = 0
+		self.values.clear()
+
+	""" nbytes()
+	@return : int - bytes used by the records, not counting the values kept beside them
+	"""
+	def nbytes(self):
+		return self.records.itemsize * len(self.records)
+
+	# ------------------------------------------------------------------------------
+	# Private Methods
+
+	""" _dropOldest()
+	Forgets the oldest record of a ring buffer
+	"""
+	def _dropOldest(self):
+		self._forget(self.records[self.start])
+		self.start = (self.start + 1) % self.capacity
+		self.length -= 1
+
+	def _forget(self, record):
+		if record & 15 in VALUE_TYPES:
+			self.values.pop(record >> REF_SHIFT, None)
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __len__(self):
+		return self.length
+
+	""" __iter__()
+	Unpacked records, oldest first
+	"""
+	def __iter__(self):
+		if self.capacity is None:
+			return (unpack(record) for record in self.records)
+		return (unpack(self.records[(self.start + i) % self.capacity]) for i in range(self.length))
+
+	def __str__(self):
+		return "ActionLog of {} actions".format(self.length)
+
+	def __repr__(self):
+		return "ActionLog(capacity={}) with {} actions".format(self.capacity, self.length)
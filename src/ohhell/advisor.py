@@ -0,0 +1,258 @@
+from collections import OrderedDict
+
+# Local imports
+from .card import Card
+from .rules import RANKS, NO_TRUMP, GreedyStrategy
+from .bitpile import SUIT_MASKS
+from .shuffle import ShuffleEngine
+from .error import *
+
+""" canonicalHand(hand, trump, visible)
+Relabels the suits of a hand so hands that only differ by a swap of suits get the same
+	key. Suits other than trump play the same role, so they are sorted by the cards held
+	(and seen) in them. Trump, if there is one, becomes suit 0
+@param hand : [int] - card IDs of the hand
+@param trump : int - the trump suit, None if there is none
+@param visible : [int] - card IDs known to be in nobody's hand, eg. the trump card
+@return : (tuple, [int], [int], int) - (key, hand, visible, trump) after relabeling.
+	key holds trump is not None and a (held, seen) pair of 13 bit masks per suit
+"""
+def canonicalHand(hand, trump, visible=()):
+	pairs = [[0, 0] for suit in range(0, 4)]
+	for id_ in hand:
+		pairs[id_ // 13][0] |= 1 << (id_ % 13)
+	for id_ in visible:
+		pairs[id_ // 13][1] |= 1 << (id_ % 13)
+	pairs = [tuple(pair) for pair in pairs]
+	suits = [suit for suit in range(0, 4) if suit != trump]
+	suits.sort(key=lambda suit: pairs[suit], reverse=True)
+	order = suits if trump is None else [trump] + suits
+	new = [0] * 4
+	for i, suit in enumerate(order):
+		new[suit] = i
+	relabel = lambda id_: new[id_ // 13] * 13 + id_ % 13
+	key = (trump is not None, tuple(pairs[suit] for suit in order))
+	return (key, sorted(relabel(id_) for id_ in hand), sorted(relabel(id_) for id_ in visible), None if trump is None else 0)
+
+"""=================================================================================
+BidAdvisor Class
+================================================================================="""
+
+""" BidAdvisor Class
+Estimates how many tricks a hand will take by dealing the unseen cards to the other
+	players at random many times and playing every deal out. The deals are played out
+	all at once with numpy, hands as 52 bit masks, by a simple rule: the leader leads
+	their highest trump or else their highest card, and everyone else plays the highest
+	card of the suit led, else their highest trump. That is a rough stand-in for real
+	play, but it ranks hands and bids sensibly and one evaluation takes milliseconds.
+
+	Evaluations are cached in an LRU of cache_size entries under a canonical key (see
+	canonicalHand()), so a hand asked about again, or the same hand with its plain
+	suits swapped, is answered without sampling. The samples of a key are seeded from
+	the advisor's seed and the key, so an answer never depends on what was asked before.
+
+	advisor = BidAdvisor(samples=2000)
+	odds = advisor.distribution(player.hand, trump_suit, seat, 4)	# odds[t] of t tricks
+	bid = advisor.advise(player.hand, trump_suit, seat, 4, legal_bids)
+
+	seat counts from the player left of the dealer, who leads the first trick. Needs
+	numpy, and only works for hands of a single deck.
+
+@author Chris P.
+@created 2021-02-02 YMD
+"""
+class BidAdvisor():
+	"""__init__
+	@param samples : int - random deals per evaluation. Default is 2000
+	@param cache_size : int - the most evaluations to keep. Default is 4096
+	@param seed : int - the root seed of the samples. Default is 0
+	"""
+	def __init__(self, samples=2000, cache_size=4096, seed=0):
+		self.samples = samples
+		self.cache_size = cache_size
+		self.seed = seed
+		self.cache = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+		self._tables = None
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" distribution(hand, trump, seat, players, visible)
+	@param hand : Iterable - the Cards of the hand, eg. Player.hand
+	@param trump : int - the trump suit, None if there is none
+	@param seat : int - where the player sits, 0 for left of the dealer
+	@param players : int - players at the table
+	@param visible : Iterable - Cards in nobody's hand the player can see, eg. the trump
+		card. Default is none
+	@return : (float) - the odds of taking 0, 1, ... len(hand) tricks
+	@raise ValueError if the hand holds a card twice or the deck can't deal the others
+	"""
+	def distribution(self, hand, trump, seat, players, visible=()):
+		ids = [card.id for card in hand]
+		seen = [card.id for card in visible]
+		if len(set(ids)) != len(ids) or set(ids) & set(seen):
+			raise ValueError("BidAdvisor: the hand has to be from a single deck")
+		if len(ids) * players + len(seen) > 52:
+			raise ValueError("BidAdvisor: {} players can't all hold {} cards".format(players, len(ids)))
+		key, ids, seen, trump = canonicalHand(ids, trump, seen)
+		key = (players, seat % players) + key
+		odds = self.cache.get(key)
+		if odds is not None:
+			self.hits += 1
+			self.cache.move_to_end(key)
+			return odds
+		self.misses += 1
+		odds = self._sample(ids, seen, trump, seat % players, players, ShuffleEngine(self.seed, key))
+		self.cache[key] = odds
+		if len(self.cache) > self.cache_size:
+			self.cache.popitem(last=False)
+		return odds
+
+	""" expectedTricks(hand, trump, seat, players, visible)
+	@return : float - the average number of tricks the hand takes, see distribution()
+	"""
+	def expectedTricks(self, hand, trump, seat, players, visible=()):
+		return sum(tricks * odds for tricks, odds in enumerate(self.distribution(hand, trump, seat, players, visible)))
+
+	""" advise(hand, trump, seat, players, legal, visible)
+	The bid with the best expected score, 10 plus the bid times the odds of taking
+		exactly that many tricks
+	@param legal : [int] - the bids allowed, see ohhell.rules.legalBids(). Default is
+		every bid from 0 to len(hand)
+	@return : int - the bid
+	"""
+	def advise(self, hand, trump, seat, players, legal=None, visible=()):
+		odds = self.distribution(hand, trump, seat, players, visible)
+		if legal is None:
+			legal = range(0, len(odds))
+		return max(legal, key=lambda bid: (odds[bid] * (10 + bid) if bid < len(odds) else 0, -bid))
+
+	""" clear()
+	Empties the cache and resets the hit counters
+	"""
+	def clear(self):
+		self.cache.clear()
+		self.hits = 0
+		self.misses = 0
+
+	# ------------------------------------------------------------------------------
+	# Private Methods
+
+	""" _sample(hand, visible, trump, seat, players, engine)
+	Deals the unseen cards self.samples times and plays every deal out in step. Hands
+		are 52 bit masks, one per sample and seat
+	@return : (float) - the odds of every number of tricks for the player at seat
+	"""
+	def _sample(self, hand, visible, trump, seat, players, engine):
+		import numpy
+		ranks, suit_masks = self._numpyTables()
+		size = len(hand)
+		count = self.samples
+		known = set(hand) | set(visible)
+		unseen = numpy.array([id_ for id_ in range(0, 52) if id_ not in known], dtype=numpy.uint64)
+
+		# Deal: the first (players - 1) * size cards of a shuffle of the unseen cards
+		dealt = unseen[engine.permutations(count, len(unseen))[:, :(players - 1) * size]]
+		bits = numpy.left_shift(numpy.uint64(1), dealt)
+		hands = numpy.zeros((count, players), dtype=numpy.uint64)
+		hands[:, seat] = sum(1 << id_ for id_ in hand)
+		others = [p for p in range(0, players) if p != seat]
+		for j, p in enumerate(others):
+			hands[:, p] = bits[:, j * size:(j + 1) * size].sum(axis=1) # The cards are distinct, so + is |
+
+		# Play every trick of every deal at once
+		rank = ranks[:, NO_TRUMP if trump is None else trump, :] # [lead suit, card ID]
+		trumps = numpy.uint64(0) if trump is None else suit_masks[trump]
+		rows = numpy.arange(count)
+		leader = numpy.zeros(count, dtype=numpy.intp)
+		tricks = numpy.zeros(count, dtype=numpy.intp)
+		for trick in range(0, size):
+			best = numpy.full(count, -1)
+			winner = leader.copy()
+			for k in range(0, players):
+				current = (leader + k) % players
+				held = hands[rows, current]
+				own = held & trumps
+				if k == 0:
+					# Lead the highest trump, else the highest card of any suit
+					highest = numpy.stack([_highestBit(held & suit_masks[suit]) for suit in range(0, 4)])
+					values = numpy.where(highest >= 0, highest % 13, -1)
+					plain = highest[values.argmax(axis=0), rows]
+					choice = numpy.where(own != 0, _highestBit(own), plain)
+					lead = choice // 13
+				else:
+					# Follow with the highest card of the suit led, else the highest trump,
+					# else throw the highest card ID
+					follow = held & suit_masks[lead]
+					choice = numpy.where(follow != 0, _highestBit(follow), numpy.where(own != 0, _highestBit(own), _highestBit(held)))
+				hands[rows, current] = held & ~numpy.left_shift(numpy.uint64(1), choice.astype(numpy.uint64))
+				played = rank[lead, choice]
+				better = played > best
+				best = numpy.where(better, played, best)
+				winner = numpy.where(better, current, winner)
+			tricks += winner == seat
+			leader = winner
+		return tuple(float(odds) for odds in numpy.bincount(tricks, minlength=size + 1) / count)
+
+	""" _numpyTables()
+	RANKS of ohhell.rules as numpy arrays, built on first use
+	@return : (ranks, suit_masks) - ranks[lead, trump, card ID] and the 52 bit mask of
+		every suit
+	"""
+	def _numpyTables(self):
+		if self._tables is None:
+			import numpy
+			ranks = numpy.array([[list(table) for table in tables] for tables in RANKS], dtype=numpy.int64)
+			suit_masks = numpy.array(SUIT_MASKS, dtype=numpy.uint64)
+			self._tables = (ranks, suit_masks)
+		return self._tables
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __len__(self):
+		return len(self.cache)
+
+	def __str__(self):
+		return "BidAdvisor of {} samples, {} cached, {} hits, {} misses".format(self.samples, len(self.cache), self.hits, self.misses)
+
+	def __repr__(self):
+		return "BidAdvisor(samples={}, cache_size={}, seed={})".format(self.samples, self.cache_size, self.seed)
+
+""" _highestBit(masks)
+@param masks : numpy.ndarray of uint64 - masks below 2^52, which float64 holds exactly
+@return : numpy.ndarray - the index of the highest set bit of every mask, -1 for 0
+"""
+def _highestBit(masks):
+	import numpy
+	return numpy.frexp(masks.astype(numpy.float64))[1] - 1
+
+"""=================================================================================
+AdvisedStrategy Class
+================================================================================="""
+
+""" AdvisedStrategy Class
+GreedyStrategy with its bids made by a BidAdvisor, for OhHellRules
+
+@author Chris P.
+@created 2021-02-02 YMD
+"""
+class AdvisedStrategy(GreedyStrategy):
+	"""__init__
+	@param advisor : BidAdvisor - where the bids come from. Default is a new BidAdvisor
+	"""
+	def __init__(self, advisor=None):
+		self.advisor = advisor if advisor is not None else BidAdvisor()
+
+	def bid(self, rules, index, legal):
+		gamestate = rules.gamestate
+		count = len(gamestate.players)
+		seat = (index - gamestate.attributes.get("dealer", count - 1) - 1) % count
+		trump = gamestate.attributes.get("trump")
+		visible = () if trump is None else (trump,)
+		return self.advisor.advise(gamestate.players[index].hand, rules.trump, seat, count, legal, visible)
+
+	def __getstate__(self):
+		return {"advisor": BidAdvisor(self.advisor.samples, self.advisor.cache_size, self.advisor.seed)} # Don't ship the cache to workers
@@ -0,0 +1,243 @@
+import sys
+from array import array
+
+# Local imports
+from .card import Card, CARDS
+from .pile import Pile
+from .codec import toNames
+from .error import *
+
+# Globals
+MAX_SIZE = sys.maxsize
+
+"""=================================================================================
+ArrayPile Class
+================================================================================="""
+
+""" ArrayPile Class
+A pile of cards stored as card IDs in an array('B'), one byte per card. The top of the
+	pile (location 0 for Pile) is the END of the array, so push() and pop() are O(1)
+	instead of shifting every card like a list based Pile. Use it for decks and draw
+	piles. It has the same methods as Pile, iterates from the top down, and can hand
+	out read-only views of its IDs without copying them.
+
+	Note: an array can't grow or shrink while a view of it exists. Release views
+	(view.release() or a with block) before changing the pile.
+
+@author Chris P.
+@created 2021-01-14 YMD
+"""
+class ArrayPile(Pile):
+	"""__init__
+	Default Constructor - creates an empty pile object with the optional max_size parameter
+	@param max_size : INT coressponding to the maximum size of the pile
+	"""
+	def __init__(self, max_size=MAX_SIZE, enforce_order=False):
+		self.enforce_order = enforce_order
+		self.max_size = max_size
+		self.ids = array('B')
+		self.counts = [0] * 52
+		self.suit_counts = [0] * 4
+		self.version = 0 # See Pile.version
+
+	# ------------------------------------------------------------------------------
+	# Static Methods
+
+	""" fromList(lis)
+	"Overloaded" constructor - Creates a pile object containing cards with IDs corresponding to the ints in lis
+	@param lis : [int] - list of card IDs, lis[0] is the top of the pile
+	@return a corresponding ArrayPile object
+	"""
+	@classmethod
+	def fromList(cls, lis, max_size=MAX_SIZE):
+		output = cls(max_size)
+		ids = [Card.fromID(i).id for i in lis]
+		if len(ids) > max_size:
+			ERROR.write("Invalid Append: Inserting into pile would violate max_size.")
+			ids = ids[:max_size]
+		ids.reverse()
+		output.ids = array('B', ids)
+		for i in ids:
+			output.counts[i] += 1
+			output.suit_counts[i // 13] += 1
+		return output
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" insert(card, location)
+	Inserts a card at the given location, counted from the top. Default location is 0 (O(1))
+	@param card : Card - the card to insert into the pile
+	@param location : INT - the location in the pile to insert the card. Default is 0
+	@returns true if successful, false if failed
+	"""
+	def insert(self, card, location=0):
+		if len(self.ids) < self.max_size:
+			if location == 0:
+				self.ids.append(card.id)
+			else:
+				self.ids.insert(max(len(self.ids) - location, 0), card.id)
+			self.counts[card.id] += 1
+			self.suit_counts[card.suit] += 1
+			self.version += 1
+			return True
+		else:
+			ERROR.write("Invalid Insert: Inserting into pile would violate max_size.")
+			return False
+
+	""" remove(card)
+	Removes the top most copy of the card from the pile
+	@param card : Card that represents the card to remove
+	@raise ValueError if the card isn't in the pile, same as Pile.remove()
+	"""
+	def remove(self, card):
+		if self.counts[card.id] == 0:
+			raise ValueError("ArrayPile.remove(card): card not in pile")
+		del self.ids[self.ids.tobytes().rfind(bytes((card.id,)))]
+		self.counts[card.id] -= 1
+		self.suit_counts[card.suit] -= 1
+		self.version += 1
+
+	""" push(card)
+	Push a card to the top of the pile (O(1))
+	"""
+	def push(self, card):
+		return self.insert(card, 0)
+
+	""" pop()
+	Pop a card from the top of the pile (O(1))
+	@return Card that was at the top of the pile
+	"""
+	def pop(self):
+		card = CARDS[self.ids.pop()]
+		self.counts[card.id] -= 1
+		self.suit_counts[card.suit] -= 1
+		self.version += 1
+		return card
+
+	""" append(card)
+	Append a card to the bottom of the pile
+	"""
+	def append(self, card):
+		if len(self.ids) < self.max_size:
+			self.ids.insert(0, card.id)
+			self.counts[card.id] += 1
+			self.suit_counts[card.suit] += 1
+			self.version += 1
+			return True
+		else:
+			ERROR.write("Invalid Append: Inserting into pile would violate max_size.")
+			return False
+
+	""" draw(count)
+	Removes the top count cards in one go
+	@param count : int - how many cards to take, capped at the size of the pile
+	@return [Card] - the cards taken, top card first
+	"""
+	def draw(self, count):
+		count = min(count, len(self.ids))
+		if count <= 0:
+			return []
+		taken = [CARDS[i] for i in reversed(self.ids[-count:])]
+		del self.ids[-count:]
+		for card in taken:
+			self.counts[card.id] -= 1
+			self.suit_counts[card.suit] -= 1
+		self.version += 1
+		return taken
+
+	""" extend(cards)
+	Appends several cards to the bottom of the pile in one go, in order
+	@param cards : [Card] - the cards to append
+	@return : boolean - true if successful, false (and nothing added) if max_size would be violated
+	"""
+	def extend(self, cards):
+		if len(self.ids) + len(cards) > self.max_size:
+			ERROR.write("Invalid Extend: Inserting into pile would violate max_size.")
+			return False
+		self.ids[0:0] = array('B', [card.id for card in reversed(cards)])
+		for card in cards:
+			self.counts[card.id] += 1
+			self.suit_counts[card.suit] += 1
+		self.version += 1
+		return True
+
+	""" shuffle(engine)
+	Randomly orders the pile, shuffling the IDs in place
+	@param engine : ShuffleEngine - where the randomness comes from
+	"""
+	def shuffle(self, engine):
+		engine.shuffle(self.ids)
+		self.version += 1
+
+	""" sort()
+	Numerically sorts the pile (lowest card on top) if self.enforce_order == False
+	"""
+	def sort(self):
+		if self.enforce_order == False:
+			self.ids = array('B', sorted(self.ids, reverse=True))
+			self.version += 1
+		else:
+			ERROR.write("WARNING: Trying to sort pile with an enforced order. Not sorting.")
+
+	""" clear()
+	Removes all of contents from the pile
+	"""
+	def clear(self):
+		self.ids = array('B')
+		self.counts = [0] * 52
+		self.suit_counts = [0] * 4
+		self.version += 1
+
+	""" getSize()
+	Returns the number of cards in the pile
+	"""
+	def getSize(self):
+		return len(self.ids)
+
+	""" view(start, stop)
+	A read-only view of the card IDs, no copy made. The IDs are in storage order, so the
+		LAST ID of the view is the top card. start and stop index the storage like a
+		slice does. See the class note about releasing views.
+	@return memoryview of unsigned bytes
+	"""
+	def view(self, start=0, stop=None):
+		return memoryview(self.ids).toreadonly()[start:stop]
+
+	""" topView(count)
+	A read-only view of the IDs of the top count cards, top card last. See view()
+	"""
+	def topView(self, count):
+		count = min(count, len(self.ids))
+		return self.view(len(self.ids) - count)
+
+	""" cards
+	The cards of the pile as a new list, top card first. Changing the list doesn't change the pile
+	"""
+	@property
+	def cards(self):
+		return [CARDS[i] for i in reversed(self.ids)]
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __len__(self):
+		return len(self.ids)
+
+	def __str__(self):
+		return toNames(self)
+
+	""" __contains__(other)
+	Checks if other (a card Object...) is contained within the pile
+	@param other : Card - the card to check the presence of.
+	"""
+	def __contains__(self, other):
+		if other.__class__ is not Card:
+			return False
+		return self.counts[other.id] > 0
+
+	""" __iter__()
+	Iterates over the cards from the top down
+	"""
+	def __iter__(self):
+		return map(CARDS.__getitem__, reversed(self.ids))
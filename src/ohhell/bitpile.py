@@ -0,0 +1,287 @@
+import sys
+
+# Local imports
+from .card import Card, CARDS
+from .pile import Pile
+from .error import *
+
+# Globals
+MAX_SIZE = sys.maxsize
+
+# Bit i of a mask is set when the card with ID i is in the pile
+CARD_BITS = tuple(1 << i for i in range(0, 52))
+# Every card of suit s, in suit order [S,D,C,H]
+SUIT_MASKS = tuple(((1 << 13) - 1) << (13 * s) for s in range(0, 4))
+FULL_MASK = (1 << 52) - 1
+
+"""=================================================================================
+BitPile Class
+================================================================================="""
+
+""" BitPile Class
+A pile of cards stored as a single 52 bit integer. Since a single deck has at most one
+	copy of every card, a pile can be a set of card IDs, which makes membership, insert
+	and remove O(1) and union/intersection/difference a single int operation. Use it
+	for hands and trick piles of single deck games. It has the same methods as Pile,
+	but the cards are always in ID (sorted) order and duplicates are refused, so it
+	can't stand in for a multi deck Deck.
+
+@author Chris P.
+@created 2021-01-10 YMD
+"""
+class BitPile(Pile):
+	"""__init__
+	Default Constructor - creates an empty pile object with the optional max_size parameter
+	@param max_size : INT coressponding to the maximum size of the pile
+	@param enforce_order : boolean - accepted for Pile compatibility. A BitPile is always
+		kept in ID order
+	"""
+	def __init__(self, max_size=MAX_SIZE, enforce_order=False):
+		self.enforce_order = enforce_order
+		self.max_size = max_size
+		self.mask = 0
+		self.version = 0 # See Pile.version
+
+	# ------------------------------------------------------------------------------
+	# Static Methods
+
+	""" fromMask(mask)
+	"Overloaded" constructor - Creates a pile object from a bitmask of card IDs
+	@param mask : int - bit i set means card ID i is in the pile
+	@return a corresponding BitPile object
+	"""
+	@classmethod
+	def fromMask(cls, mask, max_size=MAX_SIZE):
+		output = cls(max_size)
+		output.mask = mask & FULL_MASK
+		return output
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" insert(card, location)
+	Adds a card to the pile. The location is ignored since the pile is kept in ID order
+	@param card : Card - the card to add
+	@param location : INT - unused, kept for Pile compatibility
+	@returns true if successful, false if the card is already there or max_size is hit
+	"""
+	def insert(self, card, location=0):
+		bit = CARD_BITS[card.id]
+		if self.mask & bit:
+			ERROR.write("Invalid Insert: {} is already in the pile.".format(card))
+			return False
+		if self.mask.bit_count() >= self.max_size:
+			ERROR.write("Invalid Insert: Inserting into pile would violate max_size.")
+			return False
+		self.mask |= bit
+		self.version += 1
+		return True
+
+	""" remove(card)
+	Removes a specified card from the pile
+	@param card : Card that represents the card to remove
+	@raise ValueError if the card isn't in the pile, same as Pile.remove()
+	"""
+	def remove(self, card):
+		bit = CARD_BITS[card.id]
+		if not self.mask & bit:
+			raise ValueError("BitPile.remove(card): card not in pile")
+		self.mask ^= bit
+		self.version += 1
+
+	""" push(card)
+	Adds a card to the pile. See BitPile.insert()
+	"""
+	def push(self, card):
+		return self.insert(card)
+
+	""" pop()
+	Pop the lowest card (the front of the pile in ID order)
+	@return Card that was at the front of the pile
+	@raise IndexError if the pile is empty
+	"""
+	def pop(self):
+		if self.mask == 0:
+			raise IndexError("pop from empty BitPile")
+		low = self.mask & -self.mask
+		self.mask ^= low
+		self.version += 1
+		return CARDS[low.bit_length() - 1]
+
+	""" append(card)
+	Adds a card to the pile. See BitPile.insert()
+	"""
+	def append(self, card):
+		return self.insert(card)
+
+	""" extend(cards)
+	Adds several cards at once
+	@param cards : [Card] - the cards to add
+	@return : boolean - true if successful, false (and nothing added) if a card is already
+		in the pile, repeated, or max_size would be violated
+	"""
+	def extend(self, cards):
+		mask = _maskOf(cards)
+		if mask & self.mask or mask.bit_count() != len(cards):
+			ERROR.write("Invalid Extend: a card is already in the pile.")
+			return False
+		if (self.mask | mask).bit_count() > self.max_size:
+			ERROR.write("Invalid Extend: Inserting into pile would violate max_size.")
+			return False
+		self.mask |= mask
+		self.version += 1
+		return True
+
+	""" draw(count)
+	Removes the count lowest cards in one go
+	@return [Card] - the cards taken, lowest first
+	"""
+	def draw(self, count):
+		taken = []
+		while self.mask and len(taken) < count:
+			taken.append(self.pop())
+		return taken
+
+	""" sort()
+	Nothing to do, a BitPile is always in ID order
+	"""
+	def sort(self):
+		pass
+
+	""" shuffle(engine)
+	Nothing to do, a BitPile has no order to shuffle
+	"""
+	def shuffle(self, engine):
+		pass
+
+	""" clear()
+	Removes all of contents from the pile
+	"""
+	def clear(self):
+		self.mask = 0
+		self.version += 1
+
+	""" getSize()
+	Returns the number of cards in the pile
+	"""
+	def getSize(self):
+		return self.mask.bit_count()
+
+	""" getMask()
+	Returns the bitmask of card IDs in the pile
+	"""
+	def getMask(self):
+		return self.mask
+
+	""" getSuit(suit)
+	Returns a new BitPile holding only the cards of the given suit
+	@param suit : int in range [0,3]
+	"""
+	def getSuit(self, suit):
+		return BitPile.fromMask(self.mask & SUIT_MASKS[suit])
+
+	""" count(card)
+	Returns how many copies of the card are in the pile, 0 or 1
+	"""
+	def count(self, card):
+		return (self.mask >> card.id) & 1
+
+	""" countSuit(suit)
+	Returns how many cards of the given suit are in the pile
+	@param suit : int in range [0,3]
+	"""
+	def countSuit(self, suit):
+		return (self.mask & SUIT_MASKS[suit]).bit_count()
+
+	""" cards
+	The cards of the pile as a new list in ID order. Changing the list doesn't change the pile
+	"""
+	@property
+	def cards(self):
+		return list(self)
+
+	# ------------------------------------------------------------------------------
+	# Set Methods
+
+	def union(self, other):
+		return BitPile.fromMask(self.mask | _maskOf(other))
+
+	def intersection(self, other):
+		return BitPile.fromMask(self.mask & _maskOf(other))
+
+	def difference(self, other):
+		return BitPile.fromMask(self.mask & ~_maskOf(other))
+
+	def __or__(self, other):
+		return self.union(other)
+
+	def __and__(self, other):
+		return self.intersection(other)
+
+	def __sub__(self, other):
+		return self.difference(other)
+
+	def __ior__(self, other):
+		mask = self.mask | _maskOf(other)
+		if mask.bit_count() > self.max_size:
+			# Same as a refused extend(), the pile is left as it was
+			ERROR.write("Invalid Union: Inserting into pile would violate max_size.")
+			return self
+		self.mask = mask
+		self.version += 1
+		return self
+
+	def __iand__(self, other):
+		self.mask &= _maskOf(other)
+		self.version += 1
+		return self
+
+	def __isub__(self, other):
+		self.mask &= ~_maskOf(other)
+		self.version += 1
+		return self
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __len__(self):
+		return self.mask.bit_count()
+
+	""" __contains__(other)
+	Checks if other (a card Object...) is contained within the pile
+	@param other : Card - the card to check the presence of.
+	"""
+	def __contains__(self, other):
+		if other.__class__ is not Card:
+			return False
+		return (self.mask >> other.id) & 1 == 1
+
+	""" __iter__()
+	Iterates over the cards in ID order
+	"""
+	def __iter__(self):
+		mask = self.mask
+		while mask:
+			low = mask & -mask
+			yield CARDS[low.bit_length() - 1]
+			mask ^= low
+
+	def __eq__(self, other):
+		if isinstance(other, BitPile):
+			return self.mask == other.mask
+		return NotImplemented
+
+	__hash__ = None
+
+
+
+""" _maskOf(other)
+Returns the bitmask of a BitPile, or builds one from any other iterable of cards
+"""
+def _maskOf(other):
+	if isinstance(other, BitPile):
+		return other.mask
+	mask = 0
+	for card in other:
+		mask |= CARD_BITS[card.id]
+	return mask
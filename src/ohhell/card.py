@@ -0,0 +1,150 @@
+import sys
+
+# Local imports
+from .error import *
+
+"""=================================================================================
+Card Class
+=================================================================================""" 
+
+""" Card Class
+"Immutable" class that represents a singular real world playing card
+
+@author Chris P.
+@created 2020-12-21 YMD
+"""
+class Card:
+	# Cards are flyweights: all 52 instances are built once below the class and every
+	# constructor call hands back the shared instance. The slots keep them small and
+	# the stored id makes hashing and comparisons a single int operation.
+	__slots__ = ("value", "suit", "id")
+
+	# Default Constructor - return the card for the given value and suit
+	# @param 	value 	: int in range [2,14] stores card value [2,3, ... ,10,J,Q,K,A]
+	# @param 	suit	: int in range [0,3] stores card suit [S,D,C,H]
+	def __new__(cls, value, suit):
+		# Out of bounds will set value to zero
+		if value < 2 or value > 14:
+			# revisit stderr write, conflicts with unit tests
+			ERROR.write("Invalid card value {}! Continuing with card value 0.\n".format(value))
+			value = 2
+		# Out of bounds will set suit to zero
+		if suit < 0 or suit > 3:
+			ERROR.write("Invalid card suit {}! Continuing with card suit 0.\n".format(suit))
+			suit = 0
+
+		return CARDS[(value - 2) + (suit * 13)]
+
+	# ------------------------------------------------------------------------------
+	# Static Methods
+
+	""" fromID(id_)
+	"Overloaded" constructor - get the card given an id in range [0,51]
+	@param	id 		: int in range [0,51] which is the unique card id
+	@return 	the corresponding (shared) Card object
+	"""
+	@classmethod
+	def fromID(cls, id_):
+		if 0 <= id_ <= 51:
+			return CARDS[id_]
+		# Out of bounds will set id_ to zero
+		ERROR.write("Invalid card ID {}! Continuing with card ID 0.\n".format(id_))
+		return CARDS[0]
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" getValue()
+	Gets the value of the card
+	@return int value of the card in range [2,14]
+	"""
+	def getValue(self):
+		return self.value
+
+	"""	getSuit()
+	Gets the suit of the card
+	@return int suit of the card in range [0,3]
+	"""
+	def getSuit(self):
+		return self.suit
+
+	"""	getID()
+	Gets the ID of the card
+	@return int ID of the card in range [0,51]
+	"""
+	def getID(self):
+		return self.id
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	""" __str__()
+	Override string - look up the name of the card in CARD_NAMES
+	@return 	string in format "{value} of {suit}"
+	"""
+	def __str__(self):
+		return CARD_NAMES[self.id]
+
+	""" __repr__()
+	Override representation - convert the value and suit to a string
+	@return 	string in format "{value} of {suit}"
+	"""
+	def __repr__(self):
+		return self.__str__()
+
+	""" __eq__(other)
+	Override equality - return true if the ID's of the cards are the same. NOT checking
+		if the objects are the same
+	@return true if self.id = other.id
+	"""
+	def __eq__(self, other):
+		if isinstance(other, Card):
+			return self.id == other.id
+		return NotImplemented
+
+	def __lt__(self, other):
+		if isinstance(other, Card):
+			return self.id < other.id
+		return NotImplemented
+
+	def __le__(self, other):
+		if isinstance(other, Card):
+			return self.id <= other.id
+		return NotImplemented
+
+	""" __hash__()
+	Override hash - cards hash to their ID so they can be used in sets and as dict keys
+	@return int ID of the card
+	"""
+	def __hash__(self):
+		return self.id
+
+	""" __reduce__()
+	Override pickling - unpickle (and copy) to the shared instance instead of a new object
+	"""
+	def __reduce__(self):
+		return (Card.fromID, (self.id,))
+
+
+
+# Name tables, indexed by suit and by value
+SUIT_NAMES = ("Spades", "Diamonds", "Clubs", "Hearts")
+VALUE_NAMES = (None, None, "2", "3", "4", "5", "6", "7", "8", "9", "10", "Jack", "Queen", "King", "Ace")
+# "{value} of {suit}" for every card ID
+CARD_NAMES = tuple("{} of {}".format(VALUE_NAMES[(i % 13) + 2], SUIT_NAMES[i // 13]) for i in range(0, 52))
+
+""" CARDS
+The 52 shared Card instances, indexed by card ID. Built once at import and returned by
+	Card() and Card.fromID()
+"""
+def _buildCards():
+	cards = []
+	for id_ in range(0, 52):
+		card = object.__new__(Card)
+		card.value = (id_ % 13) + 2
+		card.suit = id_ // 13
+		card.id = id_
+		cards.append(card)
+	return tuple(cards)
+
+CARDS = _buildCards()
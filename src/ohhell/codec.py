@@ -0,0 +1,111 @@
+from array import array
+
+# Local imports
+from .card import Card, CARDS, CARD_NAMES
+from .error import *
+
+# Globals
+SHORT_VALUES = "23456789TJQKA"
+SHORT_SUITS = "SDCH"
+# Two character name ("2S", "TD", "AH", ...) for every card ID
+SHORT_NAMES = tuple(SHORT_VALUES[i % 13] + SHORT_SUITS[i // 13] for i in range(0, 52))
+SHORT_TO_ID = {name: i for i, name in enumerate(SHORT_NAMES)}
+
+"""=================================================================================
+Card Codec
+================================================================================="""
+
+""" Card Codec
+Converts whole lists of cards at once between Card objects, card IDs (lists, bytes,
+	bytearray, array('B') or memoryview) and text. Every conversion is a table lookup
+	per card; no Card objects or format strings are built along the way.
+
+	IDs		: [47, 33]		 the card IDs, one per card
+	bytes	: bytes([47, 33]) one byte per card, the card ID
+	short	: "TH9C"		 two characters per card, value then suit [S,D,C,H]
+	names	: "[10 of Hearts, 9 of Clubs]" same text as str(Pile)
+
+@author Chris P.
+@created 2021-01-12 YMD
+"""
+
+# ------------------------------------------------------------------------------
+# Cards to IDs
+
+""" toIDs(cards)
+@param cards : [Card] - any iterable of cards
+@return [int] - the card IDs in the same order
+"""
+def toIDs(cards):
+	return [card.id for card in cards]
+
+""" toBytes(cards)
+@param cards : [Card] - any iterable of cards
+@return bytes - one byte per card holding the card ID
+"""
+def toBytes(cards):
+	return bytes([card.id for card in cards])
+
+""" toArray(cards)
+@param cards : [Card] - any iterable of cards
+@return array('B') - one unsigned byte per card holding the card ID
+"""
+def toArray(cards):
+	return array('B', [card.id for card in cards])
+
+# ------------------------------------------------------------------------------
+# IDs to Cards
+
+""" fromIDs(ids)
+Decodes card IDs back to Card objects. Accepts a list of ints or any bytes-like object
+	(bytes, bytearray, array('B'), memoryview). A memoryview is read in place, nothing
+	is copied before the lookup.
+@param ids : iterable of int in range [0,51]
+@return [Card] - the shared Card objects in the same order
+@raise ValueError if an ID is out of range
+"""
+def fromIDs(ids):
+	try:
+		return [CARDS[i if i >= 0 else 52] for i in ids] # 52 is out of range, so negative IDs fail too
+	except (IndexError, TypeError):
+		raise ValueError("Card IDs must be ints in range [0,51]")
+
+""" fromBytes(data)
+Same as fromIDs(data), named for readability when decoding a buffer
+"""
+def fromBytes(data):
+	return fromIDs(data)
+
+# ------------------------------------------------------------------------------
+# Text
+
+""" toShort(cards, sep)
+@param cards : [Card] - any iterable of cards
+@param sep : String - put between the cards. Default is no separator ("TH9C")
+@return String - two characters per card
+"""
+def toShort(cards, sep=""):
+	return sep.join([SHORT_NAMES[card.id] for card in cards])
+
+""" fromShort(text)
+Parses two character card names. Whitespace and commas between cards are ignored and
+	lowercase is accepted, so "TH 9C", "th,9c" and "TH9C" are all the same.
+@param text : String
+@return [Card]
+@raise ValueError if the text holds anything that isn't a card
+"""
+def fromShort(text):
+	text = "".join(text.upper().replace(",", "").split())
+	if len(text) % 2 != 0:
+		raise ValueError("Short card text must have two characters per card: {}".format(text))
+	try:
+		return [CARDS[SHORT_TO_ID[text[i:i+2]]] for i in range(0, len(text), 2)]
+	except KeyError as error:
+		raise ValueError("Not a card: {}".format(error.args[0]))
+
+""" toNames(cards)
+@param cards : [Card] - any iterable of cards
+@return String - "[9 of Clubs, 10 of Hearts]", the format used by str(Pile)
+"""
+def toNames(cards):
+	return "[" + ", ".join([CARD_NAMES[card.id] for card in cards]) + "]"
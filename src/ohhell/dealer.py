@@ -0,0 +1,74 @@
+# Local imports
+from .shuffle import ShuffleEngine
+from .error import *
+
+"""=================================================================================
+Dealer Class
+================================================================================="""
+
+""" Dealer Class
+Deals a whole round in one operation. The deck is shuffled, the cards for every hand
+	are taken off the top in one draw and each player gets one contiguous slice of
+	them (Gamestate.dealHands). On a shuffled deck that is the same as dealing one card at a time around the
+	table, without looking up the deck and the player for every card. The card left on
+	top of the deck is turned up for trump and recorded in Gamestate.attributes:
+
+	"hand_size"		: int - cards dealt to each player
+	"trump"			: Card - the turned up card, None if the deck ran out
+	"trump_suit"	: int - the suit of the trump card, None if there is no trump
+
+@author Chris P.
+@created 2021-01-20 YMD
+"""
+class Dealer():
+	"""__init__
+	@param engine : ShuffleEngine - where the shuffles come from. Pass a seeded engine to
+		make the deals reproducible. Default is an engine with a random seed
+	"""
+	def __init__(self, engine=None):
+		self.engine = engine if engine is not None else ShuffleEngine()
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" deal(gamestate, hand_size, shuffle)
+	Deals hand_size cards to every player of the game and turns up trump
+	Precondition the deck holds at least hand_size * len(gamestate.players) cards and
+		every player has room for hand_size more cards
+	Postcondition every player holds hand_size more cards, attributes hold the trump
+	@param gamestate : Gamestate - the game to deal
+	@param hand_size : int - how many cards each player gets
+	@param shuffle : boolean - shuffle the deck first. Default is True
+	@return : boolean - True if the round was dealt, False (and nothing changed) otherwise
+	"""
+	def deal(self, gamestate, hand_size, shuffle=True):
+		deck = gamestate.deck
+		players = gamestate.players
+		needed = hand_size * len(players)
+
+		# !! Check game validity
+		if hand_size < 0 or needed > len(deck):
+			ERROR.write("Invalid Deal: {} cards can't be dealt from a deck of {}.".format(needed, len(deck)))
+			return False
+		for player in players:
+			if len(player) + hand_size > player.max_size:
+				ERROR.write("Invalid Deal: {} can't hold {} more cards.".format(player, hand_size))
+				return False
+
+		# !! Make Change
+		if shuffle:
+			deck.shuffle(self.engine)
+		gamestate.dealHands(hand_size)
+		trump = next(iter(deck), None)
+		gamestate.setGameAttribute("hand_size", hand_size)
+		gamestate.setGameAttribute("trump", trump)
+		gamestate.setGameAttribute("trump_suit", None if trump is None else trump.getSuit())
+		return True
+
+	""" collect(gamestate)
+	Returns every card in the players' hands and the piles to the bottom of the deck
+	Postcondition all the cards of the game are in the deck
+	@param gamestate : Gamestate - the game to collect
+	"""
+	def collect(self, gamestate):
+		gamestate.resetCards()
@@ -1,9 +1,7 @@
 import sys
-import unittest
-from io import StringIO
 
 # Local imports
-from pile import Pile
+from .pile import Pile
 
 # Globals
 MAX_SIZE = sys.maxsize
@@ -0,0 +1,64 @@
+import sys
+
+# Local imports
+from .deck import Deck
+from .card import Card
+from .shuffle import ShuffleEngine
+
+# Globals
+MAX_SIZE = sys.maxsize
+ERROR = sys.stderr
+
+"""=================================================================================
+DeckSimulation Class
+=================================================================================""" 
+
+"""
+hi
+
+"""
+class DeckSimulation(Deck):
+
+	"""__init__
+	@param max_size : INT coressponding to the maximum size of the deck
+	@param engine : ShuffleEngine - where the shuffles come from. Pass a seeded engine to
+		make the deal reproducible. Default is an engine with a random seed
+	"""
+	def __init__(self, max_size=MAX_SIZE, engine=None):
+		super().__init__(max_size, False)
+		self.engine = engine if engine is not None else ShuffleEngine()
+
+	""" shuffle(engine)
+	Randomly orders the contents of self.hand
+	@param engine : ShuffleEngine - where the randomness comes from. Default is self.engine
+	"""
+	def shuffle(self, engine=None):
+		(engine if engine is not None else self.engine).shuffle(self.cards)
+		self.version += 1
+
+
+
+""" demo()
+Prints a small deck before and after sorting and shuffling
+"""
+def demo():
+	deck = DeckSimulation(52)
+	deck.push(Card.fromID(47))
+	deck.push(Card.fromID(33))
+	deck.push(Card(4,3))
+	deck.push(Card(12,1))
+
+	print(deck)
+
+	deck.sort()
+
+	print(deck)
+
+	deck.shuffle()
+
+	print(deck)
+
+
+
+if __name__ == '__main__':
+	demo()
@@ -13,7 +13,7 @@ class Error():
 
 
 
+ERROR = Error()
+
 if __name__ == '__main__':
-	print("Don't run this file from the command line.")
-else:
-	ERROR = Error()
\ No newline at end of file
+	print("Don't run this file from the command line.")
\ No newline at end of file
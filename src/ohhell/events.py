@@ -0,0 +1,163 @@
+from .actionlog import *
+
+# Event type beside the ActionLog types: an action was undone, value = the Event undone
+REVERT = 8
+
+"""=================================================================================
+Event Class
+================================================================================="""
+
+""" Event Class
+One change to a Gamestate, sent to the subscribers of its EventBus. The type is one of
+	the ActionLog types (MOVE, ATTRIBUTE, ...) or REVERT, and the fields are those of the
+	record in Gamestate.history:
+
+	MOVE		card moved from location code src to dst
+	ATTRIBUTE	value = (key, prior value, new value), MISSING for "not set"
+	ATTRIBUTES	every attribute was removed, value = the old attributes
+	REMOVE_CARD	card was taken out of the game
+	REMOVE_PILE	the pile at src was taken off the table
+	POINT		the player at src scored value points
+	TURN, ROUND	a new turn or round started
+	REVERT		value = the Event that was undone, in reverse order for a whole action
+
+	linked is True for every event of an action after its first one (dealHands,
+	moveCards, ...)
+
+@author Chris P.
+@created 2021-01-29 YMD
+"""
+class Event():
+	__slots__ = ("type_", "linked", "src", "dst", "card", "value")
+
+	def __init__(self, type_, linked=False, src=0, dst=0, card=0, value=0):
+		self.type_ = type_
+		self.linked = linked
+		self.src = src
+		self.dst = dst
+		self.card = card
+		self.value = value
+
+	""" fromRecord(record, value)
+	@param record : int - a record made by ohhell.actionlog.pack()
+	@param value : Any - the value kept beside the record for VALUE_TYPES
+	@return : Event - the event for the record
+	"""
+	@staticmethod
+	def fromRecord(record, value=None):
+		type_, linked, src, dst, card, ref = unpack(record)
+		if type_ == POINT:
+			value = ref - POINT_OFFSET
+		elif type_ not in VALUE_TYPES:
+			value = ref
+		return Event(type_, linked, src, dst, card, value)
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __eq__(self, other):
+		if not isinstance(other, Event):
+			return NotImplemented
+		return (self.type_, self.linked, self.src, self.dst, self.card, self.value) == (other.type_, other.linked, other.src, other.dst, other.card, other.value)
+
+	def __repr__(self):
+		return "Event({}, {}, {}, {}, {}, {!r})".format(self.type_, self.linked, self.src, self.dst, self.card, self.value)
+
+"""=================================================================================
+EventBus Class
+================================================================================="""
+
+""" EventBus Class
+Delivers the Events of a Gamestate to its subscribers. A Gamestate only has a bus
+	while something is subscribed (Gamestate.subscribe()), without one a change costs a
+	single None check.
+
+	A subscriber gets every event as it happens, or with batched=True a list of events
+	per action: the 52 moves of dealHands() arrive as one call instead of 52. An action
+	that changes one thing arrives as a list of one.
+
+	gamestate.subscribe(print)									# one Event a call
+	gamestate.subscribe(redraw, batched=True)					# [Event] an action
+	gamestate.subscribe(onMove, types=(MOVE,), batched=True)	# only the card moves
+
+@author Chris P.
+@created 2021-01-29 YMD
+"""
+class EventBus():
+	def __init__(self):
+		self.subscribers = [] # (callback, types) called with every event
+		self.batch_subscribers = [] # (callback, types) called with a list of events an action
+		self.depth = 0 # begin() calls not yet ended
+		self.pending = []
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" subscribe(callback, types, batched)
+	@param callback : function - called with an Event, or a list of Events if batched
+	@param types : Iterable - the event types to deliver. Default is None, all of them
+	@param batched : boolean - deliver a list of events per action. Default is False
+	"""
+	def subscribe(self, callback, types=None, batched=False):
+		entry = (callback, None if types is None else frozenset(types))
+		if batched:
+			self.batch_subscribers.append(entry)
+		else:
+			self.subscribers.append(entry)
+
+	""" unsubscribe(callback)
+	@param callback : function - a callback given to subscribe()
+	@return : boolean - True if the callback was subscribed, False otherwise
+	"""
+	def unsubscribe(self, callback):
+		count = len(self.subscribers) + len(self.batch_subscribers)
+		self.subscribers = [entry for entry in self.subscribers if entry[0] != callback]
+		self.batch_subscribers = [entry for entry in self.batch_subscribers if entry[0] != callback]
+		return len(self.subscribers) + len(self.batch_subscribers) < count
+
+	""" emit(event)
+	Sends an event to the subscribers, batched subscribers get it when the action ends
+	@param event : Event - the change
+	"""
+	def emit(self, event):
+		for callback, types in self.subscribers:
+			if types is None or event.type_ in types:
+				callback(event)
+		if self.batch_subscribers:
+			self.pending.append(event)
+			if self.depth == 0:
+				self._deliver()
+
+	""" begin()
+	Starts an action of several changes, batched subscribers get them all at end()
+	"""
+	def begin(self):
+		self.depth += 1
+
+	""" end()
+	Ends an action started with begin()
+	"""
+	def end(self):
+		self.depth -= 1
+		if self.depth == 0 and self.pending:
+			self._deliver()
+
+	# ------------------------------------------------------------------------------
+	# Private Methods
+
+	def _deliver(self):
+		events = self.pending
+		self.pending = []
+		for callback, types in self.batch_subscribers:
+			batch = events if types is None else [event for event in events if event.type_ in types]
+			if batch:
+				callback(batch)
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __len__(self):
+		return len(self.subscribers) + len(self.batch_subscribers)
+
+	def __repr__(self):
+		return "EventBus({} subscribers)".format(len(self))
@@ -0,0 +1,269 @@
+# Local imports
+from .zobrist import cardKey, turnKey, roundKey, attributeKey
+from .error import *
+
+# Location bytes. A player location code (1 to 127) is its own byte, a pile code
+# (-1 to -127) is stored as 256 + code, and NOWHERE marks a card slot with no card
+NOWHERE = 128
+MAX_PLAYERS = 127
+MAX_PILES = 127
+
+# Bits of FlatState.owned, set when the object is this state's own and not shared
+# with a parent or child
+_OWN_PILES = 1
+_OWN_ATTRIBUTES = 2
+
+"""=================================================================================
+FlatState Class
+================================================================================="""
+
+""" FlatState Class
+A compact copy of the part of a Gamestate that search needs: where every card is, the
+	cards of each pile in order, points, turns, rounds and game attributes. Made with
+	Gamestate.fork() and forked again as often as needed, each fork is independent of
+	the state it came from.
+
+	self.where holds one byte per card slot, slot card ID + 52 * copy, with the same
+	location codes as Gamestate (0 deck, i + 1 player i, -(j + 1) pile j), so a fork
+	copies 52 bytes per deck. The piles and attributes dicts are shared between a
+	state and its forks until one of them writes to its dict, which then copies it
+	first (copy-on-write). Piles hold tuples of card IDs, top card first, so sharing
+	them is safe.
+
+	self.hash is kept the same way as Gamestate.hash, so a FlatState and a Gamestate in
+	the same position have the same hash.
+
+	The order of the deck and max_size limits are not kept, only which cards are where.
+
+	root = gamestate.fork()
+	child = root.fork()
+	child.move(1, -1, card.id)			# player 0 plays onto pile 0, root is unchanged
+
+@author Chris P.
+@created 2021-01-26 YMD
+"""
+class FlatState():
+	__slots__ = ("where", "copies", "piles", "points", "attributes", "turns", "rounds", "owned", "hash")
+
+	"""__init__
+	@param copies : int - copies of each card the game may hold (decks)
+	@param players : int - number of players
+	"""
+	def __init__(self, copies=1, players=0):
+		if players > MAX_PLAYERS:
+			raise ValueError("FlatState: at most {} players".format(MAX_PLAYERS))
+		self.where = bytearray([NOWHERE]) * (52 * copies)
+		self.copies = copies
+		self.piles = {}
+		self.points = [0] * players
+		self.attributes = {}
+		self.turns = 0
+		self.rounds = 0
+		self.owned = _OWN_PILES | _OWN_ATTRIBUTES
+		self.hash = turnKey(0) ^ roundKey(0)
+
+	# ------------------------------------------------------------------------------
+	# Static Methods
+
+	""" fromGamestate(gamestate)
+	"Overloaded" constructor - flattens a Gamestate, see Gamestate.fork()
+	@param gamestate : Gamestate - the game to copy
+	@return : FlatState - the copy
+	@raise ValueError if the game has more than 127 players or a pile number over 126
+	"""
+	@classmethod
+	def fromGamestate(cls, gamestate):
+		copies = 1
+		for entry in gamestate.locations:
+			if entry.__class__ is dict:
+				copies = max(copies, sum(entry.values()))
+		output = cls(copies, len(gamestate.players))
+		for id_, entry in enumerate(gamestate.locations):
+			if entry is None:
+				continue
+			if entry.__class__ is int:
+				entry = {entry: 1}
+			slot = id_
+			for code, count in entry.items():
+				for i in range(0, count):
+					output.where[slot] = code & 0xFF
+					slot += 52
+		for j, pile in gamestate.piles.items():
+			if j >= MAX_PILES:
+				raise ValueError("FlatState: pile numbers must be under {}".format(MAX_PILES))
+			output.piles[j] = tuple(card.id for card in pile.cards)
+		output.points = [player.points for player in gamestate.players]
+		output.attributes = dict(gamestate.attributes)
+		output.turns = gamestate.turns
+		output.rounds = gamestate.rounds
+		output.hash = gamestate.hash
+		return output
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" fork()
+	@return : FlatState - an independent copy of this state, sharing the piles and
+		attributes until either side changes them
+	"""
+	def fork(self):
+		child = FlatState.__new__(FlatState)
+		child.where = self.where[:]
+		child.copies = self.copies
+		child.piles = self.piles
+		child.points = self.points[:]
+		child.attributes = self.attributes
+		child.turns = self.turns
+		child.rounds = self.rounds
+		child.owned = 0
+		child.hash = self.hash
+		self.owned = 0
+		return child
+
+	""" move(src, dst, card_id)
+	Moves one copy of a card between two locations
+	@param src : int - location code the card is in
+	@param dst : int - location code to move it to
+	@param card_id : int - the card ID
+	@return : boolean - True if the card moved, False if src doesn't hold the card or dst
+		isn't a valid location
+	@raise ValueError if dst is the code of a player the game doesn't have
+	"""
+	def move(self, src, dst, card_id):
+		if dst > len(self.points):
+			raise ValueError("FlatState: no player {} in a game of {} players".format(dst - 1, len(self.points)))
+		if dst < -MAX_PILES:
+			return False
+		where = self.where
+		src_byte = src & 0xFF
+		dst_byte = dst & 0xFF
+		if self.copies == 1:
+			slot = card_id
+			if where[slot] != src_byte:
+				return False
+			self.hash ^= cardKey(card_id, src, 0) ^ cardKey(card_id, dst, 0)
+		else:
+			slot = -1
+			held = landed = 0
+			for i in range(card_id, len(where), 52):
+				if where[i] == src_byte:
+					slot = i
+					held += 1
+				elif where[i] == dst_byte:
+					landed += 1
+			if slot < 0:
+				return False
+			if src == dst:
+				landed = held - 1
+			self.hash ^= cardKey(card_id, src, held - 1) ^ cardKey(card_id, dst, landed)
+
+		if src < 0 or dst < 0:
+			piles = self._ownPiles()
+			if src < 0:
+				cards = piles[-src - 1]
+				i = cards.index(card_id)
+				piles[-src - 1] = cards[:i] + cards[i + 1:]
+			if dst < 0:
+				piles[-dst - 1] = (card_id,) + piles.get(-dst - 1, ())
+		where[slot] = dst_byte
+		return True
+
+	""" hand(player)
+	@param player : int - the index of the player
+	@return : [int] - the IDs of the cards the player holds, lowest first
+	"""
+	def hand(self, player):
+		return self.cardsAt(player + 1)
+
+	""" handMask(player)
+	@param player : int - the index of the player
+	@return : int - bitmask of the cards the player holds, bit card ID
+	"""
+	def handMask(self, player):
+		code = player + 1
+		mask = 0
+		for slot, byte in enumerate(self.where):
+			if byte == code:
+				mask |= 1 << (slot % 52)
+		return mask
+
+	""" cardsAt(code)
+	@param code : int - a location code
+	@return : [int] - the IDs of the cards at that location, lowest first
+	"""
+	def cardsAt(self, code):
+		byte = code & 0xFF
+		return sorted(slot % 52 for slot, value in enumerate(self.where) if value == byte)
+
+	""" pile(number)
+	@param number : int - the pile number
+	@return : (int) - the IDs of the cards on the pile, top card first. () if no such pile
+	"""
+	def pile(self, number):
+		return self.piles.get(number, ())
+
+	""" whereIs(card_id)
+	@param card_id : int - the card ID
+	@return : [int] - the location code of every copy of the card in the game
+	"""
+	def whereIs(self, card_id):
+		return [_code(byte) for byte in self.where[card_id::52] if byte != NOWHERE]
+
+	def getAttribute(self, key, default=None):
+		return self.attributes.get(key, default)
+
+	def setAttribute(self, key, value):
+		new = attributeKey(key, value) # Raises for values that aren't immutable
+		if not self.owned & _OWN_ATTRIBUTES:
+			self.attributes = dict(self.attributes)
+			self.owned |= _OWN_ATTRIBUTES
+		if key in self.attributes:
+			self.hash ^= attributeKey(key, self.attributes[key])
+		self.attributes[key] = value
+		self.hash ^= new
+
+	def getPoints(self, player):
+		return self.points[player]
+
+	def addPoint(self, player, points=1):
+		self.points[player] += points
+
+	def newTurn(self):
+		self.hash ^= turnKey(self.turns) ^ turnKey(self.turns + 1)
+		self.turns += 1
+		return self.turns
+
+	def newRound(self):
+		self.hash ^= roundKey(self.rounds) ^ roundKey(self.rounds + 1)
+		self.rounds += 1
+		return self.rounds
+
+	# ------------------------------------------------------------------------------
+	# Private Methods
+
+	def _ownPiles(self):
+		if not self.owned & _OWN_PILES:
+			self.piles = dict(self.piles)
+			self.owned |= _OWN_PILES
+		return self.piles
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __eq__(self, other):
+		if other.__class__ is not FlatState:
+			return NotImplemented
+		return (self.where == other.where and self.piles == other.piles and self.points == other.points
+			and self.attributes == other.attributes and self.turns == other.turns and self.rounds == other.rounds)
+
+	def __str__(self):
+		return "FlatState: {} players, {} piles, {} turns, {} rounds".format(len(self.points), len(self.piles), self.turns, self.rounds)
+
+	def __repr__(self):
+		return "FlatState({} copies, {} players)".format(self.copies, len(self.points))
+
+""" _code(byte)
+Turns a location byte back into a location code
+"""
+def _code(byte):
+	return byte - 256 if byte > NOWHERE else byte
@@ -0,0 +1,173 @@
+import sys
+import time
+import math
+
+# Local imports
+from .card import Card
+from .pile import Pile
+from .deck import Deck
+from .player import Player
+from .gamestate import Gamestate
+from .render import DeltaRenderer
+from .dealer import Dealer
+from .shuffle import ShuffleEngine
+from .rules import OhHellRules
+
+# Globals
+MAX_SIZE = sys.maxsize
+regular_deck = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51]
+
+
+"""=================================================================================
+Game Class
+================================================================================="""
+
+""" Game Class
+Sets up a game of the given type. Without players the setup is interactive: the
+	player count and names are read with input() and play() prints the game. With
+	players nothing is read or printed, so games can be built and played from scripts
+	and simulations (see src/simulate.py). Oh Hell is played by OhHellRules, every
+	player with its GreedyStrategy. Other games have no rules yet and can't be played:
+
+	game = Game("Oh Hell", players=4, seed=42)
+	game.play()
+
+@author Chris P.
+@created 2020-12-26 YMD
+"""
+class Game():
+	"""__init__
+	@param game_name : String - the type of game, eg. "Oh Hell"
+	@param players : int or [String] - the number of players, or their names in seating
+		order. Default is None, ask for them with input()
+	@param seed : int or ShuffleEngine - where the shuffles come from. Default is None, a
+		random seed
+	@param num_decks : int - how many decks are stacked together. Default is None, the
+		usual number for the game
+	@param strategies : strategy or [strategy] - how the players bid and play, see
+		OhHellRules. Default is None, GreedyStrategy for everybody
+	@raise ValueError if the game can't be played by that many players
+	"""
+	def __init__(self, game_name, players=None, seed=None, num_decks=None, strategies=None):
+		self.game_name = game_name
+
+		# Set the parameters for each game type
+		if self.game_name == "Oh Hell":
+			self.min_players = 3
+			self.max_players = 7
+			self.num_decks = 1
+			self.valid_cards = regular_deck
+
+		elif self.game_name == "Rummy":
+			self.min_players = 2
+			self.max_players = 7
+			self.num_decks = 1
+			self.valid_cards = regular_deck
+
+		else:
+			# Set default of game parameters
+			self.min_players = 4
+			self.max_players = 4
+			self.num_decks = 1
+			self.valid_cards = regular_deck
+
+		if num_decks is not None:
+			self.num_decks = num_decks
+		self.engine = seed if isinstance(seed, ShuffleEngine) else ShuffleEngine(seed)
+		self.dealer = Dealer(self.engine)
+		self.interactive = players is None
+
+		if self.interactive:
+			players = self._askPlayers()
+		else:
+			names = ["Player {}".format(i + 1) for i in range(0, players)] if isinstance(players, int) else list(players)
+			if len(names) < self.min_players or len(names) > self.max_players:
+				raise ValueError("Game: {} can't be played by {} players".format(self.game_name, len(names)))
+			self.num_players = len(names)
+			players = [Player(name, "P{}".format(i + 1)) for i, name in enumerate(names)]
+
+		# Build the deck of cards
+		deck = Deck(self.num_decks * len(self.valid_cards), enforce_order=False)
+		for i in range(0, self.num_decks):
+			deck.extend([Card.fromID(j) for j in self.valid_cards])
+
+		# Create the gamestate object, likely will switch to using a factory
+		# since some games will need special gamestate attributes like current suit in Oh Hell
+		self.gamestate = Gamestate(deck, players)
+		self.rules = OhHellRules(self.gamestate, self.dealer, strategies) if self.game_name == "Oh Hell" else None
+
+		self.renderer = DeltaRenderer(self.gamestate) if self.interactive else None
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" roundSizes()
+	@return : [int] - the hand size of every round: one card, up to as many as the deck
+		allows with a card left for trump, and back down to one
+	"""
+	def roundSizes(self):
+		most = (self.num_decks * len(self.valid_cards) - 1) // self.num_players
+		return list(range(1, most + 1)) + list(range(most - 1, 0, -1))
+
+	""" playRound(hand_size)
+	Deals a round and plays it out with OhHellRules, the deal passing to the left every
+		round. Only Oh Hell has rules so far, other games aren't played
+	@param hand_size : int - cards dealt to each player
+	@return : boolean - True if the round was played, False if it couldn't be dealt or
+		the game has no rules
+	"""
+	def playRound(self, hand_size):
+		if self.rules is None:
+			return False
+		return self.rules.playRound(hand_size, self.gamestate.rounds % self.num_players)
+
+	""" play()
+	Plays every round of the game, see roundSizes(). An interactive game prints the table
+		first, the scores after every round and the final scores at the end
+	@return : Gamestate - the game once it is over, None if the game has no rules
+	"""
+	def play(self):
+		if self.interactive:
+			print(self.renderer.full())
+		if self.rules is None:
+			if self.interactive:
+				print("Actions not implemented yet. Ending game.")
+			return None
+		for hand_size in self.roundSizes():
+			self.playRound(hand_size)
+			if self.interactive:
+				print(self.rules)
+		if self.interactive:
+			players = self.gamestate.players
+			print("Final scores: " + ", ".join("{} {}".format(player, player.getPoints()) for player in players))
+		return self.gamestate
+
+	# ------------------------------------------------------------------------------
+	# Private Methods
+
+	""" _askPlayers()
+	Asks for the number of players and their names with input()
+	@return : [Player] - the players in seating order
+	"""
+	def _askPlayers(self):
+		# Get Number of Players
+		print("Starting game: {}".format(self.game_name))
+		num_players = int(input("How many players are playing? "))
+		while(num_players < self.min_players or num_players > self.max_players):
+			num_players = int(input("{} isn't a valid number of players, please enter a new amount: ".format(num_players)))
+		self.num_players = num_players
+
+		# Enter the player names in order
+		players = []
+		for i in range(0, self.num_players):
+			name = input("Enter the name of player {}: ".format(i+1))
+			date = math.floor(time.time())
+			id_ = name + "-" + str(date)
+			players.append(Player(name, id_))
+		return players
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __repr__(self):
+		return "Game({!r}, players={}, seed={})".format(self.game_name, self.num_players, self.engine.seed)
@@ -0,0 +1,854 @@
+import sys
+
+# Local imports
+from .card import Card
+from .pile import Pile
+from .player import Player
+from .actionlog import *
+from .flatstate import FlatState
+from .zobrist import cardKey, turnKey, roundKey, attributeKey
+from .events import Event, EventBus, REVERT
+from .error import *
+
+# Globals
+MAX_SIZE = sys.maxsize
+MAX_PILES = 2048 # Pile numbers have to fit in an ActionLog record
+
+# Kinds of location a card can be in, returned by Gamestate.whereIs()
+DECK = "deck"
+PLAYER = "player"
+PILE = "pile"
+
+# Line keys of Gamestate.lineOrder() that aren't location codes
+SUMMARY = "summary"
+ATTRIBUTE_LINE = "attribute"
+
+"""=================================================================================
+PileTable Class
+================================================================================="""
+
+""" PileTable Class
+The piles on the table, pile number -> Pile. Pile numbers don't have to be contiguous
+	and looking up a pile that doesn't exist gives None rather than a KeyError. Piles
+	are created by the moves that put cards on them.
+
+@author Chris P.
+@created 2021-01-24 YMD
+"""
+class PileTable(dict):
+	def __missing__(self, key):
+		return None
+
+"""=================================================================================
+Gamestate Class
+================================================================================="""
+
+""" Gamestate Class
+The definitive source of truth for a given game. Stores all the information related
+	to the game being played like players and what cards are where. It also stores
+	the history of actions taken to get to that point in time.
+
+	Card index: self.locations[card ID] says where the copies of a card are, so "where
+	is this card" never scans the hands and piles. Locations are stored as int codes,
+	0 for the deck, i + 1 for player i and -(j + 1) for pile j. An entry is None when
+	the game has no copy of the card, a code when it has exactly one copy, and a
+	{code: copies} dict once a card has been in more than one place at a time (multi
+	deck games). The index only follows changes made through Gamestate methods.
+
+	Hash: self.hash is a 64 bit Zobrist hash (see ohhell.zobrist) of where every card
+	is, the turn and round counters and the game attributes. Every change made through
+	Gamestate methods, undo included, updates it with a couple of XORs, so it can key
+	a TranspositionTable. The order of the cards within a pile isn't part of it.
+
+	History: every change made through Gamestate methods is recorded in self.history,
+	an ActionLog of 8 byte records, and revertLastAction() undoes the last one. A card
+	moved back goes on top of the container it came from, so a deck keeps its order
+	when whole deals are undone, but not when a card from the middle is put back.
+
+	Events: subscribe() a callback to be told about every change as an Event (see
+	ohhell.events), one at a time or a list per action. Without subscribers
+	self.events is None and nothing is built.
+
+@author Chris P.
+@created 2020-12-26 YMD
+"""
+class Gamestate():
+
+	""" __init__
+	Default constructor - creates a gamestate object with given deck and player array. 
+		Also create the empty table of piles. 
+	@param deck : Deck - the full deck of cards to start the game with.
+	@param players[] : Array of Player objects. These are the players in the current game
+	@param history : ActionLog - where to record the actions, eg. ActionLog(capacity) to
+		keep only the latest ones. Default is a new ActionLog with no limit
+	"""
+	def __init__(self, deck, players, history=None):
+		self.deck = deck
+		self.players = players
+		self.piles = PileTable()
+		self.history = history if history is not None else ActionLog()
+		self.turns = 0
+		self.rounds = 0
+		self.attributes = {} # A dictionary of attributes unique to each game eg. which suit is trump
+		self.player_index = {player.getID(): i for i, player in enumerate(players)}
+		self.locations = [None] * 52
+		self.hash = 0
+		self.dirty = None # Set of changed location codes once trackChanges() is called
+		self.dirty_attributes = None
+		self.events = None # EventBus while something is subscribed
+		self._buildIndex()
+
+	# ------------------------------------------------------------------------------
+	# Gamestate - ActionFactory interactions
+
+	""" revertLastAction()
+	Undoes the last action in self.history. An action that changed several cards at once
+		(moveCards, dealHands, removePile, resetCards) is undone as a whole
+	@return : boolean - True if an action was undone, False if the history is empty
+	"""
+	def revertLastAction(self):
+		if len(self.history) == 0:
+			return False
+		events = self.events
+		if events is not None:
+			events.begin()
+		try:
+			while len(self.history) > 0:
+				type_, linked, src, dst, card_id, value = self.history.pop()
+				self._revert(type_, src, dst, card_id, value)
+				if events is not None:
+					undone = Event(type_, linked, src, dst, card_id, value - POINT_OFFSET if type_ == POINT else value)
+					events.emit(Event(REVERT, linked, src, dst, card_id, undone))
+				if not linked:
+					break
+		finally:
+			if events is not None:
+				events.end()
+		return True
+
+	""" storeAction(record)
+	Appends a record to self.history
+	@param record : int - a record made by ohhell.actionlog.pack()
+	"""
+	def storeAction(self, record):
+		self.history.push(record)
+		if self.events is not None:
+			self.events.emit(Event.fromRecord(record))
+
+	""" subscribe(callback, types, batched)
+	Calls callback with every change to the game from now on, see EventBus
+	@param callback : function - called with an Event, or a list of Events if batched
+	@param types : Iterable - the event types to deliver. Default is None, all of them
+	@param batched : boolean - one call with a list of events per action. Default is False
+	"""
+	def subscribe(self, callback, types=None, batched=False):
+		if self.events is None:
+			self.events = EventBus()
+		self.events.subscribe(callback, types, batched)
+
+	""" unsubscribe(callback)
+	@param callback : function - a callback given to subscribe()
+	@return : boolean - True if the callback was subscribed, False otherwise
+	"""
+	def unsubscribe(self, callback):
+		if self.events is None or not self.events.unsubscribe(callback):
+			return False
+		if len(self.events) == 0 and self.events.depth == 0:
+			self.events = None
+		return True
+
+	def getPlayers(self):
+		return self.players
+
+	""" getPlayer(id_)
+	@param id_ : String - the ID of the player
+	@return : Player - the player with that ID, None if there isn't one (O(1))
+	"""
+	def getPlayer(self, id_):
+		index = self.player_index.get(id_)
+		return None if index is None else self.players[index]
+
+	""" getPileNumbers()
+	@return : [int] - the numbers of the piles on the table, lowest first
+	"""
+	def getPileNumbers(self):
+		return sorted(self.piles)
+
+	# ------------------------------------------------------------------------------
+	# Gamestate - Action interactions
+
+	""" setGameAttribute(key, value)
+	Adds or edits a key/value pair in the self.attributes dictionary. If the key exists
+		it updates the pair with the new value.
+	Postcondition self.attributes.get(key) == value
+	@param key : String - the key to search for in the dictionary
+	@param value : Any - the value to associate with key in the dictionary
+	@return : Any - returns None if new entry, previous value if key already existed
+	"""
+	def setGameAttribute(self, key, value):
+		# !! Check game validity
+		# In this case there is nothing to check
+
+		# !! Make Change
+		old = self.attributes.get(key, MISSING)
+		self._putAttribute(key, value)
+		self._storeValue(pack(ATTRIBUTE), (key, old, value))
+		return None if old is MISSING else old
+
+	""" removeGameAttribute(key)
+	Removes a key value pair from self.attributes. Returns the value of the removed pair.
+		Returns nothing if the key didn't exist
+	Postcondition self.attributes.get(key) == None
+	@param key : String - the key of the pair to remove from the dictionary
+	@return : Any - Returns the associated value of the removed key or None if
+		key didn't exist
+	"""
+	def removeGameAttribute(self, key):
+		# !! Check game validity
+		# In this case there is nothing to check
+
+		# !! Make Change
+		if self.attributes.get(key) == None:
+			return None
+		else:
+			old = self._dropAttribute(key)
+			self._storeValue(pack(ATTRIBUTE), (key, old, MISSING))
+			return old
+
+	""" _storeValue(record, value)
+	Appends a record of one of the VALUE_TYPES to self.history, see storeAction(). Called
+		after the change is made, so subscribers see the game as it is now
+	"""
+	def _storeValue(self, record, value):
+		self.history.pushValue(record, value)
+		if self.events is not None:
+			self.events.emit(Event.fromRecord(record, value))
+
+	""" _putAttribute(key, value)
+	Sets an attribute and updates self.hash
+	@raise TypeError if the value isn't immutable, see ohhell.zobrist.attributeKey()
+	"""
+	def _putAttribute(self, key, value):
+		new = attributeKey(key, value) # Before anything changes, it raises for a list
+		old = self.attributes.get(key, MISSING)
+		if old is not MISSING:
+			self.hash ^= attributeKey(key, old)
+		self.attributes[key] = value
+		self.hash ^= new
+		if self.dirty is not None:
+			self.dirty_attributes.add(key)
+
+	""" _dropAttribute(key)
+	Removes an attribute and updates self.hash
+	@return : Any - the value of the attribute
+	"""
+	def _dropAttribute(self, key):
+		value = self.attributes.pop(key)
+		self.hash ^= attributeKey(key, value)
+		if self.dirty is not None:
+			self.dirty_attributes.add(key)
+		return value
+
+	# ------------------------------------------------------------------------------
+	# Gamestate - Card moves
+	#
+	# Every move goes through one path: each end of the move is turned into a location
+	# code (see the class docstring) by the locator for its kind, _checkMove() checks
+	# it and _applyMove() carries it out and updates the card index. Finding a player
+	# or a pile is a dict lookup, so a move costs the same however many players and
+	# piles the game has.
+
+	"""	deckToPlayer(card, player)
+	Deal a card from the deck to the player. Will return false if the deck doesn't contain
+		the card
+	Precondition (card in self.deck) and (player in self.players)
+	Postcondition (card not in self.deck) and (card in player)
+	@param card : Card - the card to move from the deck to the player hand
+	@param player : Player - the player who should recieve the card
+	@return : boolean - True is the operation is successful, False is the card isn't in
+		the deck, the player doesn't exist or the player's hand is full
+	"""
+	def deckToPlayer(self, card, player):
+		return self._move(0, self._playerCode(player), card)
+
+	"""	playerToDeck(player, card)
+	A player puts a card back on top of the deck
+	Precondition (card in player) and (player in self.players)
+	Postcondition one copy of card moved from the player to the deck
+	@param player : Player - the player giving up the card
+	@param card : Card - the card to move
+	@return : boolean - True if the card moved, False if the player doesn't exist or
+		doesn't hold the card, or the deck is full
+	"""
+	def playerToDeck(self, player, card):
+		return self._move(self._playerCode(player), 0, card)
+
+	"""	playerToPile(player, pile, card)
+	A player plays a card onto a pile. The pile is created if it doesn't exist yet
+	Precondition (card in player) and (player in self.players)
+	Postcondition one copy of card moved from the player to self.piles[pile]
+	@param player : Player - the player playing the card
+	@param pile : int - the number of the pile, 0 or more
+	@param card : Card - the card to play
+	@return : boolean - True if the card moved, False if the player doesn't exist or
+		doesn't hold the card, the pile number is invalid or the pile is full
+	"""
+	def playerToPile(self, player, pile, card):
+		return self._move(self._playerCode(player), _pileCode(pile), card)
+
+	"""	pileToPlayer(pile, player, card)
+	A player picks a card up from a pile
+	Precondition (card in self.piles[pile]) and (player in self.players)
+	Postcondition one copy of card moved from the pile to the player
+	@param pile : int - the number of the pile
+	@param player : Player - the player picking up the card
+	@param card : Card - the card to pick up
+	@return : boolean - True if the card moved, False if the pile or player doesn't
+		exist, the pile doesn't hold the card or the player's hand is full
+	"""
+	def pileToPlayer(self, pile, player, card):
+		return self._move(_pileCode(pile), self._playerCode(player), card)
+
+	"""	deckToPile(pile, card)
+	Moves a card from the deck onto a pile, eg. turning up trump. The pile is created if
+		it doesn't exist yet
+	@param pile : int - the number of the pile, 0 or more
+	@param card : Card - the card to move
+	@return : boolean - True if the card moved, False if the deck doesn't hold the card,
+		the pile number is invalid or the pile is full
+	"""
+	def deckToPile(self, pile, card):
+		return self._move(0, _pileCode(pile), card)
+
+	"""	pileToDeck(pile, card)
+	Moves a card from a pile back on top of the deck
+	@param pile : int - the number of the pile
+	@param card : Card - the card to move
+	@return : boolean - True if the card moved, False if the pile doesn't exist or doesn't
+		hold the card, or the deck is full
+	"""
+	def pileToDeck(self, pile, card):
+		return self._move(_pileCode(pile), 0, card)
+
+	""" moveCards(moves)
+	Moves a batch of cards in one go. Every move is checked before any card moves, so
+		either the whole batch happens or nothing changes. Moves are checked in order,
+		so a card may be moved into a container and out again later in the same batch.
+	Precondition every source holds the card and every destination has room, counting
+		the moves before it in the batch
+	@param moves : [(source, destination, card)] - source and destination are self.deck,
+		a Player in self.players or an int pile number. card is a Card
+	@return : boolean - True if every card moved, False (and nothing moved) otherwise
+	"""
+	def moveCards(self, moves):
+		plan = []
+		changes = {} # (location code, card ID) -> copies added/removed so far in the batch
+		sizes = {} # location code -> cards added/removed so far in the batch
+
+		# !! Check game validity
+		for source, destination, card in moves:
+			move = self._checkMove(self._code(source), self._code(destination), card, changes, sizes)
+			if move is None:
+				return False
+			plan.append(move)
+
+		# !! Make Change
+		events = self.events
+		if events is not None:
+			events.begin()
+		try:
+			for i, move in enumerate(plan):
+				self._applyMove(*move, i > 0)
+		finally:
+			if events is not None:
+				events.end()
+		return True
+
+	""" removeCard(card)
+	Takes one copy of a card out of the deck and out of the game, eg. the 2s in a game
+		with too many players for the deck
+	@param card : Card - the card to take out
+	@return : boolean - True if a copy was removed, False if the deck doesn't hold the card
+	"""
+	def removeCard(self, card):
+		# !! Check game validity
+		if card not in self.deck:
+			return False
+
+		# !! Make Change
+		self.deck.remove(card)
+		self._indexRemove(card.id, 0)
+		self.storeAction(pack(REMOVE_CARD, 0, 0, card.id))
+		return True
+
+	""" removePile(pile)
+	Removes a pile from the table. Its cards go to the bottom of the deck
+	Postcondition self.piles[pile] == None
+	@param pile : int - the number of the pile
+	@return : boolean - True if the pile was removed, False if it doesn't exist or the
+		deck has no room for its cards
+	"""
+	def removePile(self, pile):
+		# !! Check game validity
+		cards = self.piles.get(pile)
+		if cards is None or len(self.deck) + len(cards) > self.deck.max_size:
+			return False
+
+		# !! Make Change
+		events = self.events
+		if events is not None:
+			events.begin()
+		try:
+			self._clearPile(pile, False)
+		finally:
+			if events is not None:
+				events.end()
+		return True
+
+	""" _move(src_code, dst_code, card)
+	Checks and carries out a single move
+	@return : boolean - True if the card moved, False (and nothing changed) otherwise
+	"""
+	def _move(self, src_code, dst_code, card):
+		# !! Check game validity
+		move = self._checkMove(src_code, dst_code, card, {}, {})
+		if move is None:
+			return False
+
+		# !! Make Change
+		self._applyMove(*move)
+		return True
+
+	""" _checkMove(src_code, dst_code, card, changes, sizes)
+	Checks that a move is legal. Destination piles that don't exist yet count as empty
+		piles with no max_size, they are only created when the move is carried out
+	@param changes : {(code, card ID): int} - copies moved in/out earlier in the batch
+	@param sizes : {code: int} - cards moved in/out earlier in the batch
+	@return : tuple - the arguments for _applyMove(), None if the move is illegal
+	"""
+	def _checkMove(self, src_code, dst_code, card, changes, sizes):
+		if src_code is None or dst_code is None or card.__class__ is not Card:
+			return None
+		src = self._pileAt(src_code)
+		dst = self._pileAt(dst_code)
+		if src is None or (dst is None and dst_code >= 0):
+			return None
+
+		key = (src_code, card.id)
+		change = changes.get(key, 0)
+		if src.count(card) + change < 1:
+			return None
+
+		size = sizes.get(dst_code, 0)
+		if dst is not None and len(dst) + size + 1 > self._limit(dst_code, dst):
+			return None
+
+		changes[key] = change - 1
+		sizes[src_code] = sizes.get(src_code, 0) - 1
+		sizes[dst_code] = size + 1
+		key = (dst_code, card.id)
+		changes[key] = changes.get(key, 0) + 1
+		return (src, dst, card, src_code, dst_code)
+
+	""" _applyMove(src, dst, card, src_code, dst_code)
+	Carries out a move checked by _checkMove(), creating the destination pile if needed
+	"""
+	def _applyMove(self, src, dst, card, src_code, dst_code, linked=False):
+		created = 0
+		if dst is None:
+			dst = self.piles.get(-dst_code - 1)
+			if dst is None:
+				dst = self.piles[-dst_code - 1] = Pile()
+				created = 1
+		src.remove(card)
+		dst.push(card)
+		self._indexMove(card.id, src_code, dst_code)
+		self.storeAction(pack(MOVE, src_code, dst_code, card.id, created, linked))
+
+	""" _clearPile(pile, linked)
+	Moves the cards of a pile to the bottom of the deck and takes the pile off the table
+	@raise ValueError if the deck has no room for the cards, nothing is changed then
+	"""
+	def _clearPile(self, pile, linked):
+		cards = self.piles[pile]
+		if not self.deck.extend(cards.cards):
+			raise ValueError("Gamestate: the deck has no room for the {} cards of pile {}".format(len(cards), pile))
+		del self.piles[pile]
+		code = _pileCode(pile)
+		for card in cards:
+			self._indexMove(card.id, code, 0)
+			self.storeAction(pack(MOVE, code, 0, card.id, 0, linked))
+			linked = True
+		cards.clear()
+		self._storeValue(pack(REMOVE_PILE, code, 0, 0, 0, linked), cards)
+		if self.dirty is not None:
+			self.dirty.add(code)
+
+	""" _revert(type_, src, dst, card_id, value)
+	Undoes one record of self.history, see ohhell.actionlog for what each type holds
+	"""
+	def _revert(self, type_, src, dst, card_id, value):
+		if type_ == MOVE:
+			card = Card.fromID(card_id)
+			self._pileAt(dst).remove(card)
+			if value:
+				del self.piles[-dst - 1]
+			pile = self._pileAt(src)
+			if pile is None:
+				pile = self.piles[-src - 1] = Pile()
+			pile.push(card)
+			self._indexMove(card_id, dst, src)
+		elif type_ == ATTRIBUTE:
+			key, old, new = value
+			if old is not MISSING:
+				self._putAttribute(key, old)
+			elif key in self.attributes:
+				self._dropAttribute(key)
+		elif type_ == ATTRIBUTES:
+			for key, old in value.items():
+				self._putAttribute(key, old)
+		elif type_ == REMOVE_CARD:
+			self.deck.push(Card.fromID(card_id))
+			self._indexAdd(card_id, 0)
+		elif type_ == REMOVE_PILE:
+			self.piles[-src - 1] = value
+			if self.dirty is not None:
+				self.dirty.add(src)
+		elif type_ == POINT:
+			self.players[src - 1].points -= value - POINT_OFFSET
+		elif type_ == TURN:
+			self.hash ^= turnKey(self.turns) ^ turnKey(self.turns - 1)
+			self.turns -= 1
+		elif type_ == ROUND:
+			self.hash ^= roundKey(self.rounds) ^ roundKey(self.rounds - 1)
+			self.rounds -= 1
+
+	""" _pileAt(code)
+	@param code : int - a location code
+	@return : Pile - the cards at that location, None if there is no such pile
+	"""
+	def _pileAt(self, code):
+		if code > 0:
+			return self.players[code - 1].hand
+		if code == 0:
+			return self.deck
+		return self.piles.get(-code - 1)
+
+	""" _limit(code, pile)
+	@return : int - the most cards the pile at that location may hold
+	"""
+	def _limit(self, code, pile):
+		if code > 0:
+			return min(self.players[code - 1].max_size, pile.max_size)
+		return pile.max_size
+
+	""" _playerCode(player)
+	@return : int - the location code of the player, None if not in the game
+	"""
+	def _playerCode(self, player):
+		index = self.playerIndex(player)
+		return None if index is None else index + 1
+
+	""" _code(where)
+	Location code for the ends of a moveCards() move
+	@param where : self.deck, a Player or an int pile number
+	@return : int - the location code, None if where isn't part of the game
+	"""
+	def _code(self, where):
+		if where is self.deck:
+			return 0
+		if isinstance(where, Player):
+			return self._playerCode(where)
+		return _pileCode(where)
+
+	# ------------------------------------------------------------------------------
+	# Gamestate - Round interactions
+
+	""" dealHands(hand_size)
+	Deals hand_size cards off the top of the deck to every player. Each player gets the
+		next hand_size cards as one block, see Dealer for shuffling and trump
+	Precondition the deck holds hand_size * len(self.players) cards and every player has
+		room for them
+	@param hand_size : int - how many cards each player gets
+	@return : boolean - True if the cards were dealt, False (and nothing dealt) otherwise
+	"""
+	def dealHands(self, hand_size):
+		# !! Check game validity
+		if hand_size < 0 or hand_size * len(self.players) > len(self.deck):
+			return False
+		for player in self.players:
+			if len(player) + hand_size > player.max_size:
+				return False
+
+		# !! Make Change
+		events = self.events
+		if events is not None:
+			events.begin()
+		try:
+			cards = self.deck.draw(hand_size * len(self.players))
+			linked = False
+			for i, player in enumerate(self.players):
+				hand = cards[i * hand_size:(i + 1) * hand_size]
+				player.hand.extend(hand)
+				for card in hand:
+					self._indexMove(card.id, 0, i + 1)
+					self.storeAction(pack(MOVE, 0, i + 1, card.id, 0, linked))
+					linked = True
+		finally:
+			if events is not None:
+				events.end()
+		return True
+
+	""" resetCards()
+	Returns every card in the players' hands and the piles to the bottom of the deck
+	Postcondition all the cards of the game are in the deck
+	@raise ValueError if the deck has no room for the cards, nothing is changed then
+	"""
+	def resetCards(self):
+		# !! Check game validity
+		count = sum(len(player.hand) for player in self.players) + sum(len(pile) for pile in self.piles.values())
+		if len(self.deck) + count > self.deck.max_size:
+			raise ValueError("Gamestate: the deck has no room for the {} cards out of it".format(count))
+
+		# !! Make Change
+		events = self.events
+		if events is not None:
+			events.begin()
+		try:
+			linked = False
+			for i, player in enumerate(self.players):
+				cards = list(player.hand.cards)
+				if not self.deck.extend(cards):
+					raise ValueError("Gamestate: the deck has no room for the cards of player {}".format(i))
+				player.hand.clear()
+				for card in cards:
+					self._indexMove(card.id, i + 1, 0)
+					self.storeAction(pack(MOVE, i + 1, 0, card.id, 0, linked))
+					linked = True
+			for pile in sorted(self.piles):
+				self._clearPile(pile, linked)
+				linked = True
+		finally:
+			if events is not None:
+				events.end()
+
+	""" newTurn()
+	@return : int - the number of turns played, counting the new one
+	"""
+	def newTurn(self):
+		self.hash ^= turnKey(self.turns) ^ turnKey(self.turns + 1)
+		self.turns += 1
+		self.storeAction(pack(TURN))
+		return self.turns
+
+	""" newRound()
+	@return : int - the number of rounds played, counting the new one
+	"""
+	def newRound(self):
+		self.hash ^= roundKey(self.rounds) ^ roundKey(self.rounds + 1)
+		self.rounds += 1
+		self.storeAction(pack(ROUND))
+		return self.rounds
+
+	""" addPoint(player, points)
+	A player earns points
+	@param player : Player - the player who scored
+	@param points : int - how many points, within +-2^28. Default is 1
+	@return : boolean - True if the points were added, False if the player doesn't exist
+		or points is out of range
+	"""
+	def addPoint(self, player, points=1):
+		# !! Check game validity
+		index = self.playerIndex(player)
+		if index is None or not 0 <= points + POINT_OFFSET <= REF_MASK:
+			return False
+
+		# !! Make Change
+		self.players[index].points += points
+		self.storeAction(pack(POINT, index + 1, 0, 0, points + POINT_OFFSET))
+		return True
+
+	""" resetAttributes()
+	Removes every game attribute
+	Postcondition self.attributes == {}
+	"""
+	def resetAttributes(self):
+		old = dict(self.attributes)
+		for key in old:
+			self._dropAttribute(key)
+		self._storeValue(pack(ATTRIBUTES), old)
+
+	""" fork()
+	A compact copy of the game for lookahead search, see FlatState. Fork the copy again
+		(FlatState.fork()) for every line of play, that costs a few hundred bytes
+	@return : FlatState - the copy, changes to it don't touch this Gamestate
+	"""
+	def fork(self):
+		return FlatState.fromGamestate(self)
+
+	# ------------------------------------------------------------------------------
+	# Gamestate - Card index
+
+	""" whereIs(card)
+	Where the copies of a card are (O(1), no scan)
+	@param card : Card - the card to look for
+	@return : [(kind, index, copies)] - kind is DECK, PLAYER or PILE, index is the
+		player or pile index (0 for the deck). Empty if the card isn't in the game
+	"""
+	def whereIs(self, card):
+		entry = self.locations[card.id]
+		if entry is None:
+			return []
+		if entry.__class__ is int:
+			return [_decode(entry) + (1,)]
+		return [_decode(code) + (copies,) for code, copies in entry.items()]
+
+	""" playerIndex(player)
+	@param player : Player - the player to look for, matched by ID
+	@return : int - the index of the player in self.players, None if not in the game (O(1))
+	"""
+	def playerIndex(self, player):
+		if not isinstance(player, Player):
+			return None
+		return self.player_index.get(player.getID())
+
+	""" _buildIndex()
+	Rebuilds self.locations and self.hash from the deck, the hands, the piles, the
+		counters and the attributes
+	"""
+	def _buildIndex(self):
+		self.locations = [None] * 52
+		self.hash = turnKey(self.turns) ^ roundKey(self.rounds)
+		for key, value in self.attributes.items():
+			self.hash ^= attributeKey(key, value)
+		for card in self.deck:
+			self._indexAdd(card.id, 0)
+		for i, player in enumerate(self.players):
+			for card in player:
+				self._indexAdd(card.id, i + 1)
+		for j, pile in self.piles.items():
+			for card in pile:
+				self._indexAdd(card.id, -(j + 1))
+
+	def _indexAdd(self, id_, code):
+		if self.dirty is not None:
+			self.dirty.add(code)
+		entry = self.locations[id_]
+		if entry is None:
+			self.locations[id_] = code
+			self.hash ^= cardKey(id_, code, 0)
+		else:
+			if entry.__class__ is int:
+				entry = self.locations[id_] = {entry: 1}
+			copies = entry.get(code, 0)
+			entry[code] = copies + 1
+			self.hash ^= cardKey(id_, code, copies)
+
+	def _indexRemove(self, id_, code):
+		if self.dirty is not None:
+			self.dirty.add(code)
+		entry = self.locations[id_]
+		if entry.__class__ is int:
+			if entry == code:
+				self.locations[id_] = None
+				self.hash ^= cardKey(id_, code, 0)
+		elif entry is not None:
+			copies = entry.get(code, 0)
+			if copies > 1:
+				entry[code] = copies - 1
+			elif copies == 1:
+				del entry[code]
+			if copies > 0:
+				self.hash ^= cardKey(id_, code, copies - 1)
+
+	def _indexMove(self, id_, src_code, dst_code):
+		self._indexRemove(id_, src_code)
+		self._indexAdd(id_, dst_code)
+
+	# ------------------------------------------------------------------------------
+	# Gamestate - Display
+
+	""" trackChanges()
+	Starts recording which locations and attributes change in self.dirty and
+		self.dirty_attributes, for DeltaRenderer. Until it is called nothing is recorded
+	"""
+	def trackChanges(self):
+		if self.dirty is None:
+			self.dirty = set()
+			self.dirty_attributes = set()
+
+	""" summaryLine()
+	@return : String - the first line of str(self)
+	"""
+	def summaryLine(self):
+		return "Summary: {} actions. {} turns. {} rounds.".format(len(self.history), self.turns, self.rounds)
+
+	""" attributeLine(key)
+	@return : String - the line of str(self) for the attribute, None if it isn't set
+	"""
+	def attributeLine(self, key):
+		if key not in self.attributes:
+			return None
+		return "{}: {}".format(key, str(self.attributes[key]))
+
+	""" locationLine(code)
+	@param code : int - a location code
+	@return : String - the line of str(self) for the deck, a player or a pile. None for a
+		pile that isn't on the table
+	"""
+	def locationLine(self, code):
+		if code > 0:
+			player = self.players[code - 1]
+			return "Player {} has {} cards: {}".format(player.getName(), player.getHandSize(), player.hand_tostr())
+		if code == 0:
+			return "{} cards in deck: {}".format(len(self.deck), str(self.deck))
+		pile = self.piles.get(-code - 1)
+		if pile is None:
+			return None
+		return "Pile {} has {} cards: {}".format(-code - 1, len(pile), str(pile))
+
+	""" lineOrder()
+	@return : [key] - the keys of the lines of str(self) in order, see DeltaRenderer
+	"""
+	def lineOrder(self):
+		keys = [SUMMARY]
+		keys.extend((ATTRIBUTE_LINE, key) for key in self.attributes)
+		keys.extend(-(j + 1) for j in sorted(self.piles))
+		keys.extend(range(1, len(self.players) + 1))
+		keys.append(0)
+		return keys
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __str__(self):
+		lines = [self.summaryLine()]
+		for key in self.attributes:
+			lines.append(self.attributeLine(key))
+		for j in sorted(self.piles):
+			lines.append(self.locationLine(-(j + 1)))
+		for i in range(0, len(self.players)):
+			lines.append(self.locationLine(i + 1))
+		lines.append(self.locationLine(0))
+		lines.append("")
+		return "\n".join(lines)
+
+
+
+""" _decode(code)
+Turns a location code back into (kind, index)
+"""
+def _decode(code):
+	if code == 0:
+		return (DECK, 0)
+	if code > 0:
+		return (PLAYER, code - 1)
+	return (PILE, -code - 1)
+
+""" _pileCode(pile)
+The location code of a pile number, None if it isn't a valid pile number
+"""
+def _pileCode(pile):
+	if pile.__class__ is int and 0 <= pile < MAX_PILES:
+		return -(pile + 1)
+	return None
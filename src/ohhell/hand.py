@@ -0,0 +1,192 @@
+import sys
+from bisect import bisect_left, bisect_right
+
+# Local imports
+from .card import Card
+from .pile import Pile
+from .error import *
+
+# Globals
+MAX_SIZE = sys.maxsize
+
+"""=================================================================================
+SortedHand Class
+================================================================================="""
+
+""" SortedHand Class
+A pile that is always in ID order, used for a player's hand. Cards are inserted by
+	binary search instead of pushing and re-sorting the whole hand, and since the cards
+	of a suit have consecutive IDs, every suit is one contiguous run of the hand.
+	self.bounds keeps where each run starts, so the cards of a suit and its highest or
+	lowest card are found without looking at the other suits.
+
+	Suit s is self.cards[self.bounds[s]:self.bounds[s+1]]
+
+@author Chris P.
+@created 2021-01-16 YMD
+"""
+class SortedHand(Pile):
+	"""__init__
+	Default Constructor - creates an empty hand with the optional max_size parameter
+	@param max_size : INT coressponding to the maximum size of the hand
+	@param enforce_order : boolean - accepted for Pile compatibility. A SortedHand is
+		always kept in ID order
+	"""
+	def __init__(self, max_size=MAX_SIZE, enforce_order=False):
+		super().__init__(max_size, enforce_order)
+		self.ids = [] # card IDs of self.cards, searched with bisect
+		self.bounds = [0, 0, 0, 0, 0]
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" insert(card, location)
+	Inserts a card at its sorted place. The location is ignored
+	@param card : Card - the card to insert into the hand
+	@param location : INT - unused, kept for Pile compatibility
+	@returns true if successful, false if max_size would be violated
+	"""
+	def insert(self, card, location=0):
+		if len(self.ids) >= self.max_size:
+			ERROR.write("Invalid Insert: Inserting into pile would violate max_size.")
+			return False
+		id_ = card.id
+		index = bisect_right(self.ids, id_)
+		self.ids.insert(index, id_)
+		self.cards.insert(index, card)
+		self.counts[id_] += 1
+		self.suit_counts[card.suit] += 1
+		bounds = self.bounds
+		for s in range(card.suit + 1, 5):
+			bounds[s] += 1
+		self.version += 1
+		return True
+
+	""" remove(card)
+	Removes one copy of the card from the hand
+	@param card : Card that represents the card to remove
+	@raise ValueError if the card isn't in the hand
+	"""
+	def remove(self, card):
+		if self.counts[card.id] == 0:
+			raise ValueError("SortedHand.remove(card): card not in hand")
+		self._removeAt(bisect_left(self.ids, card.id))
+
+	""" push(card)
+	Inserts a card at its sorted place. See SortedHand.insert()
+	"""
+	def push(self, card):
+		return self.insert(card)
+
+	""" append(card)
+	Inserts a card at its sorted place. See SortedHand.insert()
+	"""
+	def append(self, card):
+		return self.insert(card)
+
+	""" extend(cards)
+	Adds several cards at once with one sort instead of one binary search per card
+	@param cards : [Card] - the cards to add
+	@return : boolean - true if successful, false (and nothing added) if max_size would be violated
+	"""
+	def extend(self, cards):
+		if len(self.ids) + len(cards) > self.max_size:
+			ERROR.write("Invalid Extend: Inserting into pile would violate max_size.")
+			return False
+		self.cards.extend(cards)
+		self.cards.sort()
+		self.ids = [card.id for card in self.cards]
+		for card in cards:
+			self.counts[card.id] += 1
+			self.suit_counts[card.suit] += 1
+		bounds = self.bounds
+		for s in range(0, 4):
+			bounds[s + 1] = bounds[s] + self.suit_counts[s]
+		self.version += 1
+		return True
+
+	""" pop()
+	Pop the lowest card from the hand
+	@return Card that was at the front of the hand
+	"""
+	def pop(self):
+		if len(self.ids) == 0:
+			raise IndexError("pop from empty SortedHand")
+		return self._removeAt(0)
+
+	""" sort()
+	Nothing to do, a SortedHand is always in ID order
+	"""
+	def sort(self):
+		pass
+
+	""" clear()
+	Removes all of contents from the hand
+	"""
+	def clear(self):
+		super().clear()
+		self.ids.clear()
+		self.bounds = [0, 0, 0, 0, 0]
+
+	""" suitRange(suit)
+	Where the cards of a suit are in the hand (O(1))
+	@param suit : int in range [0,3]
+	@return (start, stop) - the suit is self.cards[start:stop]
+	"""
+	def suitRange(self, suit):
+		return self.bounds[suit], self.bounds[suit + 1]
+
+	""" getSuit(suit)
+	@param suit : int in range [0,3]
+	@return [Card] - the cards of the suit, lowest first
+	"""
+	def getSuit(self, suit):
+		return self.cards[self.bounds[suit]:self.bounds[suit + 1]]
+
+	""" hasSuit(suit)
+	@return boolean - true if the hand holds at least one card of the suit (O(1))
+	"""
+	def hasSuit(self, suit):
+		return self.bounds[suit] != self.bounds[suit + 1]
+
+	""" lowest(suit)
+	@return Card - the lowest card of the suit in the hand, None if there isn't one (O(1))
+	"""
+	def lowest(self, suit):
+		start, stop = self.bounds[suit], self.bounds[suit + 1]
+		return self.cards[start] if start != stop else None
+
+	""" highest(suit)
+	@return Card - the highest card of the suit in the hand, None if there isn't one (O(1))
+	"""
+	def highest(self, suit):
+		start, stop = self.bounds[suit], self.bounds[suit + 1]
+		return self.cards[stop - 1] if start != stop else None
+
+	""" lowestAbove(card)
+	The cheapest card of the same suit that beats card (O(log n))
+	@param card : Card - the card to beat
+	@return Card - the lowest card of card's suit higher than card, None if there isn't one
+	"""
+	def lowestAbove(self, card):
+		index = bisect_right(self.ids, card.id)
+		if index < self.bounds[card.suit + 1]:
+			return self.cards[index]
+		return None
+
+	# ------------------------------------------------------------------------------
+	# Private Methods
+
+	""" _removeAt(index)
+	Removes and returns the card at index, keeping the counts and bounds in step
+	"""
+	def _removeAt(self, index):
+		card = self.cards.pop(index)
+		del self.ids[index]
+		self.counts[card.id] -= 1
+		self.suit_counts[card.suit] -= 1
+		bounds = self.bounds
+		for s in range(card.suit + 1, 5):
+			bounds[s] -= 1
+		self.version += 1
+		return card
@@ -0,0 +1,73 @@
+import sys
+
+# Local imports
+from .card import CARDS
+from .deck import Deck
+from .player import Player
+from .gamestate import Gamestate
+from .dealer import Dealer
+from .shuffle import ShuffleEngine
+
+"""=================================================================================
+Headless Entry Point
+================================================================================="""
+
+""" Headless Entry Point
+Starts a game without any console prompts, for workers and scripts. Only the modules
+	a game needs are imported, so it starts quickly. Run it with
+
+	python3 -m ohhell --players 4 --cards 7 --seed 42
+
+@author Chris P.
+@created 2021-01-22 YMD
+"""
+
+""" newGame(num_players, num_decks, history)
+Builds a game with a full deck and numbered players, no input() needed
+@param num_players : int - how many players sit at the table
+@param num_decks : int - how many 52 card decks are stacked together. Default is 1
+@param history : ActionLog - passed on to Gamestate, eg. JournalWriter.log(). Default
+	is a new ActionLog
+@return : Gamestate - the new game, every card in the deck
+"""
+def newGame(num_players, num_decks=1, history=None):
+	deck = Deck(52 * num_decks)
+	for i in range(0, num_decks):
+		deck.extend(CARDS)
+	players = [Player("Player {}".format(i + 1), "P{}".format(i + 1)) for i in range(0, num_players)]
+	return Gamestate(deck, players, history)
+
+""" main(argv)
+Deals one round headlessly and prints the resulting game
+@param argv : [String] - the command line arguments. Default is sys.argv[1:]
+@return : int - exit code
+"""
+def main(argv=None):
+	# argparse is only needed here, keep it out of the import path of the engine
+	import argparse
+	parser = argparse.ArgumentParser(prog="python3 -m ohhell", description="Deal a round of Oh Hell without any prompts.")
+	parser.add_argument("--players", type=int, default=4, help="number of players (default 4)")
+	parser.add_argument("--cards", type=int, default=7, help="cards dealt to each player (default 7)")
+	parser.add_argument("--decks", type=int, default=1, help="number of stacked decks (default 1)")
+	parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible deal")
+	parser.add_argument("--quiet", action="store_true", help="don't print the game")
+	parser.add_argument("--journal", default=None, help="append the game to this journal file")
+	args = parser.parse_args(argv)
+
+	engine = ShuffleEngine(args.seed)
+	journal = None
+	if args.journal is not None:
+		from .journal import JournalWriter
+		journal = JournalWriter(args.journal)
+		journal.startGame({"seed": engine.seed, "players": args.players, "decks": args.decks})
+	try:
+		gamestate = newGame(args.players, args.decks, None if journal is None else journal.log())
+		dealt = Dealer(engine).deal(gamestate, args.cards)
+	finally:
+		if journal is not None:
+			journal.close()
+	if not dealt:
+		return 1
+	if not args.quiet:
+		sys.stdout.write(str(gamestate))
+	return 0
@@ -0,0 +1,346 @@
+import os
+import sys
+from array import array
+
+# Local imports
+from .actionlog import *
+from .error import *
+
+# First 8 bytes of every journal
+MAGIC = b"OHHJRNL1"
+
+# Record types only found in journals, after the ActionLog types
+GAME = 14	# a new game starts, followed by a payload of repr(info)
+UNDO = 15	# the last record still standing was undone (Gamestate.revertLastAction)
+
+# Types followed by a payload: one word with the length in bytes, then the UTF-8 text
+# padded with zeros to whole words
+PAYLOAD_TYPES = frozenset((ATTRIBUTE, GAME))
+
+""" _records(words, byteorder)
+@param words : memoryview - bytes of whole little endian words
+@param byteorder : String - byte order of this machine. Default is sys.byteorder
+@return : memoryview - the words as unsigned 64 bit integers, a view of words itself
+	on little endian machines and a swapped copy otherwise
+"""
+def _records(words, byteorder=sys.byteorder):
+	if byteorder == "little":
+		return words.cast("Q")
+	data = array("Q")
+	data.frombytes(words)
+	data.byteswap()
+	return memoryview(data)
+
+"""=================================================================================
+JournalWriter Class
+================================================================================="""
+
+""" JournalWriter Class
+Streams the actions of games to an append-only file. The file is MAGIC followed by
+	8 byte little endian words: the ActionLog records of every action, GAME records
+	between games and UNDO records for every record revertLastAction() took back.
+	ATTRIBUTE records are followed by a payload with repr((key, new value)), or
+	repr((key,)) when the attribute was removed.
+
+	Records are buffered and written, then fsync'ed, every sync_every records and on
+	close(), so a crash loses at most the last batch. Opening an existing journal cuts
+	off a half written record at its end before anything is appended.
+
+	with JournalWriter("games.ohj") as journal:
+		journal.startGame({"seed": 42, "players": 4})
+		gamestate = Gamestate(deck, players, journal.log())
+
+@author Chris P.
+@created 2021-01-28 YMD
+"""
+class JournalWriter():
+	"""__init__
+	@param path : String - the journal file, created if it doesn't exist
+	@param sync_every : int - records per write and fsync. Default is 4096
+	"""
+	def __init__(self, path, sync_every=4096):
+		self.path = path
+		self.sync_every = sync_every
+		self.buffer = bytearray()
+		end = JournalReader.validEnd(path) if os.path.exists(path) else 0
+		self.file = open(path, "r+b" if end else "wb")
+		if end:
+			self.file.truncate(end)
+			self.file.seek(end)
+		else:
+			self.file.write(MAGIC)
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" log(capacity)
+	@param capacity : int - see ActionLog. Default is None, no limit
+	@return : JournalLog - an ActionLog that writes every action to this journal, to
+		pass to Gamestate
+	"""
+	def log(self, capacity=None):
+		return JournalLog(self, capacity)
+
+	""" startGame(info)
+	Marks the start of a new game
+	@param info : Any - what to keep about the game (seed, players, ...), stored as its
+		repr(). Plain dicts, lists, strings and numbers read back with JournalReader.info()
+	"""
+	def startGame(self, info=None):
+		self.write(pack(GAME))
+		self.writePayload(info)
+
+	""" write(record)
+	@param record : int - a record made by ohhell.actionlog.pack()
+	"""
+	def write(self, record):
+		self.buffer += record.to_bytes(8, "little")
+		if len(self.buffer) >= self.sync_every * 8:
+			self.flush()
+
+	""" writePayload(value)
+	Writes repr(value) as a payload, right after the record it belongs to
+	"""
+	def writePayload(self, value):
+		text = repr(value).encode("utf-8")
+		self.buffer += len(text).to_bytes(8, "little")
+		self.buffer += text
+		self.buffer += bytes(-len(text) % 8)
+
+	""" flush(sync)
+	Writes the buffered records
+	@param sync : boolean - fsync the file after writing. Default is True
+	"""
+	def flush(self, sync=True):
+		if self.buffer:
+			self.file.write(self.buffer)
+			self.buffer = bytearray()
+		self.file.flush()
+		if sync:
+			os.fsync(self.file.fileno())
+
+	def close(self):
+		if not self.file.closed:
+			self.flush()
+			self.file.close()
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		self.close()
+
+	def __repr__(self):
+		return "JournalWriter({!r})".format(self.path)
+
+"""=================================================================================
+JournalLog Class
+================================================================================="""
+
+""" JournalLog Class
+An ActionLog that also writes every record it is given to a JournalWriter, and an UNDO
+	record for every record popped. Made with JournalWriter.log()
+
+@author Chris P.
+@created 2021-01-28 YMD
+"""
+class JournalLog(ActionLog):
+	def __init__(self, writer, capacity=None):
+		super().__init__(capacity)
+		self.writer = writer
+
+	def push(self, record):
+		ActionLog.push(self, record)
+		self.writer.write(record)
+
+	def pushValue(self, record, value):
+		ActionLog.pushValue(self, record, value) # Writes the record through self.push()
+		if record & 15 == ATTRIBUTE:
+			key, old, new = value
+			self.writer.writePayload((key,) if new is MISSING else (key, new))
+
+	def pop(self):
+		popped = ActionLog.pop(self)
+		if popped is not None:
+			self.writer.write(pack(UNDO))
+		return popped
+
+"""=================================================================================
+JournalReader Class
+================================================================================="""
+
+""" JournalReader Class
+Reads a journal through a memory map, nothing is loaded into Python objects until it
+	is asked for. self.records is a memoryview of the words after MAGIC, so a scan
+	over millions of games can also be done with numpy:
+
+	numpy.frombuffer(reader.records, dtype="<u8")
+
+	A journal whose writer died mid-write ends in part of a record or payload. The
+	reader stops at the last whole record and ignores the rest.
+
+@author Chris P.
+@created 2021-01-28 YMD
+"""
+class JournalReader():
+	"""__init__
+	@param path : String - the journal file
+	@raise ValueError if the file isn't a journal
+	"""
+	def __init__(self, path):
+		import mmap
+		self.path = path
+		self.file = open(path, "rb")
+		size = os.fstat(self.file.fileno()).st_size
+		self.mmap = None
+		self.records = memoryview(b"").cast("Q")
+		if size == 0:
+			return
+		self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+		if size < len(MAGIC) and MAGIC.startswith(self.mmap[:]):
+			return # Cut off while the journal was being created, same as empty
+		if self.mmap[:len(MAGIC)] != MAGIC:
+			self.close()
+			raise ValueError("JournalReader: {} is not a journal".format(path))
+		self.records = _records(memoryview(self.mmap)[len(MAGIC):size - size % 8])
+
+	# ------------------------------------------------------------------------------
+	# Static Methods
+
+	""" validEnd(path)
+	@param path : String - a journal file
+	@return : int - the size in bytes of the journal up to the end of its last whole
+		record, 0 if it doesn't even hold MAGIC
+	@raise ValueError if the file isn't a journal
+	"""
+	@staticmethod
+	def validEnd(path):
+		with JournalReader(path) as reader:
+			if len(reader.mmap or b"") < len(MAGIC):
+				return 0
+			end = 0
+			for action in reader.actions():
+				end = reader._next(action[0])
+			return len(MAGIC) + 8 * end
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" actions(start, stop)
+	The records between two word offsets, payloads decoded
+	@param start : int - word offset of the first record. Default is 0
+	@param stop : int - word offset to stop at. Default is the end of the journal
+	@return : generator of (offset, type_, linked, src, dst, card, value) - value is the
+		payload text for PAYLOAD_TYPES, the ref otherwise
+	"""
+	def actions(self, start=0, stop=None):
+		records = self.records
+		end = len(records) if stop is None else min(stop, len(records))
+		offset = start
+		while offset < end:
+			record = records[offset]
+			type_, linked, src, dst, card, ref = unpack(record)
+			following = self._next(offset)
+			if following > len(records):
+				return # Truncated payload
+			if type_ in PAYLOAD_TYPES:
+				size = records[offset + 1]
+				value = bytes(self.mmap[len(MAGIC) + 8 * (offset + 2):len(MAGIC) + 8 * (offset + 2) + size]).decode("utf-8")
+			else:
+				value = ref
+			yield (offset, type_, linked, src, dst, card, value)
+			offset = following
+
+	""" games()
+	@return : [(int, int)] - (start, stop) word offsets of every game in the journal
+	"""
+	def games(self):
+		starts = [offset for offset, type_, linked, src, dst, card, value in self.actions() if type_ == GAME]
+		return [(start, stop) for start, stop in zip(starts, starts[1:] + [len(self.records)])]
+
+	""" info(game)
+	@param game : (int, int) - a game from games()
+	@return : Any - the info given to JournalWriter.startGame(), read back with
+		ast.literal_eval. The repr text if it isn't a literal
+	"""
+	def info(self, game):
+		import ast
+		for offset, type_, linked, src, dst, card, value in self.actions(game[0], game[0] + 1):
+			try:
+				return ast.literal_eval(value)
+			except (ValueError, SyntaxError):
+				return value
+		return None
+
+	""" effective(game)
+	The records of a game that still stand once the undone ones are taken out
+	@param game : (int, int) - a game from games()
+	@return : [(offset, type_, linked, src, dst, card, value)] - oldest first
+	"""
+	def effective(self, game):
+		stack = []
+		for action in self.actions(game[0], game[1]):
+			if action[1] == UNDO:
+				if stack:
+					stack.pop()
+			elif action[1] != GAME:
+				stack.append(action)
+		return stack
+
+	""" replay(game, state)
+	Plays the card moves, points, turns and rounds of a game onto a FlatState. Attribute
+		changes and removed cards are not replayed
+	@param game : (int, int) - a game from games()
+	@param state : FlatState - the game as it was when it started, eg. Gamestate.fork()
+		of a freshly built game
+	@return : FlatState - state, for chaining
+	"""
+	def replay(self, game, state):
+		for offset, type_, linked, src, dst, card, value in self.effective(game):
+			if type_ == MOVE:
+				state.move(src, dst, card)
+			elif type_ == POINT:
+				state.addPoint(src - 1, value - POINT_OFFSET)
+			elif type_ == TURN:
+				state.newTurn()
+			elif type_ == ROUND:
+				state.newRound()
+		return state
+
+	def close(self):
+		self.records.release()
+		if self.mmap is not None:
+			self.mmap.close()
+			self.mmap = None
+		self.file.close()
+
+	# ------------------------------------------------------------------------------
+	# Private Methods
+
+	""" _next(offset)
+	@return : int - word offset of the record after the one at offset
+	"""
+	def _next(self, offset):
+		if self.records[offset] & 15 not in PAYLOAD_TYPES:
+			return offset + 1
+		if offset + 1 >= len(self.records):
+			return offset + 2 # Truncated before the payload length
+		return offset + 2 + (self.records[offset + 1] + 7) // 8
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __len__(self):
+		return len(self.records)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		self.close()
+
+	def __repr__(self):
+		return "JournalReader({!r})".format(self.path)
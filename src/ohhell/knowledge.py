@@ -0,0 +1,387 @@
+from collections import deque
+
+# Local imports
+from .actionlog import MOVE, ATTRIBUTE, REMOVE_PILE, ROUND, MISSING
+from .events import REVERT
+from .bitpile import SUIT_MASKS
+
+# Every card ID of a deck
+ALL_CARDS = (1 << 52) - 1
+
+""" higherCards(card, lead, trump)
+@param card : Card - a card on the trick
+@param lead : int - the suit led, None if card leads the trick
+@param trump : int - the trump suit, None if there is none
+@return : int - the mask of the card IDs that beat card in the trick
+"""
+def higherCards(card, lead, trump):
+	suit = card.suit
+	if lead is None:
+		lead = suit
+	trumps = 0 if trump is None else SUIT_MASKS[trump]
+	if suit == trump or suit == lead:
+		# Higher cards of its own suit, and every trump if it isn't one
+		return (SUIT_MASKS[suit] & ~((2 << card.id) - 1)) | (trumps if suit != trump else 0)
+	return SUIT_MASKS[lead] | trumps # Neither trump nor the suit led, it can't win
+
+"""=================================================================================
+CardTracker Class
+================================================================================="""
+
+""" CardTracker Class
+Follows the cards of one table through the events of its Gamestate, for the Knowledge
+	of its players. What everyone sees is kept once for the whole table, so a table
+	costs one subscription however many players track it:
+
+	deal		the cards moved to a player's hand (hands[i], only player i's Knowledge
+				reads it). A card taken back from a pile is in play again, and
+				possible for the player who took it
+	trump		the turned up card ("trump" attribute) is in nobody's hand
+	play		a card moved from a hand to a pile is out of play, and a player who
+				doesn't follow the suit led (the first card on the pile) is void in it
+	round		a new round (Gamestate.newRound()) forgets everything
+
+	Every event is O(1). Cards out of play are one mask for the table, taken out of a
+	player's cards when they are read. Reverted actions are taken back from a snapshot
+	of what their events changed, so the tracking of a game being searched (changed and
+	reverted) stays right. Snapshots are kept for the current round only, and no more
+	of them than the history of the game holds (ActionLog capacity). Reverting past
+	them starts again from what can be seen, which forgets the voids shown so far.
+
+	Only works for games of a single deck.
+
+@author Chris P.
+@created 2021-02-04 YMD
+"""
+class CardTracker():
+	"""__init__
+	Starts from what can be seen of the game now, see sync()
+	@param gamestate : Gamestate - the game
+	"""
+	def __init__(self, gamestate):
+		self.gamestate = gamestate
+		# A snapshot per relevant event of the round, for REVERT. The history can't undo
+		# more records than it keeps, so neither can the tracker
+		self.undo = deque(maxlen=gamestate.history.capacity)
+		self.views = 0 # Knowledge attached
+		self.subscribed = False
+		self.sync()
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" start()
+	Subscribes to the events of the game
+	"""
+	def start(self):
+		if not self.subscribed:
+			self.gamestate.subscribe(self.observe, (MOVE, ATTRIBUTE, REMOVE_PILE, ROUND, REVERT))
+			self.subscribed = True
+
+	""" stop()
+	Stops following the game, what is known so far is kept
+	"""
+	def stop(self):
+		if self.subscribed:
+			self.gamestate.unsubscribe(self.observe)
+			self.subscribed = False
+
+	""" sync()
+	Forgets everything and starts again from what can be seen of the game now: the
+		hands, the turned up card and the cards on the piles
+	"""
+	def sync(self):
+		gamestate = self.gamestate
+		self.reset(len(gamestate.players))
+		for i, player in enumerate(gamestate.players):
+			for card in player.hand.cards:
+				self.hands[i] |= 1 << card.id
+		trump = gamestate.attributes.get("trump")
+		if trump is not None:
+			self.gone |= 1 << trump.id
+		for number, pile in gamestate.piles.items():
+			for card in pile.cards:
+				self.gone |= 1 << card.id
+			if pile.cards:
+				self.leads[-(number + 1)] = pile.cards[-1].suit # Pushed onto the front
+		self.trump_suit = gamestate.attributes.get("trump_suit")
+		self.undo.clear()
+
+	""" reset(players)
+	Forgets everything, as at the start of a round
+	@param players : int - players at the table. Default is the number already known
+	"""
+	def reset(self, players=None):
+		if players is None:
+			players = len(self.hands)
+		self.candidates = [ALL_CARDS] * players # cards not ruled out by their own plays
+		self.voids = [0] * players # bit s set for a void shown in suit s
+		self.hands = [0] * players # cards seen moved to the hand, and still there
+		self.gone = 0 # cards in nobody's hand: played or turned up
+		self.leads = {} # the suit led by pile location code
+
+	""" observe(event)
+	Updates the tracking with one change to the game, the callback start() subscribes
+	@param event : Event - the change
+	"""
+	def observe(self, event):
+		type_ = event.type_
+		if type_ == REVERT:
+			if self._relevant(event.value):
+				self._restore()
+			return
+		if not self._relevant(event):
+			return
+		self._save(event)
+		if type_ == MOVE:
+			if event.dst > 0:
+				self.observePickup(event.dst - 1, event.card)
+			elif event.src > 0:
+				self.observePlay(event.src - 1, event.card, event.dst)
+			else:
+				self.gone |= 1 << event.card # Turned up onto a pile
+		elif type_ == ATTRIBUTE:
+			key, old, new = event.value
+			if key == "trump":
+				if new is not None and new is not MISSING:
+					self.gone |= 1 << new.id
+			else:
+				self.trump_suit = None if new is MISSING else new
+		elif type_ == REMOVE_PILE:
+			self.leads.pop(event.src, None)
+		else:
+			self.reset()
+
+	""" observePickup(index, card_id)
+	A card moved to a player's hand, dealt or taken back from a pile. The player holds
+		it, so it is back in play and they aren't void in its suit any more
+	@param index : int - the index of the player
+	@param card_id : int - the ID of the card
+	"""
+	def observePickup(self, index, card_id):
+		bit = 1 << card_id
+		self.gone &= ~bit
+		self.hands[index] |= bit
+		self.candidates[index] |= bit
+		self.voids[index] &= ~(1 << (card_id // 13))
+
+	""" observePlay(index, card_id, code)
+	A player played a card onto a pile
+	@param index : int - the index of the player
+	@param card_id : int - the ID of the card
+	@param code : int - the location code of the pile, -1 for pile 0
+	"""
+	def observePlay(self, index, card_id, code=-1):
+		bit = 1 << card_id
+		self.gone |= bit
+		self.hands[index] &= ~bit
+		lead = self.leads.get(code)
+		if lead is None:
+			self.leads[code] = card_id // 13
+		elif card_id // 13 != lead:
+			# Didn't follow suit, so has none left
+			self.voids[index] |= 1 << lead
+			self.candidates[index] &= ~SUIT_MASKS[lead]
+
+	# ------------------------------------------------------------------------------
+	# Private Methods
+
+	""" _relevant(event)
+	@param event : Event - a change to the game
+	@return : boolean - True if the event changes the tracking. Only decided by the
+		event, so an event and its REVERT always agree
+	"""
+	def _relevant(self, event):
+		type_ = event.type_
+		if type_ == MOVE:
+			return event.dst != 0 # Into a hand or onto a pile, not back to the deck
+		if type_ == ATTRIBUTE:
+			return event.value[0] in ("trump", "trump_suit")
+		return type_ == REMOVE_PILE or type_ == ROUND
+
+	""" _save(event)
+	Keeps what the event is about to change, so its REVERT can put it back. A new round
+		drops the snapshots of the round before
+	"""
+	def _save(self, event):
+		if event.type_ == ROUND:
+			self.undo.clear()
+			self.undo.append((self.gone, self.trump_suit, None, (list(self.candidates), list(self.voids), list(self.hands), dict(self.leads))))
+			return
+		if event.type_ == MOVE:
+			index = (event.dst if event.dst > 0 else event.src) - 1
+			code = event.dst
+		else:
+			index = -1
+			code = event.src
+		player = None if index < 0 else (self.candidates[index], self.voids[index], self.hands[index])
+		self.undo.append((self.gone, self.trump_suit, index, player, code, self.leads.get(code, MISSING)))
+
+	""" _restore()
+	Undoes the last relevant event, see _save(). Without a snapshot for it, starts again
+		from what can be seen (sync())
+	"""
+	def _restore(self):
+		if not self.undo:
+			self.sync()
+			return
+		entry = self.undo.pop()
+		self.gone, self.trump_suit, index = entry[0:3]
+		if index is None:
+			self.candidates, self.voids, self.hands, self.leads = entry[3]
+			return
+		if index >= 0:
+			self.candidates[index], self.voids[index], self.hands[index] = entry[3]
+		code, lead = entry[4:6]
+		if lead is MISSING:
+			self.leads.pop(code, None)
+		else:
+			self.leads[code] = lead
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __repr__(self):
+		return "CardTracker({} players, {} cards gone)".format(len(self.hands), self.gone.bit_count())
+
+"""=================================================================================
+Knowledge Class
+================================================================================="""
+
+""" Knowledge Class
+What one player can tell about the hands of the others from what they have seen: for
+	every player the mask of the cards they could still hold (bit i for card ID i), and
+	the suits they can't hold. It is Player.knowledge, and reads the CardTracker of the
+	table once attached.
+
+	knowledge = gamestate.players[0].knowledge
+	knowledge.attach(gamestate, 0)
+	knowledge.mayHold(2, card)			# can player 3 still have card?
+	knowledge.canBeat(card)				# can anyone still beat card on the trick?
+
+	Knowledge.attachAll(gamestate)		# every player, one CardTracker for the table
+
+@author Chris P.
+@created 2021-02-04 YMD
+"""
+class Knowledge():
+	"""__init__
+	Creates a knowledge of nothing, see attach()
+	"""
+	def __init__(self):
+		self.tracker = None
+		self.index = None # the observing player
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" attach(gamestate, index, tracker)
+	Starts following a game
+	@param gamestate : Gamestate - the game
+	@param index : int - the index of the observing player
+	@param tracker : CardTracker - the tracker of the table to share. Default is a new one
+	"""
+	def attach(self, gamestate, index, tracker=None):
+		self.detach()
+		if tracker is None:
+			tracker = CardTracker(gamestate)
+		tracker.views += 1
+		tracker.start()
+		self.tracker = tracker
+		self.index = index
+
+	""" attachAll(gamestate)
+	Attaches the knowledge of every player of a game to one CardTracker
+	@param gamestate : Gamestate - the game
+	@return : CardTracker - the tracker of the table
+	"""
+	@staticmethod
+	def attachAll(gamestate):
+		tracker = CardTracker(gamestate)
+		for i, player in enumerate(gamestate.players):
+			player.knowledge.attach(gamestate, i, tracker)
+		return tracker
+
+	""" detach()
+	Stops following the game. The tracker stops with its last knowledge
+	@return : boolean - True if the knowledge was attached
+	"""
+	def detach(self):
+		tracker = self.tracker
+		if tracker is None:
+			return False
+		tracker.views -= 1
+		if tracker.views == 0:
+			tracker.stop()
+		self.tracker = None
+		return True
+
+	""" possibleCards(index)
+	@param index : int - the index of a player
+	@return : int - the mask of the cards the player could hold. The observer's own hand
+		for the observer
+	"""
+	def possibleCards(self, index):
+		tracker = self.tracker
+		if index == self.index:
+			return tracker.hands[index]
+		return tracker.candidates[index] & ~(tracker.gone | tracker.hands[self.index])
+
+	""" mayHold(index, card)
+	@return : boolean - True if the player at index could hold card
+	"""
+	def mayHold(self, index, card):
+		return bool(self.possibleCards(index) >> card.id & 1)
+
+	""" isVoid(index, suit)
+	@return : boolean - True if the player at index can't hold a card of suit
+	"""
+	def isVoid(self, index, suit):
+		return not self.possibleCards(index) & SUIT_MASKS[suit]
+
+	""" unseen()
+	@return : int - the mask of the cards that could be in another player's hand
+	"""
+	def unseen(self):
+		tracker = self.tracker
+		return ALL_CARDS & ~(tracker.gone | tracker.hands[self.index])
+
+	""" leadSuit(pile)
+	@param pile : int - the number of the pile. Default is 0
+	@return : int - the suit led on the pile, None if nothing was played to it
+	"""
+	def leadSuit(self, pile=0):
+		return self.tracker.leads.get(-(pile + 1))
+
+	""" canBeat(card, lead, players)
+	@param card : Card - a card played (or about to be played) to the trick
+	@param lead : int - the suit led, None if card leads. Default is leadSuit()
+	@param players : Iterable - indexes of the players to ask about. Default is everyone
+		but the observer
+	@return : boolean - True if one of the players could hold a card that beats card
+	"""
+	def canBeat(self, card, lead=MISSING, players=None):
+		if lead is MISSING:
+			lead = self.leadSuit()
+		if players is None:
+			players = [i for i in range(0, len(self.tracker.hands)) if i != self.index]
+		higher = higherCards(card, lead, self.tracker.trump_suit)
+		for i in players:
+			if self.possibleCards(i) & higher:
+				return True
+		return False
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __str__(self):
+		if self.tracker is None:
+			return "Knowledge of nothing"
+		lines = []
+		for i in range(0, len(self.tracker.hands)):
+			voids = "".join("SDCH"[suit] for suit in range(0, 4) if self.isVoid(i, suit))
+			lines.append("Player {}: {} possible cards{}".format(i + 1, self.possibleCards(i).bit_count(), ", void in " + voids if voids else ""))
+		return "\n".join(lines)
+
+	def __repr__(self):
+		return "Knowledge(player {})".format(self.index)
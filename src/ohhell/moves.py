@@ -0,0 +1,140 @@
+# Local imports
+from .card import CARDS
+from .actionlog import MISSING
+from .bitpile import SUIT_MASKS
+
+"""=================================================================================
+MoveGenerator Class
+================================================================================="""
+
+""" MoveGenerator Class
+Answers "which cards may this player play now" for every player of a Gamestate. A
+	player has to follow the suit led if they can, and may play anything otherwise.
+
+	For every hand the generator keeps a 52 bit mask of each suit it holds, built once
+	per change to the hand (Pile.version). The legal cards for a lead suit are then one
+	of those masks, or the whole hand, found in O(1). The list of legal Cards is
+	cached until the hand or the lead changes. Any kind of Pile works as a hand.
+
+	The lead suit is the "lead_suit" attribute OhHellRules keeps while a trick is played.
+	Without it, it is the suit of the first card on the trick pile (pile 0), None while
+	the trick is empty. It can also be given to every call.
+
+	moves = MoveGenerator(gamestate)
+	moves.legalMoves(2)			# (Card, ...) player 2 may play now
+	moves.allLegalMoves()		# the same for every player
+
+@author Chris P.
+@created 2021-02-01 YMD
+"""
+class MoveGenerator():
+	"""__init__
+	@param gamestate : Gamestate - the game
+	@param trick_pile : int - the number of the pile tricks are played on. Default is 0
+	"""
+	def __init__(self, gamestate, trick_pile=0):
+		self.gamestate = gamestate
+		self.trick_pile = trick_pile
+		count = len(gamestate.players)
+		self.masks = [None] * count # (hand, version, [suit masks], hand mask) by player index
+		self.moves = [None] * count # (hand, version, lead, (Card, ...)) by player index
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" leadSuit()
+	@return : int - the "lead_suit" attribute, or the suit of the first card played to the
+		trick pile. None if it is empty
+	"""
+	def leadSuit(self):
+		lead = self.gamestate.attributes.get("lead_suit")
+		if lead is not None:
+			return lead
+		pile = self.gamestate.piles.get(self.trick_pile)
+		if not pile:
+			return None
+		return pile.cards[-1].suit # Piles are pushed onto the front, the first card is last
+
+	""" suitMasks(index)
+	@param index : int - the index of the player
+	@return : ([int], int) - the mask of the cards the player holds in each suit, and the
+		mask of the whole hand
+	"""
+	def suitMasks(self, index):
+		hand = self.gamestate.players[index].hand
+		entry = self.masks[index]
+		if entry is None or entry[0] is not hand or entry[1] != hand.version:
+			mask = 0
+			for card in hand.cards:
+				mask |= 1 << card.id
+			entry = self.masks[index] = (hand, hand.version, [mask & suit for suit in SUIT_MASKS], mask)
+		return entry[2], entry[3]
+
+	""" legalMask(index, lead)
+	@param index : int - the index of the player
+	@param lead : int - the suit led, None if the player leads. Default is leadSuit()
+	@return : int - the mask of the card IDs the player may play
+	"""
+	def legalMask(self, index, lead=MISSING):
+		if lead is MISSING:
+			lead = self.leadSuit()
+		suits, mask = self.suitMasks(index)
+		if lead is not None and suits[lead]:
+			return suits[lead]
+		return mask
+
+	""" legalMoves(index, lead)
+	@param index : int - the index of the player
+	@param lead : int - the suit led, None if the player leads. Default is leadSuit()
+	@return : (Card) - the cards the player may play, lowest ID first. One copy of every
+		card the hand holds more than once
+	"""
+	def legalMoves(self, index, lead=MISSING):
+		if lead is MISSING:
+			lead = self.leadSuit()
+		hand = self.gamestate.players[index].hand
+		entry = self.moves[index]
+		if entry is not None and entry[0] is hand and entry[1] == hand.version and entry[2] == lead:
+			return entry[3]
+		legal = self.legalMask(index, lead)
+		moves = []
+		while legal:
+			low = legal & -legal
+			moves.append(CARDS[low.bit_length() - 1])
+			legal ^= low
+		moves = tuple(moves)
+		self.moves[index] = (hand, hand.version, lead, moves)
+		return moves
+
+	""" allLegalMoves(lead)
+	@param lead : int - the suit led. Default is leadSuit()
+	@return : [(Card)] - legalMoves() of every player, by player index
+	"""
+	def allLegalMoves(self, lead=MISSING):
+		if lead is MISSING:
+			lead = self.leadSuit()
+		return [self.legalMoves(i, lead) for i in range(0, len(self.gamestate.players))]
+
+	""" allLegalMasks(lead)
+	@param lead : int - the suit led. Default is leadSuit()
+	@return : [int] - legalMask() of every player, by player index
+	"""
+	def allLegalMasks(self, lead=MISSING):
+		if lead is MISSING:
+			lead = self.leadSuit()
+		return [self.legalMask(i, lead) for i in range(0, len(self.gamestate.players))]
+
+	""" isLegal(index, card, lead)
+	@param index : int - the index of the player
+	@param card : Card - the card to play
+	@param lead : int - the suit led. Default is leadSuit()
+	@return : boolean - True if the player holds the card and may play it
+	"""
+	def isLegal(self, index, card, lead=MISSING):
+		return bool(self.legalMask(index, lead) >> card.id & 1)
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __repr__(self):
+		return "MoveGenerator({} players)".format(len(self.gamestate.players))
@@ -0,0 +1,234 @@
+import sys
+
+# Local imports
+from .card import Card
+from .codec import toNames
+from .error import *
+
+# Globals
+MAX_SIZE = sys.maxsize
+
+"""=================================================================================
+Pile Class
+================================================================================="""
+
+""" Pile Class
+A class representing a real life "pile" of cards.
+
+@author Chris P.
+@created 2020-12-21 YMD
+"""
+class Pile():
+	"""__init__
+	Default Constructor - creates an empty pile object with the optional max_size parameter
+	@param max_size : INT coressponding to the maximum size of the pile
+	"""
+	def __init__(self, max_size=MAX_SIZE, enforce_order=False):
+		self.enforce_order = enforce_order
+		self.max_size = max_size
+		self.cards = []
+		# Copies of each card ID and cards of each suit, kept in step with self.cards
+		# so membership and counting don't scan the pile
+		self.counts = [0] * 52
+		self.suit_counts = [0] * 4
+		# Bumped by every change to the pile, so caches built from it know when to rebuild
+		self.version = 0
+
+	# ------------------------------------------------------------------------------
+	# Static Methods
+
+	""" fromList(lis)
+	"Overloaded" constructor - Creates a pile object containing cards with IDs corresponding to the ints in lis
+	@param lis : [int] - list of card IDs
+	@return a corresponding Pile object
+	"""
+	@classmethod
+	def fromList(cls, lis, max_size=MAX_SIZE):
+		output = cls(max_size)
+		for i in lis:
+			output.append(Card.fromID(i))
+		return output
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" insert(card, location)
+	Inserts a card at the given location. Default location is 0.
+	@param card : Card - the card to insert into the deck. Cards are "immutable" and singletons so shallow copy
+	@param location : INT - the location in the pile to insert the card. Default is 0
+	@returns true if successful, false if failed
+	"""
+	def insert(self, card, location=0):
+		if self.getSize() < self.max_size:
+			self.cards.insert(location,card)
+			self.counts[card.id] += 1
+			self.suit_counts[card.suit] += 1
+			self.version += 1
+			return True #Isn't certain to be a successful insert, but list.insert returns nothing...
+		else:
+			ERROR.write("Invalid Insert: Inserting into pile would violate max_size.")
+			return False
+
+	""" remove(card)
+	Removes a specified card from the list if present. It will only remove one instance of the card. 
+		Potentially unsafe if List.remove() features change...
+	@param card : Card that represents the card to remove
+	@raise ValueError if the card isn't in the pile
+	"""
+	def remove(self, card):
+		if self.counts[card.id] == 0:
+			raise ValueError("Pile.remove(card): card not in pile")
+		self.cards.remove(card)
+		self.counts[card.id] -= 1
+		self.suit_counts[card.suit] -= 1
+		self.version += 1
+
+	""" push(card)
+	Push a card to the front (location 0) of the list. Carried out by calling Pile.insert()
+	@param card : Card - the card to push to the front. See the notes for Pile.insert()
+	"""
+	def push(self, card):
+		return self.insert(card,0)
+
+	""" pop()
+	Pop a card from the front of the list
+	@return Card that was at the front of the list
+	"""
+	def pop(self):
+		card = self.cards.pop(0)
+		self.counts[card.id] -= 1
+		self.suit_counts[card.suit] -= 1
+		self.version += 1
+		return card
+
+	""" append(card)
+	Append a card to the end of the list
+	@param card : Card - The card to append to the end of the list. See the notes for Pile.insert() about copies
+	"""
+	def append(self, card):
+		if self.getSize() < self.max_size:
+			self.cards.append(card)
+			self.counts[card.id] += 1
+			self.suit_counts[card.suit] += 1
+			self.version += 1
+			return True
+		else:
+			ERROR.write("Invalid Append: Inserting into pile would violate max_size.")
+			return False
+
+	""" extend(cards)
+	Appends several cards to the end of the list in one go
+	@param cards : [Card] - the cards to append, in order
+	@return : boolean - true if successful, false (and nothing added) if max_size would be violated
+	"""
+	def extend(self, cards):
+		if self.getSize() + len(cards) > self.max_size:
+			ERROR.write("Invalid Extend: Inserting into pile would violate max_size.")
+			return False
+		self.cards.extend(cards)
+		for card in cards:
+			self.counts[card.id] += 1
+			self.suit_counts[card.suit] += 1
+		self.version += 1
+		return True
+
+	""" draw(count)
+	Removes the front count cards in one go
+	@param count : int - how many cards to take, capped at the size of the pile
+	@return [Card] - the cards taken, front card first
+	"""
+	def draw(self, count):
+		taken = self.cards[:count]
+		del self.cards[:count]
+		for card in taken:
+			self.counts[card.id] -= 1
+			self.suit_counts[card.suit] -= 1
+		self.version += 1
+		return taken
+
+	""" shuffle(engine)
+	Randomly orders the pile
+	@param engine : ShuffleEngine - where the randomness comes from
+	"""
+	def shuffle(self, engine):
+		engine.shuffle(self.cards)
+		self.version += 1
+
+	""" sort()
+	Numerically sorts the contents of self.cards if self.enforce_order == False
+	"""
+	def sort(self):
+		if self.enforce_order == False:
+			self.cards.sort()
+			self.version += 1
+		else:
+			ERROR.write("WARNING: Trying to sort pile with an enforced order. Not sorting.")
+
+	""" clear()
+	Removes all of contents from self.hand
+	"""
+	def clear(self):
+		self.cards.clear()
+		self.counts = [0] * 52
+		self.suit_counts = [0] * 4
+		self.version += 1
+
+	""" getSize()
+	Returns the size of hand list in a Pile object
+	@return length of self.hand
+	"""
+	def getSize(self):
+		return len(self.cards)
+
+	""" count(card)
+	Returns how many copies of the card are in the pile (O(1))
+	@param card : Card - the card to count
+	"""
+	def count(self, card):
+		return self.counts[card.id]
+
+	""" countSuit(suit)
+	Returns how many cards of the given suit are in the pile (O(1))
+	@param suit : int in range [0,3]
+	"""
+	def countSuit(self, suit):
+		return self.suit_counts[suit]
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	""" __len__()
+	Overrides the __len__ method and returns the size of hand list in a Pile object
+	@return length of self.hand
+	"""
+	def __len__(self):
+		return self.getSize()
+
+	""" __str__()
+	Overrides the __str__ method and returns a string 
+	@return string representation of self.hand
+	"""
+	def __str__(self):
+		return toNames(self.cards)
+
+	""" __repr__()
+	Overrides the __repr__ method and returns a string 
+	@return string representation of self.hand
+	"""
+	def __repr__(self):
+		return self.__str__()
+
+	""" __contains__(other)
+	Checks if other (a card Object...) is contained within the pile. O(1) using self.counts
+	@param other : Card - the card to check the presence of.
+	"""
+	def __contains__(self, other):
+		if other.__class__ is not Card: # Confirm types are the same
+			return False
+		return self.counts[other.id] > 0
+
+	def __iter__(self):
+		return self.cards.__iter__()
+
+	def __next__(self):
+		return self.cards.__next__()
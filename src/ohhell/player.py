@@ -1,12 +1,10 @@
 import sys
-import unittest
-import random
-from io import StringIO
 
 # Local imports
-from card import Card
-from pile import Pile
-from error import *
+from .card import Card
+from .hand import SortedHand
+from .knowledge import Knowledge
+from .error import *
 
 # Globals
 MAX_SIZE = sys.maxsize
@@ -18,7 +16,8 @@ Player Class
 """ Player Class
 Represents a player. Stores identifying information about the player while also storing
 	their hand in the game. This class is also responsible for storing the "knowledge" 
-	of the player during the game.
+	of the player during the game, a Knowledge of the other hands that follows the game
+	once attached (see Knowledge.attach()).
 
 @author Chris P.
 @created 2020-12-26 YMD
@@ -30,12 +29,14 @@ class Player():
 	@param name : String - the name of the player
 	@param id : String - a unique player ID in case of overlapping names. In format 
 		"name-UNIXtimestamp"
+	@param max_size : INT - the most cards the player may hold
 	"""
 	def __init__(self, name, id_, max_size=MAX_SIZE):
 		self.name = name
 		self.id = id_
-		self.hand = Pile()
-		self.knowledge = []
+		self.max_size = max_size
+		self.hand = SortedHand()
+		self.knowledge = Knowledge()
 		self.points = 0
 
 	# ------------------------------------------------------------------------------
@@ -56,15 +57,14 @@ class Player():
 
 
 	""" push_sort(card)
-	Push a new card into the player's hand and sort the hand
+	Push a new card into the player's hand and sort the hand. The hand is a SortedHand,
+		so the card is inserted at its sorted place and nothing else moves
 	Postcondition: The player's hand is in sorted order
 	@param card : Card - the card to add to the player's hand
 	@return : boolean - true if successful, false if max_size
 	"""
 	def push_sort(self,card):
-		result = self.push(card)
-		self.hand.sort()
-		return result
+		return self.push(card)
 
 	""" remove(card)
 	Remove the specified card from the player's hand
@@ -111,17 +111,12 @@ class Player():
 		return self.id
 
 	""" __contains__(other)
-	Checks if other (a card Object...) is contained within the pile
-	Precondition: type(other) == Card
+	Checks if other (a card Object...) is contained within the player's hand. Anything
+		that isn't a Card is never contained
 	@param other : Card - the card to check the presence of.
 	"""
 	def __contains__(self, other):
-		if type(other) != type(Card(2,0)): # confirm other is a Card
-			return False
-		elif other in self.hand: #Check if the card is contained
-			return True
-		else:
-			return False
+		return other in self.hand
 
 	def __iter__(self):
 		return self.hand.__iter__()
@@ -0,0 +1,102 @@
+from .gamestate import SUMMARY, ATTRIBUTE_LINE
+
+"""=================================================================================
+DeltaRenderer Class
+================================================================================="""
+
+""" DeltaRenderer Class
+Renders a Gamestate line by line, the same lines as str(gamestate), and after the first
+	render only the lines of the locations and attributes that changed since the last
+	one. The gamestate records what changed as it goes (Gamestate.trackChanges()), so a
+	render costs a line per change instead of the whole deck times every player.
+
+	renderer = DeltaRenderer(gamestate)
+	for key, line in renderer.render():	# everything the first time
+		...
+	gamestate.playerToPile(player, 0, card)
+	for key, line in renderer.render():	# the summary, the player and pile 0
+		...
+
+	Keys are SUMMARY, (ATTRIBUTE_LINE, key) and location codes (0 deck, i + 1 player i,
+	-(j + 1) pile j). A line of None means the pile or attribute is gone. Only one
+	renderer should watch a gamestate, each render() clears what the gamestate recorded.
+
+@author Chris P.
+@created 2021-01-29 YMD
+"""
+class DeltaRenderer():
+	"""__init__
+	@param gamestate : Gamestate - the game to render
+	"""
+	def __init__(self, gamestate):
+		self.gamestate = gamestate
+		self.lines = {} # key -> last rendered line
+		self.summary = None # (actions, turns, rounds) of the last summary line
+		gamestate.trackChanges()
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" render()
+	@return : [(key, String)] - the lines that changed since the last render, every line
+		the first time. None for a line that was removed
+	"""
+	def render(self):
+		gamestate = self.gamestate
+		if not self.lines:
+			changed = gamestate.lineOrder()
+		else:
+			changed = [(ATTRIBUTE_LINE, key) for key in gamestate.dirty_attributes]
+			changed.extend(sorted(gamestate.dirty, reverse=True))
+			summary = (len(gamestate.history), gamestate.turns, gamestate.rounds)
+			if summary != self.summary:
+				changed.insert(0, SUMMARY)
+		gamestate.dirty.clear()
+		gamestate.dirty_attributes.clear()
+
+		lines = []
+		for key in changed:
+			line = self._line(key)
+			if line is None:
+				if self.lines.pop(key, None) is None:
+					continue # Never rendered, eg. a pile made and removed in between
+			elif self.lines.get(key) == line:
+				continue
+			else:
+				self.lines[key] = line
+			lines.append((key, line))
+		return lines
+
+	""" full()
+	@return : String - the same as str(gamestate), built from the rendered lines
+	"""
+	def full(self):
+		self.render()
+		lines = [self.lines[key] for key in self.gamestate.lineOrder()]
+		lines.append("")
+		return "\n".join(lines)
+
+	# ------------------------------------------------------------------------------
+	# Private Methods
+
+	""" _line(key)
+	@param key : a line key, see the class docstring
+	@return : String - the line for key as it is now, None if it no longer exists
+	"""
+	def _line(self, key):
+		gamestate = self.gamestate
+		if key == SUMMARY:
+			self.summary = (len(gamestate.history), gamestate.turns, gamestate.rounds)
+			return gamestate.summaryLine()
+		if isinstance(key, tuple):
+			return gamestate.attributeLine(key[1])
+		return gamestate.locationLine(key)
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __str__(self):
+		return self.full()
+
+	def __repr__(self):
+		return "DeltaRenderer({} lines)".format(len(self.lines))
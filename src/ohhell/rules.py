@@ -0,0 +1,269 @@
+# Local imports
+from .card import CARDS
+from .dealer import Dealer
+from .moves import MoveGenerator
+from .error import *
+
+# Trump index for a round without trump (the deck ran out before a card was turned up)
+NO_TRUMP = 4
+
+""" _buildRanks()
+RANKS[lead][trump] is a table of 52 bytes, the rank of every card ID in a trick led in
+	suit lead with trump suit trump (NO_TRUMP for none). Trumps rank 15 to 27, cards of
+	the lead suit 2 to 14 and every other card 0, so the highest rank takes the trick
+"""
+def _buildRanks():
+	ranks = []
+	for lead in range(0, 4):
+		tables = []
+		for trump in range(0, 5):
+			table = bytearray(52)
+			for card in CARDS:
+				if card.suit == trump:
+					table[card.id] = card.value + 13
+				elif card.suit == lead:
+					table[card.id] = card.value
+			tables.append(bytes(table))
+		ranks.append(tuple(tables))
+	return tuple(ranks)
+
+RANKS = _buildRanks()
+
+""" trickWinner(lead, trump, played)
+@param lead : int - the suit led
+@param trump : int - the trump suit, None or NO_TRUMP for none
+@param played : [int] - IDs of the cards of the trick in the order they were played
+@return : int - index in played of the winning card. The first of two equal cards wins
+"""
+def trickWinner(lead, trump, played):
+	table = RANKS[lead][NO_TRUMP if trump is None else trump]
+	best = 0
+	best_rank = table[played[0]]
+	for i in range(1, len(played)):
+		rank = table[played[i]]
+		if rank > best_rank:
+			best = i
+			best_rank = rank
+	return best
+
+""" legalBids(hand_size, bids, last)
+The hook rule: the last player to bid (the dealer) may not make the bids add up to
+	the number of tricks, so somebody always misses
+@param hand_size : int - cards in every hand, the tricks to be won
+@param bids : [int] - the bids made so far
+@param last : boolean - the player bids last
+@return : [int] - the bids the player may make
+"""
+def legalBids(hand_size, bids, last):
+	if not last:
+		return list(range(0, hand_size + 1))
+	hook = hand_size - sum(bids)
+	return [bid for bid in range(0, hand_size + 1) if bid != hook]
+
+""" score(bid, tricks)
+@return : int - 10 plus the bid for taking exactly as many tricks as bid, else 0
+"""
+def score(bid, tricks):
+	return 10 + bid if bid == tricks else 0
+
+"""=================================================================================
+GreedyStrategy Class
+================================================================================="""
+
+""" GreedyStrategy Class
+A quick way to bid and play for simulations. It bids one trick for every Ace and every
+	trump above 10, and plays the highest card it may while it still needs tricks and
+	the lowest one after that. Any object with the same bid() and play() methods can
+	be given to OhHellRules instead.
+
+@author Chris P.
+@created 2021-01-30 YMD
+"""
+class GreedyStrategy():
+
+	""" bid(rules, index, legal)
+	@param rules : OhHellRules - the round being played
+	@param index : int - the index of the bidding player
+	@param legal : [int] - the bids the player may make
+	@return : int - the bid, one of legal
+	"""
+	def bid(self, rules, index, legal):
+		trump = rules.trump
+		bid = 0
+		for card in rules.gamestate.players[index].hand.cards:
+			if card.value == 14 or (card.suit == trump and card.value > 10):
+				bid += 1
+		if bid in legal:
+			return bid
+		return bid + 1 if bid + 1 in legal else bid - 1
+
+	""" play(rules, index, legal, lead)
+	@param rules : OhHellRules - the round being played
+	@param index : int - the index of the player
+	@param legal : (Card) - the cards the player may play, in rank order (see
+		MoveGenerator.legalMoves())
+	@param lead : int - the suit led, None if the player leads
+	@return : Card - the card to play, one of legal
+	"""
+	def play(self, rules, index, legal, lead):
+		need = rules.bids[index] > rules.tricks[index]
+		if lead is not None and legal[0].suit == lead:
+			return legal[-1] if need else legal[0] # Following suit, legal is in rank order
+		table = RANKS[legal[0].suit if lead is None else lead][NO_TRUMP if rules.trump is None else rules.trump]
+		if need:
+			return max(legal, key=lambda card: table[card.id] * 16 + card.value)
+		return min(legal, key=lambda card: table[card.id] * 16 + card.value)
+
+"""=================================================================================
+OhHellRules Class
+================================================================================="""
+
+""" OhHellRules Class
+Plays rounds of Oh Hell on a Gamestate. A round is:
+
+	deal		Dealer.deal() deals the hands and turns up trump
+	bidding		starting left of the dealer, every player bids how many tricks they will
+				take. The dealer bids last and may not make the bids add up to the
+				number of tricks (the hook rule, see legalBids())
+	tricks		the player left of the dealer leads the first trick, everyone follows
+				suit if they can, the highest trump or else the highest card of the
+				suit led takes the trick (trickWinner()) and its winner leads the next
+	scoring		10 plus the bid for everyone who took exactly as many tricks as they
+				bid, added to Player.points
+
+	The game records the round in its attributes: "dealer", "leader" and "lead_suit" of
+	the current trick, "bid_i" and "tricks_i" for player index i, next to the trump
+	attributes of Dealer. The legal plays come from a MoveGenerator (self.moves). Every trick is a turn played onto pile 0, and the trick goes back under the
+	deck once it is taken.
+
+	rules = OhHellRules(gamestate, Dealer(ShuffleEngine(42)))
+	rules.playRound(7, dealer=0)
+
+@author Chris P.
+@created 2021-01-30 YMD
+"""
+class OhHellRules():
+	"""__init__
+	@param gamestate : Gamestate - the game to play
+	@param dealer : Dealer - deals the rounds. Default is a Dealer with a random seed
+	@param strategies : [strategy] - how every player bids and plays, one per player or
+		a single one for everybody. Default is GreedyStrategy
+	"""
+	def __init__(self, gamestate, dealer=None, strategies=None):
+		self.gamestate = gamestate
+		self.dealer = dealer if dealer is not None else Dealer()
+		if strategies is None:
+			strategies = GreedyStrategy()
+		if not isinstance(strategies, (list, tuple)):
+			strategies = [strategies] * len(gamestate.players)
+		self.strategies = strategies
+		self.moves = MoveGenerator(gamestate)
+		self.hand_size = 0
+		self.trump = None
+		self.bids = []
+		self.tricks = []
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" playRound(hand_size, dealer)
+	Deals, bids, plays every trick and scores one round, then collects the cards
+	@param hand_size : int - cards dealt to each player
+	@param dealer : int - index of the dealing player
+	@return : boolean - True if the round was played, False (and nothing changed) if it
+		couldn't be dealt
+	"""
+	def playRound(self, hand_size, dealer):
+		gamestate = self.gamestate
+		if not self.dealer.deal(gamestate, hand_size):
+			return False
+		gamestate.setGameAttribute("dealer", dealer)
+		self.hand_size = hand_size
+		self.trump = gamestate.attributes["trump_suit"]
+		first = (dealer + 1) % len(gamestate.players)
+		self.bid(first)
+		self.tricks = [0] * len(gamestate.players)
+		leader = first
+		for trick in range(0, hand_size):
+			leader = self.playTrick(leader)
+		self.score()
+		self.dealer.collect(gamestate)
+		gamestate.newRound()
+		return True
+
+	""" bid(first)
+	Asks every player for their bid, in order from first
+	@param first : int - index of the first player to bid
+	@return : [int] - the bids by player index
+	"""
+	def bid(self, first):
+		gamestate = self.gamestate
+		count = len(gamestate.players)
+		self.bids = [0] * count
+		made = []
+		for k in range(0, count):
+			i = (first + k) % count
+			legal = legalBids(self.hand_size, made, k == count - 1)
+			bid = self.strategies[i].bid(self, i, legal)
+			if bid not in legal:
+				ERROR.write("Invalid Bid: {} can't bid {}, bidding {}.\n".format(gamestate.players[i], bid, legal[0]))
+				bid = legal[0]
+			self.bids[i] = bid
+			made.append(bid)
+			gamestate.setGameAttribute("bid_{}".format(i), bid)
+			gamestate.setGameAttribute("tricks_{}".format(i), 0)
+		return self.bids
+
+	""" playTrick(leader)
+	Plays one trick onto pile 0 as a new turn, then takes it off the table. The suit led
+		is the "lead_suit" attribute while the trick is played
+	@param leader : int - index of the player who leads
+	@return : int - index of the player who took the trick
+	"""
+	def playTrick(self, leader):
+		gamestate = self.gamestate
+		players = gamestate.players
+		count = len(players)
+		gamestate.newTurn()
+		gamestate.setGameAttribute("leader", leader)
+		lead = None
+		played = []
+		for k in range(0, count):
+			i = (leader + k) % count
+			player = players[i]
+			legal = self.moves.legalMoves(i, lead)
+			card = self.strategies[i].play(self, i, legal, lead)
+			if card not in legal:
+				ERROR.write("Invalid Play: {} can't play {}, playing {}.\n".format(player, card, legal[0]))
+				card = legal[0]
+			gamestate.playerToPile(player, 0, card)
+			if lead is None:
+				lead = card.suit
+				gamestate.setGameAttribute("lead_suit", lead)
+			played.append(card.id)
+		winner = (leader + trickWinner(lead, self.trump, played)) % count
+		self.tricks[winner] += 1
+		gamestate.setGameAttribute("tricks_{}".format(winner), self.tricks[winner])
+		gamestate.removePile(0)
+		gamestate.removeGameAttribute("lead_suit")
+		return winner
+
+	""" score()
+	Adds the points of the round to every player who made their bid
+	"""
+	def score(self):
+		gamestate = self.gamestate
+		for i, player in enumerate(gamestate.players):
+			points = score(self.bids[i], self.tricks[i])
+			if points:
+				gamestate.addPoint(player, points)
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __str__(self):
+		players = self.gamestate.players
+		return "Round of {}: ".format(self.hand_size) + ", ".join("{} bid {} took {}".format(players[i], self.bids[i], self.tricks[i]) for i in range(0, len(self.bids)))
+
+	def __repr__(self):
+		return "OhHellRules({} players)".format(len(self.gamestate.players))
@@ -0,0 +1,101 @@
+import random
+import hashlib
+
+# Local imports
+from .error import *
+
+"""=================================================================================
+ShuffleEngine Class
+================================================================================="""
+
+""" ShuffleEngine Class
+A seeded source of shuffles. Every game gets its own engine so a game can be replayed
+	from its seed, and an engine can be split into child engines (one per worker or per
+	game) whose streams don't overlap. The child seeds are derived by hashing the parent
+	seed with the child's index, so the same seed always gives the same tree of streams.
+
+	engine = ShuffleEngine(42)
+	workers = engine.spawn(8)			# 8 independent engines
+	workers[0].shuffle(deck.cards)		# same deal every time for seed 42
+	workers[1].permutations(10000)		# 10000 shuffled 52 card decks as a numpy array
+
+@author Chris P.
+@created 2021-01-18 YMD
+"""
+class ShuffleEngine():
+	"""__init__
+	Default Constructor - creates an engine for the given seed
+	@param seed : int - the seed. None picks a random seed, which is kept in self.seed so
+		the game can still be replayed
+	@param path : (int) - the spawn indexes that led to this engine, () for a root engine
+	"""
+	def __init__(self, seed=None, path=()):
+		if seed is None:
+			seed = random.SystemRandom().getrandbits(64)
+		self.seed = seed
+		self.path = path
+		self.random = random.Random(_deriveSeed(seed, path))
+		self.children = 0
+		self._generator = None
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" spawn(count)
+	Creates child engines with independent streams. Calling spawn again continues the
+		numbering, so children are never handed out twice
+	@param count : int - how many engines to create
+	@return [ShuffleEngine]
+	"""
+	def spawn(self, count):
+		children = [ShuffleEngine(self.seed, self.path + (self.children + i,)) for i in range(0, count)]
+		self.children += count
+		return children
+
+	""" shuffle(cards)
+	Shuffles a list in place (Fisher-Yates on this engine's stream)
+	@param cards : list - the list to shuffle, e.g. Pile.cards
+	"""
+	def shuffle(self, cards):
+		self.random.shuffle(cards)
+
+	""" permutation(size)
+	@param size : int - how many items to permute. Default is one deck
+	@return [int] - a shuffled list of range(size)
+	"""
+	def permutation(self, size=52):
+		output = list(range(0, size))
+		self.random.shuffle(output)
+		return output
+
+	""" permutations(count, size)
+	Many shuffles at once for simulations. Draws a random key per card and argsorts the
+		keys, which shuffles every row in one numpy call. Needs numpy.
+	@param count : int - how many shuffled decks to make
+	@param size : int - cards per deck. Default is one deck
+	@return numpy.ndarray of shape (count, size) and dtype uint8 - each row is a shuffled
+		range(size)
+	"""
+	def permutations(self, count, size=52):
+		# Optional import - numpy is slow to import and only needed here
+		import numpy
+		if self._generator is None:
+			self._generator = numpy.random.Generator(numpy.random.PCG64(_deriveSeed(self.seed, self.path + (-1,))))
+		keys = self._generator.random((count, size))
+		return numpy.argsort(keys, axis=1).astype(numpy.uint8 if size <= 256 else numpy.uint16)
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __repr__(self):
+		return "ShuffleEngine(seed={}, path={})".format(self.seed, self.path)
+
+
+
+""" _deriveSeed(seed, path)
+Hashes a seed and a spawn path into a 128 bit seed. Hashing keeps sibling streams apart
+	even for neighbouring seeds like 1 and 2
+"""
+def _deriveSeed(seed, path):
+	text = "{}/{}".format(seed, "/".join(str(i) for i in path))
+	return int.from_bytes(hashlib.sha256(text.encode()).digest()[:16], "little")
@@ -0,0 +1,400 @@
+# Local imports
+from .rules import RANKS, NO_TRUMP, trickWinner
+from .bitpile import SUIT_MASKS
+from .transposition import TranspositionTable
+
+""" _buildBeats()
+BEATS[lead][trump][rank] is the mask of the card IDs that rank above rank in RANKS[lead][trump]
+"""
+def _buildBeats():
+	beats = []
+	for lead in range(0, 4):
+		tables = []
+		for table in RANKS[lead]:
+			tables.append(tuple(sum(1 << id_ for id_ in range(0, 52) if table[id_] > rank) for rank in range(0, 28)))
+		beats.append(tuple(tables))
+	return tuple(beats)
+
+BEATS = _buildBeats()
+
+# Most entries DoubleDummySolver keeps in each of its lookups before starting over
+MEMO_SIZE = 1 << 16
+
+"""=================================================================================
+DoubleDummySolver Class
+================================================================================="""
+
+""" DoubleDummySolver Class
+Finds how many of the remaining tricks a player takes with perfect play when every
+	hand is known (double dummy), eg. for post-game analysis or inside sampling.
+
+	With more than two players "perfect play" is taken as the player against everyone
+	else: the player tries to take as many tricks as they can while the others all play
+	to stop them. Each solve asks "can the player take 1 trick, 2 tricks, ..." until
+	the answer is no, every question a null window alpha-beta search over every card of
+	the remaining tricks:
+
+	- Equivalent cards: cards of one suit in the same hand with no other live card
+		between them win and lose the same tricks, so only one of them is searched
+	- Ordering: the player tries to take the trick first, the others try to take it
+		from them while they are winning it and play low otherwise
+	- Quick bounds: the leader's tricks off the top of their suits and the sure trump
+		tricks of every hand end a search between tricks without playing it out (see
+		_bounds()). Inside a trick the search ends once the trick is lost for the
+		player, or won with nothing left to beat them and only one trick to find
+	- Transposition table: the bounds found for the positions between tricks are kept
+		in a TranspositionTable keyed on the cards left in every hand by rank among the
+		cards left, and the leader. Entries keep the whole position, so two positions
+		with the same 64 bit key never share bounds. The table is kept across the
+		questions and across solves. Positions inside a trick aren't kept, they are
+		only reached again through the position their trick started from, which the
+		table answers first
+
+	solver = DoubleDummySolver()
+	solver.solveGame(gamestate)			# [tricks] by player index, from the current trick
+
+	Hands are 52 bit card masks (bit i for card ID i) of a single deck.
+
+@author Chris P.
+@created 2021-02-03 YMD
+"""
+class DoubleDummySolver():
+	"""__init__
+	@param size : int - buckets of the transposition table. Default is 65536
+	"""
+	def __init__(self, size=1 << 16):
+		self.table = TranspositionTable(size)
+		self.suits = {} # _suitInfo() of every suit seen, by the masks of the suit
+		self.moves = {} # _representatives() by (legal, live)
+		self.nodes = 0
+		self.count = 0
+		self.trump = NO_TRUMP
+		self.target = None
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" solve(hands, trump, leader, target, played)
+	@param hands : [int] - the card mask of every player's hand, by player index
+	@param trump : int - the trump suit, None if there is none
+	@param leader : int - index of the player who leads (or led) the current trick
+	@param target : int - index of the player to solve for
+	@param played : [int] - IDs of the cards already played to the current trick, in
+		order. Default is none
+	@return : int - the tricks target takes from here, counting the current one
+	@raise ValueError if the hands don't hold the same number of cards
+	"""
+	def solve(self, hands, trump, leader, target, played=()):
+		count = len(hands)
+		sizes = [(hands[(leader + k) % count]).bit_count() + (1 if k < len(played) else 0) for k in range(0, count)]
+		if min(sizes) != max(sizes):
+			raise ValueError("DoubleDummySolver: every hand has to hold as many cards, {}".format(sizes))
+		self.count = count
+		self.trump = NO_TRUMP if trump is None else trump
+		self.target = target
+		lead = played[0] // 13 if played else None
+		hands = list(hands)
+		played = tuple(played)
+		live = best = seat = 0
+		if played:
+			for mask in hands:
+				live |= mask
+			table = RANKS[lead][self.trump]
+			for k, card in enumerate(played):
+				live |= 1 << card
+				if table[card] > best:
+					best = table[card]
+					seat = (leader + k) % count
+		# Ask "does target take at least need tricks" for need = 1, 2, ... until it doesn't
+		need = 1
+		while need <= sizes[0] and self._search(hands, leader, played, lead, need, live, best, seat):
+			need += 1
+		return need - 1
+
+	""" solveAll(hands, trump, leader, played)
+	@return : [int] - solve() for every player, by player index. With more than two
+		players these don't have to add up to the tricks left, each is the most that
+		player can take against everyone else
+	"""
+	def solveAll(self, hands, trump, leader, played=()):
+		return [self.solve(hands, trump, leader, target, played) for target in range(0, len(hands))]
+
+	""" solveGame(gamestate, target, leader)
+	Solves the current trick and the rest of the round of a Gamestate being played by
+		OhHellRules: the hands of the players, the trick on pile 0 and trump_suit
+	@param gamestate : Gamestate - the game
+	@param target : int - the player to solve for. Default is None, every player
+	@param leader : int - who leads the current trick. Default is the "leader" attribute
+	@return : int or [int] - solve() for target, or solveAll()
+	"""
+	def solveGame(self, gamestate, target=None, leader=None):
+		if leader is None:
+			leader = gamestate.attributes.get("leader", 0)
+		hands = []
+		for player in gamestate.players:
+			mask = 0
+			for card in player.hand.cards:
+				mask |= 1 << card.id
+			hands.append(mask)
+		pile = gamestate.piles.get(0)
+		played = [] if pile is None else [card.id for card in reversed(pile.cards)] # Pushed onto the front
+		trump = gamestate.attributes.get("trump_suit")
+		if target is None:
+			return self.solveAll(hands, trump, leader, played)
+		return self.solve(hands, trump, leader, target, played)
+
+	# ------------------------------------------------------------------------------
+	# Private Methods
+
+	""" _search(hands, leader, played, lead, need, live, best, seat)
+	The null window search: can target take need tricks from here against everyone else
+	@param hands : [int] - the card masks of the hands, by player index
+	@param leader : int - index of the player who led the current trick
+	@param played : (int) - IDs of the cards played to the current trick
+	@param lead : int - the suit led, None if nothing has been played
+	@param need : int - the tricks target has to take
+	@param live : int - mask of the cards in the hands when the trick started, with the
+		ones played to it since. Worked out here between tricks
+	@param best : int - rank in RANKS[lead][trump] of the card winning the current trick
+	@param seat : int - index of the player who played it
+	@return : boolean - True if target takes at least need tricks
+	"""
+	def _search(self, hands, leader, played, lead, need, live=0, best=0, seat=0):
+		self.nodes += 1
+		count = self.count
+		trump = self.trump
+		target = self.target
+		mover = (leader + len(played)) % count
+		hand = hands[mover]
+		left = hand.bit_count() # Tricks left, counting the current one
+		if need <= 0:
+			return True
+		if need > left:
+			return False
+
+		key = None
+		if not played:
+			if left == 1:
+				# Everyone plays their last card
+				cards = [(hands[(leader + k) % count]).bit_length() - 1 for k in range(0, count)]
+				return (leader + trickWinner(cards[0] // 13, trump, cards)) % count == target
+			# Only positions between tricks are kept, they are the ones reached many ways.
+			# Cards are keyed by rank among the cards left, so eg. holding the 9 with the 10
+			# gone is the same position as holding the 10
+			suits = self._suits(hands)
+			low, high = self._bounds(suits, leader, left)
+			if low >= need:
+				return True
+			if high < need:
+				return False
+			position = (target, trump, leader, suits[0][0], suits[1][0], suits[2][0], suits[3][0])
+			key = hash(position) & 0xFFFFFFFFFFFFFFFF
+			entry = self.table.lookup(key, left)
+			if entry is not None and entry[2] != position:
+				entry = None # Another position with the same key
+			if entry is not None:
+				if entry[0] >= need:
+					return True
+				if entry[1] < need:
+					return False
+			live = 0
+			for mask in hands:
+				live |= mask
+			legal = hand
+			scope = live
+		else:
+			# Tricks target can't win, or wins whatever the others play, end the search early
+			beats = BEATS[lead][trump][best]
+			if (target - leader) % count < len(played):
+				if seat != target:
+					if need >= left:
+						return False
+				elif need == 1:
+					for k in range(len(played), count):
+						other = hands[(leader + k) % count]
+						if (other & SUIT_MASKS[lead] or other) & beats:
+							break
+					else:
+						return True
+			elif need >= left:
+				other = hands[target]
+				if not (other & SUIT_MASKS[lead] or other) & beats:
+					return False
+			if hand & SUIT_MASKS[lead]:
+				# Only the cards of the suit led can come between the ones followed with
+				legal = hand & SUIT_MASKS[lead]
+				scope = live & SUIT_MASKS[lead]
+			else:
+				legal = hand
+				scope = live
+
+		cards = self.moves.get((legal, scope))
+		if cards is None:
+			if len(self.moves) >= MEMO_SIZE:
+				self.moves.clear()
+			cards = self.moves[(legal, scope)] = _representatives(legal, scope)
+
+		# Target takes the trick if they can, the others take it from target while target
+		# is winning and otherwise play low. Cards of a new trick go highest first
+		maximize = mover == target
+		if played:
+			table = RANKS[lead][trump]
+			if maximize or seat == target:
+				cards = [card for card in cards if table[card] > best] + [card for card in reversed(cards) if table[card] <= best]
+			else:
+				cards = cards[::-1]
+
+		last = len(played) + 1 == count
+		result = not maximize
+		for card in cards:
+			if not played:
+				rank, winner = RANKS[card // 13][trump][card], mover
+			elif table[card] > best:
+				rank, winner = table[card], mover
+			else:
+				rank, winner = best, seat
+			hands[mover] = hand & ~(1 << card)
+			if last:
+				value = self._search(hands, winner, (), None, need - 1 if winner == target else need)
+			else:
+				value = self._search(hands, leader, played + (card,), card // 13 if lead is None else lead, need, live, rank, winner)
+			hands[mover] = hand
+			if value == maximize:
+				result = value
+				break
+
+		if key is not None:
+			lower, upper = entry[0:2] if entry is not None else (0, left)
+			self.table.store(key, left, (max(lower, need), upper, position) if result else (lower, min(upper, need - 1), position))
+		return result
+
+	""" _bounds(suits, leader, left)
+	Quick bounds between tricks, from what _suitInfo() knows of every suit:
+	- The leader takes the tricks they can cash from the top of their suits, outside
+		trump no more of them than the shortest holding of the suit among the others
+		who could ruff
+	- Of the i highest trumps of a hand, no more than the trumps of the others above
+		the i-th one can be beaten, so the rest take tricks. For target that is a least,
+		for the others a most (left less their sure trump tricks)
+	@param suits : [tuple] - _suits() of the hands
+	@param leader : int - index of the player on lead
+	@param left : int - tricks left
+	@return : (int, int) - the least and the most tricks target can take
+	"""
+	def _bounds(self, suits, leader, left):
+		trump = self.trump
+		ruffers = ()
+		if trump != NO_TRUMP:
+			lengths = suits[trump][1]
+			ruffers = [i for i in range(0, self.count) if i != leader and lengths[i]]
+		quick = 0
+		for suit, info in enumerate(suits):
+			tricks = info[2][leader]
+			if tricks and suit != trump:
+				for i in ruffers:
+					tricks = min(tricks, info[1][i])
+			quick += tricks
+		if leader == self.target:
+			low, high = quick, left
+		else:
+			low, high = 0, left - quick
+		if trump == NO_TRUMP:
+			return (low, high)
+		sure, lost = suits[trump][3][self.target]
+		return (max(low, sure), min(high, left - lost))
+
+	""" _suits(hands)
+	@param hands : [int] - the card masks of the hands
+	@return : [tuple] - _suitInfo() of every suit, looked up in self.suits
+	"""
+	def _suits(self, hands):
+		suits = self.suits
+		if len(suits) >= MEMO_SIZE:
+			suits.clear()
+		infos = []
+		for shift in (0, 13, 26, 39):
+			masks = tuple([mask >> shift & 0x1FFF for mask in hands])
+			info = suits.get(masks)
+			if info is None:
+				info = suits[masks] = _suitInfo(masks)
+			infos.append(info)
+		return infos
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __repr__(self):
+		return "DoubleDummySolver({} nodes searched)".format(self.nodes)
+
+""" _suitInfo(masks)
+What the search needs to know of one suit between tricks
+@param masks : (int) - the 13 bit mask of the suit in every hand
+@return : (ranks, lengths, tops, trumps) - by hand: the mask renumbered by rank among the
+	cards of the suit left in any hand (so cards played earlier leave no gaps, eg.
+	holding the 9 with the 10 gone is the same as holding the 10), the cards held,
+	the cards above all of the other hands' and, if the suit is trump, (the sure
+	trump tricks, the most trump tricks the others take for sure) of the hand
+"""
+def _suitInfo(masks):
+	count = len(masks)
+	ranks = [0] * count
+	rank = 1
+	for bit in range(0, 13):
+		bit = 1 << bit
+		for i, mask in enumerate(masks):
+			if mask & bit:
+				ranks[i] |= rank
+				rank <<= 1
+				break
+	lengths = []
+	tops = []
+	trumps = []
+	for i, mask in enumerate(masks):
+		others = 0
+		lost = 0
+		for j, other in enumerate(masks):
+			if j != i:
+				others |= other
+				lost = max(lost, _trumpTricks(other, mask))
+		lengths.append(mask.bit_count())
+		tops.append((mask >> others.bit_length()).bit_count())
+		trumps.append((_trumpTricks(mask, others), lost))
+	return (tuple(ranks), tuple(lengths), tuple(tops), tuple(trumps))
+
+""" _trumpTricks(own, others)
+Of the i highest trumps of a hand, no more than the trumps of the others above the i-th
+	one can be beaten, as every card beats one trick at most
+@param own : int - the trumps of the hand
+@param others : int - the trumps of the other hands
+@return : int - the tricks the trumps of the hand take for sure
+"""
+def _trumpTricks(own, others):
+	sure = 0
+	i = 0
+	while own:
+		card = own.bit_length() - 1
+		own ^= 1 << card
+		i += 1
+		sure = max(sure, i - (others >> card).bit_count())
+	return sure
+
+""" _representatives(legal, live)
+One card of every run of equivalent cards: cards of a suit in legal with no live card
+	of another hand between them
+@param legal : int - mask of the cards the mover may play
+@param live : int - mask of every card still in a hand or on the current trick
+@return : [int] - card IDs, highest of each run, high cards first. Cards of a value go
+	by suit, hearts, clubs, diamonds then spades (highest ID first)
+"""
+def _representatives(legal, live):
+	others = live & ~legal
+	cards = []
+	last = 64
+	while legal:
+		id_ = legal.bit_length() - 1
+		legal ^= 1 << id_
+		if last // 13 != id_ // 13 or others & ((1 << last) - (2 << id_)):
+			cards.append(id_)
+		last = id_
+	cards.sort(key=lambda id_: -(id_ % 13))
+	return cards
@@ -0,0 +1,80 @@
+import unittest
+from io import StringIO
+
+# Local imports
+from ..actionlog import *
+from ..error import ERROR
+
+"""=================================================================================
+ActionLog Class Unit Tests
+================================================================================="""
+
+class TestActionLogClass(unittest.TestCase):
+	def test_pack(self):
+		for args in [(MOVE, 0, 1, 51, 0, False), (POINT, 2047, -2048, 0, REF_MASK, True), (TURN, -1, 3, 7, 12345, False)]:
+			record = pack(*args)
+			self.assertTrue(0 <= record < 1 << 64)
+			type_, src, dst, card, ref, linked = args
+			self.assertEqual(unpack(record), (type_, linked, src, dst, card, ref))
+
+	def test_push_pop(self):
+		log = ActionLog()
+		self.assertEqual(log.pop(), None)
+		log.push(pack(MOVE, 0, 2, 10))
+		log.pushValue(pack(ATTRIBUTE, linked=True), ("trump", 3))
+		log.push(pack(TURN))
+		self.assertEqual(len(log), 3)
+		self.assertEqual(log.nbytes(), 24)
+		self.assertEqual([r[0] for r in log], [MOVE, ATTRIBUTE, TURN])
+
+		self.assertEqual(log.pop(), (TURN, False, 0, 0, 0, 0))
+		self.assertEqual(log.pop(), (ATTRIBUTE, True, 0, 0, 0, ("trump", 3)))
+		self.assertEqual(log.values, {})
+		self.assertEqual(log.pop(), (MOVE, False, 0, 2, 10, 0))
+		self.assertEqual(len(log), 0)
+
+	def test_ring_buffer(self):
+		log = ActionLog(3)
+		log.pushValue(pack(ATTRIBUTE), ("a", 1))
+		for card in range(0, 4):
+			log.push(pack(MOVE, 0, 1, card))
+		# The oldest records are forgotten along with their values
+		self.assertEqual(len(log), 3)
+		self.assertEqual(log.nbytes(), 24)
+		self.assertEqual(log.values, {})
+		self.assertEqual([r[4] for r in log], [1, 2, 3])
+		self.assertEqual([log.pop()[4] for i in range(0, 3)], [3, 2, 1])
+		self.assertEqual(log.pop(), None)
+
+		log.push(pack(ROUND))
+		self.assertEqual(list(log), [(ROUND, False, 0, 0, 0, 0)])
+		log.clear()
+		self.assertEqual(len(log), 0)
+
+	def test_ring_buffer_actions(self):
+		log = ActionLog(4)
+		log.push(pack(MOVE, 0, 1, 0))
+		log.push(pack(MOVE, 0, 1, 1, linked=True))
+		log.pushValue(pack(REMOVE_PILE, -1, linked=True), "pile")
+		log.push(pack(TURN))
+		# Forgetting the first record of an action forgets all of it
+		log.push(pack(ROUND))
+		self.assertEqual([r[0] for r in log], [TURN, ROUND])
+		self.assertEqual(log.values, {})
+		self.assertFalse(next(iter(log))[1])
+
+		# An action longer than the log isn't kept at all
+		log.push(pack(MOVE, 0, 1, 5))
+		for card in range(6, 10):
+			log.pushValue(pack(REMOVE_PILE, -1, 0, card, linked=True), card)
+		self.assertEqual(len(log), 0)
+		self.assertEqual(log.values, {})
+		log.push(pack(TURN))
+		self.assertEqual(log.pop(), (TURN, False, 0, 0, 0, 0))
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
@@ -0,0 +1,82 @@
+import importlib.util
+import unittest
+
+# Local imports
+from ..card import Card
+from ..dealer import Dealer
+from ..shuffle import ShuffleEngine
+from ..headless import newGame
+from ..rules import OhHellRules
+from ..advisor import BidAdvisor, AdvisedStrategy, canonicalHand
+
+"""=================================================================================
+BidAdvisor Unit Tests
+================================================================================="""
+
+NO_NUMPY = importlib.util.find_spec("numpy") is None
+
+class TestBidAdvisor(unittest.TestCase):
+	def setUp(self):
+		self.hand = [Card(14, 0), Card(13, 0), Card(2, 1), Card(5, 2), Card(14, 3)]
+
+	def test_canonicalHand(self):
+		key, hand, visible, trump = canonicalHand([card.id for card in self.hand], 3, [Card(4, 3).id])
+		self.assertEqual(trump, 0)
+		self.assertIn(Card(14, 0).id, hand) # Trump is relabeled to suit 0
+		self.assertEqual(visible, [Card(4, 0).id])
+
+		# Swapping plain suits gives the same key, swapping with trump doesn't
+		swapped = [Card(14, 1), Card(13, 1), Card(2, 2), Card(5, 0), Card(14, 3)]
+		self.assertEqual(canonicalHand([card.id for card in swapped], 3, [Card(4, 3).id])[0], key)
+		self.assertNotEqual(canonicalHand([card.id for card in swapped], 1, [Card(4, 3).id])[0], key)
+		self.assertNotEqual(canonicalHand([card.id for card in self.hand], None)[0], canonicalHand([card.id for card in self.hand], 3)[0])
+
+	@unittest.skipIf(NO_NUMPY, "numpy is not installed")
+	def test_distribution(self):
+		advisor = BidAdvisor(samples=500)
+		odds = advisor.distribution(self.hand, 3, 0, 4)
+		self.assertEqual(len(odds), 6)
+		self.assertAlmostEqual(sum(odds), 1.0)
+		self.assertGreater(advisor.expectedTricks(self.hand, 3, 0, 4), 1)
+
+		# Certain hands
+		self.assertEqual(advisor.distribution([Card(14, 3)], 3, 1, 4), (0.0, 1.0))
+		cards = [Card(value, suit) for suit in range(0, 4) for value in range(2, 15)]
+		self.assertEqual(advisor.distribution(cards[39:], 3, 0, 4)[13], 1.0)
+
+		self.assertRaises(ValueError, advisor.distribution, [Card(2, 0), Card(2, 0)], 3, 0, 4)
+		self.assertRaises(ValueError, advisor.distribution, cards[:14], 3, 0, 4)
+
+	@unittest.skipIf(NO_NUMPY, "numpy is not installed")
+	def test_cache(self):
+		advisor = BidAdvisor(samples=200, cache_size=2)
+		odds = advisor.distribution(self.hand, 3, 0, 4)
+		swapped = [Card(14, 1), Card(13, 1), Card(2, 2), Card(5, 0), Card(14, 3)]
+		self.assertIs(advisor.distribution(swapped, 3, 0, 4), odds)
+		self.assertEqual((advisor.hits, advisor.misses), (1, 1))
+
+		# Least recently used goes first
+		advisor.distribution(self.hand, 3, 1, 4)
+		advisor.distribution(self.hand, 3, 0, 4)
+		advisor.distribution(self.hand, 3, 2, 4)
+		self.assertEqual(len(advisor), 2)
+		self.assertIs(advisor.distribution(self.hand, 3, 0, 4), odds)
+
+		# The same answer from a fresh advisor with the same seed
+		self.assertEqual(BidAdvisor(samples=200).distribution(self.hand, 3, 0, 4), odds)
+
+	@unittest.skipIf(NO_NUMPY, "numpy is not installed")
+	def test_advise(self):
+		advisor = BidAdvisor(samples=200)
+		self.assertEqual(advisor.advise([Card(14, 3)], 3, 0, 4), 1)
+		self.assertEqual(advisor.advise([Card(14, 3)], 3, 0, 4, [0]), 0)
+
+		asked = advisor.hits + advisor.misses
+		gamestate = newGame(4)
+		rules = OhHellRules(gamestate, Dealer(ShuffleEngine(4)), AdvisedStrategy(advisor))
+		self.assertTrue(rules.playRound(3, 0))
+		self.assertNotEqual(sum(rules.bids), 3)
+		self.assertEqual(advisor.hits + advisor.misses, asked + 4)
+
+if __name__ == '__main__':
+	unittest.main()
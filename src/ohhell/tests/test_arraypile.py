@@ -0,0 +1,121 @@
+import unittest
+import random
+from io import StringIO
+
+# Local imports
+from ..card import Card
+from ..pile import Pile
+from ..arraypile import ArrayPile
+from ..error import ERROR
+
+"""=================================================================================
+ArrayPile Class Unit Tests
+================================================================================="""
+
+class TestArrayPileClass(unittest.TestCase):
+	def setUp(self):
+		self.poker1 = ArrayPile(2)
+		self.rumy_table = ArrayPile(enforce_order=True)
+		self.rumy1 = ArrayPile()
+
+	# The same cases as TestPileClass, an ArrayPile should behave like a Pile
+	def test_inserts(self):
+		self.assertTrue(self.poker1.insert(Card.fromID(47)))
+		self.assertTrue(self.poker1.insert(Card.fromID(33)))
+		self.assertFalse(self.poker1.insert(Card.fromID(21)))
+		self.assertEqual(self.poker1.__str__(),"[9 of Clubs, 10 of Hearts]")
+		self.assertFalse(self.poker1.append(Card.fromID(21)))
+		self.assertEqual(self.poker1.__str__(),"[9 of Clubs, 10 of Hearts]")
+
+	def test_enforce_order(self):
+		self.rumy_table.push(Card.fromID(33))
+		self.rumy_table.push(Card.fromID(47))
+		self.rumy_table.push(Card.fromID(21))
+		self.assertEqual(self.rumy_table.__str__(), "[10 of Diamonds, 10 of Hearts, 9 of Clubs]")
+		self.rumy_table.sort()
+		self.assertEqual(self.rumy_table.__str__(), "[10 of Diamonds, 10 of Hearts, 9 of Clubs]")
+
+	def test_pile_contains(self):
+		self.rumy1.push(Card.fromID(33))
+		self.rumy1.push(Card.fromID(47))
+		self.rumy1.push(Card.fromID(21))
+		self.assertTrue(Card.fromID(47) in self.rumy1)
+		self.assertTrue(Card(10,3) in self.rumy1)
+		self.assertFalse(Card.fromID(48) in self.rumy1)
+		self.assertFalse("Hello World" in self.rumy1)
+		self.assertFalse(7 in self.rumy1)
+
+	def test_sort_hard(self):
+		nums = list(range(0, 52)) * 2
+		random.shuffle(nums)
+		deck = ArrayPile.fromList(nums)
+		pile = Pile.fromList(nums)
+		self.assertEqual(str(deck), str(pile))
+		deck.sort()
+		pile.sort()
+		self.assertEqual(str(deck), str(pile))
+
+	def test_push_pop_insert_remove(self):
+		# Random operations should leave an ArrayPile and a Pile with the same cards in the same order
+		pile = Pile()
+		for step in range(0, 300):
+			card = Card.fromID(random.randrange(0, 52))
+			op = random.randrange(0, 5)
+			if op == 0 or len(pile) == 0:
+				pile.push(card)
+				self.rumy1.push(card)
+			elif op == 1:
+				pile.append(card)
+				self.rumy1.append(card)
+			elif op == 2:
+				location = random.randrange(0, len(pile) + 1)
+				pile.insert(card, location)
+				self.rumy1.insert(card, location)
+			elif op == 3:
+				self.assertEqual(pile.pop(), self.rumy1.pop())
+			else:
+				top = pile.cards[random.randrange(0, len(pile))]
+				pile.remove(top)
+				self.rumy1.remove(top)
+			self.assertEqual(self.rumy1.cards, pile.cards)
+			self.assertEqual(self.rumy1.counts, pile.counts)
+			self.assertEqual(self.rumy1.suit_counts, pile.suit_counts)
+		with self.assertRaises(ValueError):
+			ArrayPile().remove(Card(2,0))
+
+	def test_views(self):
+		deck = ArrayPile.fromList([0, 1, 2, 3, 4])
+		view = deck.topView(2)
+		self.assertEqual(list(view), [1, 0])
+		self.assertTrue(view.readonly)
+		with self.assertRaises(TypeError):
+			view[0] = 7
+		view.release()
+		self.assertEqual(list(deck.view()), [4, 3, 2, 1, 0])
+
+		deck.extend([Card.fromID(5), Card.fromID(6)])
+		self.assertEqual(deck.cards[-3:], [Card.fromID(4), Card.fromID(5), Card.fromID(6)])
+		self.assertEqual(deck.draw(5), Pile.fromList([0, 1, 2, 3, 4]).cards)
+		deck = ArrayPile.fromList([0, 1, 2, 3, 4])
+		self.assertEqual(deck.draw(2), [Card.fromID(0), Card.fromID(1)])
+		self.assertEqual(deck.draw(10), [Card.fromID(2), Card.fromID(3), Card.fromID(4)])
+		self.assertEqual(len(deck), 0)
+
+	def test_version(self):
+		version = self.rumy1.version
+		self.rumy1.push(Card(4,2))
+		self.rumy1.append(Card(5,2))
+		self.rumy1.remove(Card(4,2))
+		self.rumy1.extend([Card(6,2), Card(7,2)])
+		self.rumy1.sort()
+		self.rumy1.pop()
+		self.rumy1.draw(1)
+		self.rumy1.clear()
+		self.assertEqual(self.rumy1.version, version + 8)
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import random
+from io import StringIO
+
+# Local imports
+from ..card import Card
+from ..pile import Pile
+from ..bitpile import BitPile
+from ..error import ERROR
+
+"""=================================================================================
+BitPile Class Unit Tests
+================================================================================="""
+
+class TestBitPileClass(unittest.TestCase):
+	def setUp(self):
+		self.hand = BitPile()
+		self.small = BitPile(2)
+
+	def test_inserts(self):
+		self.assertTrue(self.small.insert(Card.fromID(47)))
+		self.assertTrue(self.small.push(Card.fromID(33)))
+		self.assertFalse(self.small.append(Card.fromID(21)))
+		self.assertEqual(self.small.__str__(), "[9 of Clubs, 10 of Hearts]")
+		self.assertEqual(len(self.small), 2)
+
+		# No duplicates
+		self.assertTrue(self.hand.push(Card.fromID(47)))
+		self.assertFalse(self.hand.push(Card(10,3)))
+		self.assertEqual(len(self.hand), 1)
+
+	def test_contains_remove(self):
+		for i in [33, 47, 21]:
+			self.hand.push(Card.fromID(i))
+		self.assertTrue(Card.fromID(47) in self.hand)
+		self.assertTrue(Card(10,3) in self.hand)
+		self.assertFalse(Card.fromID(48) in self.hand)
+		self.assertFalse("Hello World" in self.hand)
+		self.assertFalse(7 in self.hand)
+
+		self.hand.remove(Card(10,3))
+		self.assertFalse(Card(10,3) in self.hand)
+		with self.assertRaises(ValueError):
+			self.hand.remove(Card(10,3))
+
+		self.assertEqual(self.hand.pop(), Card.fromID(21))
+		self.assertEqual(self.hand.pop(), Card.fromID(33))
+		with self.assertRaises(IndexError):
+			self.hand.pop()
+
+	def test_suits(self):
+		self.hand = BitPile.fromList([0, 5, 12, 13, 40, 51])
+		self.assertEqual(self.hand.countSuit(0), 3)
+		self.assertEqual(self.hand.countSuit(1), 1)
+		self.assertEqual(self.hand.countSuit(2), 0)
+		self.assertEqual(self.hand.countSuit(3), 2)
+		self.assertEqual(self.hand.count(Card.fromID(40)), 1)
+		self.assertEqual(self.hand.count(Card.fromID(41)), 0)
+		self.assertEqual(str(self.hand.getSuit(3)), "[3 of Hearts, Ace of Hearts]")
+
+	def test_set_operations(self):
+		a = BitPile.fromList([0, 1, 2, 3])
+		b = BitPile.fromList([2, 3, 4])
+		self.assertEqual([c.getID() for c in a | b], [0, 1, 2, 3, 4])
+		self.assertEqual([c.getID() for c in a & b], [2, 3])
+		self.assertEqual([c.getID() for c in a - b], [0, 1])
+		self.assertEqual([c.getID() for c in a - Pile.fromList([0, 3])], [1, 2])
+		a -= b
+		self.assertEqual(a, BitPile.fromList([1, 0]))
+
+		self.assertTrue(a.extend([Card.fromID(7), Card.fromID(9)]))
+		self.assertFalse(a.extend([Card.fromID(7)]))
+		self.assertFalse(a.extend([Card.fromID(8), Card.fromID(8)]))
+		self.assertEqual(a.draw(3), [Card.fromID(0), Card.fromID(1), Card.fromID(7)])
+
+	def test_matches_pile(self):
+		# Random pushes and removes should leave a BitPile and a sorted Pile with the same cards
+		nums = list(range(0, 52))
+		random.shuffle(nums)
+		pile = Pile()
+		for i in nums[:30]:
+			pile.push(Card.fromID(i))
+			self.hand.push(Card.fromID(i))
+		for i in nums[:10]:
+			pile.remove(Card.fromID(i))
+			self.hand.remove(Card.fromID(i))
+		pile.sort()
+		self.assertEqual(str(pile), str(self.hand))
+		self.assertEqual(len(pile), len(self.hand))
+		self.assertEqual(pile.cards, self.hand.cards)
+
+	def test_version(self):
+		version = self.hand.version
+		self.hand.push(Card(4,2))
+		self.hand.remove(Card(4,2))
+		self.hand.extend([Card(5,2), Card(6,2)])
+		self.hand.pop()
+		self.hand |= [Card(7,2)]
+		self.hand -= [Card(7,2)]
+		self.hand.clear()
+		self.assertEqual(self.hand.version, version + 7)
+
+	def test_unionMaxSize(self):
+		pile = BitPile(2)
+		pile |= [Card(2,0), Card(3,0)]
+		pile |= [Card(3,0)] # Already there, still two cards
+		self.assertEqual(len(pile), 2)
+		version = pile.version
+		pile |= [Card(4,0)]
+		self.assertEqual(len(pile), 2)
+		self.assertNotIn(Card(4,0), pile)
+		self.assertEqual(pile.version, version)
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
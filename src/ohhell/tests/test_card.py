@@ -0,0 +1,100 @@
+import unittest
+import pickle
+from io import StringIO
+
+# Local imports
+from ..card import Card, CARDS
+from ..error import ERROR
+
+"""=================================================================================
+Card Class Unit Tests
+=================================================================================""" 
+
+class TestCardClass(unittest.TestCase):
+
+	# Test valid ways to create a card
+	def test_valid_init(self):
+		a = Card(2,1)
+		self.assertEqual(a.getID(),13)
+		self.assertEqual(a.getValue(),2)
+		self.assertEqual(a.getSuit(),1)
+		self.assertEqual(a.__str__(),"2 of Diamonds")
+
+		b = Card.fromID(13)
+		self.assertEqual(a,b)
+		self.assertEqual(b.getID(),13)
+		self.assertEqual(b.getValue(),2)
+		self.assertEqual(b.getSuit(),1)
+		self.assertEqual(b.__str__(),"2 of Diamonds")
+
+		c = Card(7,2)
+		self.assertEqual(c.getID(),31)
+		self.assertEqual(c.getValue(),7)
+		self.assertEqual(c.getSuit(),2)
+		self.assertEqual(c.__str__(),"7 of Clubs")
+
+		d = Card.fromID(31)
+		self.assertEqual(c,d)
+		self.assertEqual(d.getID(),31)
+		self.assertEqual(d.getValue(),7)
+		self.assertEqual(d.getSuit(),2)
+		self.assertEqual(d.__str__(),"7 of Clubs")
+
+	# Test invalid creations
+	def test_invalid_init(self):
+		a = Card(47,2)
+		self.assertEqual(a.getValue(),2)
+		self.assertEqual(a.getSuit(),2)
+		self.assertEqual(a.__str__(),"2 of Clubs")
+
+		b = Card(0,2)
+		self.assertEqual(b.getValue(),2)
+		self.assertEqual(b.getSuit(),2)
+		self.assertEqual(b.__str__(),"2 of Clubs")
+
+		c = Card(5,-1)
+		self.assertEqual(c.getValue(),5)
+		self.assertEqual(c.getSuit(),0)
+		self.assertEqual(c.__str__(),"5 of Spades")
+
+		d = Card(5,4)
+		self.assertEqual(d.getValue(),5)
+		self.assertEqual(d.getSuit(),0)
+		self.assertEqual(d.__str__(),"5 of Spades")
+
+		e = Card.fromID(-1)
+		self.assertEqual(e.getValue(),2)
+		self.assertEqual(e.getSuit(),0)
+		self.assertEqual(e.__str__(),"2 of Spades")
+
+		f = Card.fromID(52)
+		self.assertEqual(f.getValue(),2)
+		self.assertEqual(f.getSuit(),0)
+		self.assertEqual(f.__str__(),"2 of Spades")
+
+	# Test that every way of making a card hands back the same shared object
+	def test_flyweight(self):
+		a = Card(7,2)
+		b = Card.fromID(31)
+		self.assertTrue(a is b)
+		self.assertTrue(Card.fromID(52) is Card(2,0))
+		self.assertEqual(len(CARDS), 52)
+		for i, card in enumerate(CARDS):
+			self.assertEqual(card.getID(), i)
+			self.assertTrue(Card(card.getValue(), card.getSuit()) is card)
+
+		# Hashing, ordering and copies
+		self.assertEqual(len({Card(2,1), Card.fromID(13), Card(3,1)}), 2)
+		self.assertTrue(Card(14,0) < Card(2,1))
+		self.assertTrue(Card(2,1) <= Card.fromID(13))
+		self.assertFalse(Card(2,1) == "2 of Diamonds")
+		self.assertTrue(pickle.loads(pickle.dumps(a)) is a)
+		with self.assertRaises(AttributeError):
+			a.colour = "black"
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
\ No newline at end of file
@@ -0,0 +1,67 @@
+import unittest
+from array import array
+from io import StringIO
+
+# Local imports
+from ..card import Card
+from ..codec import *
+from ..error import ERROR
+
+"""=================================================================================
+Card Codec Unit Tests
+================================================================================="""
+
+class TestCodec(unittest.TestCase):
+	def setUp(self):
+		self.cards = [Card.fromID(47), Card.fromID(33), Card(14,0), Card(2,0)]
+
+	def test_ids(self):
+		self.assertEqual(toIDs(self.cards), [47, 33, 12, 0])
+		self.assertEqual(toBytes(self.cards), bytes([47, 33, 12, 0]))
+		self.assertEqual(toArray(self.cards), array('B', [47, 33, 12, 0]))
+		self.assertEqual(fromIDs([47, 33, 12, 0]), self.cards)
+		self.assertTrue(fromIDs([47])[0] is Card.fromID(47))
+		self.assertEqual(fromIDs([]), [])
+
+	def test_buffers(self):
+		data = toBytes(self.cards)
+		self.assertEqual(fromBytes(data), self.cards)
+		self.assertEqual(fromBytes(bytearray(data)), self.cards)
+		self.assertEqual(fromBytes(toArray(self.cards)), self.cards)
+
+		# Decode a slice of a bigger buffer without copying it
+		view = memoryview(b"\x00\x00" + data + b"\x00")[2:6]
+		self.assertEqual(fromBytes(view), self.cards)
+
+		with self.assertRaises(ValueError):
+			fromBytes(bytes([52]))
+		with self.assertRaises(ValueError):
+			fromIDs(["AS"])
+		with self.assertRaises(ValueError):
+			fromIDs([-1])
+
+	def test_short(self):
+		self.assertEqual(toShort(self.cards), "TH9CAS2S")
+		self.assertEqual(toShort(self.cards, " "), "TH 9C AS 2S")
+		self.assertEqual(fromShort("TH9CAS2S"), self.cards)
+		self.assertEqual(fromShort("th, 9c, as, 2s"), self.cards)
+		self.assertEqual(fromShort("TH\t9C\nAS\r\n2S"), self.cards)
+		self.assertEqual(len(SHORT_NAMES), len(set(SHORT_NAMES)))
+		for i in range(0, 52):
+			self.assertEqual(fromShort(SHORT_NAMES[i])[0].getID(), i)
+		with self.assertRaises(ValueError):
+			fromShort("1S")
+		with self.assertRaises(ValueError):
+			fromShort("AS T")
+
+	def test_names(self):
+		self.assertEqual(toNames(self.cards), "[10 of Hearts, 9 of Clubs, Ace of Spades, 2 of Spades]")
+		self.assertEqual(toNames(self.cards), str(self.cards))
+		self.assertEqual(toNames([]), "[]")
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from io import StringIO
+
+# Local imports
+from ..card import Card
+from ..deck_simulation import DeckSimulation
+from ..player import Player
+from ..gamestate import Gamestate
+from ..shuffle import ShuffleEngine
+from ..dealer import Dealer
+from ..error import ERROR
+
+"""=================================================================================
+Dealer Class Unit Tests
+================================================================================="""
+
+class TestDealerClass(unittest.TestCase):
+	def setUp(self):
+		self.players = [Player(name, name + "-1") for name in ["Arron", "Becky", "Chris", "Danny", "Ellen", "Frank", "Gwen"]]
+		self.deck = DeckSimulation(52)
+		for i in range(0, 52):
+			self.deck.append(Card.fromID(i))
+		self.gamestate = Gamestate(self.deck, self.players)
+
+	def test_deal(self):
+		self.assertTrue(Dealer(ShuffleEngine(1)).deal(self.gamestate, 7))
+		self.assertEqual(len(self.deck), 3)
+		seen = set()
+		for player in self.players:
+			self.assertEqual(len(player), 7)
+			seen.update(card.getID() for card in player)
+		seen.update(card.getID() for card in self.deck)
+		self.assertEqual(seen, set(range(0, 52)))
+		for i, player in enumerate(self.players):
+			for card in player:
+				self.assertEqual(self.gamestate.whereIs(card), [("player", i, 1)])
+
+		trump = self.gamestate.attributes.get("trump")
+		self.assertEqual(trump, self.deck.cards[0])
+		self.assertEqual(self.gamestate.attributes.get("trump_suit"), trump.getSuit())
+		self.assertEqual(self.gamestate.attributes.get("hand_size"), 7)
+
+	def test_same_seed_same_deal(self):
+		Dealer(ShuffleEngine(5)).deal(self.gamestate, 5)
+		hands = [player.hand.cards for player in self.players]
+
+		players = [Player(p.getName(), p.getID()) for p in self.players]
+		deck = DeckSimulation(52)
+		for i in range(0, 52):
+			deck.append(Card.fromID(i))
+		Dealer(ShuffleEngine(5)).deal(Gamestate(deck, players), 5)
+		self.assertEqual([player.hand.cards for player in players], hands)
+
+		# A shuffle is a change to the deck
+		version = deck.version
+		deck.shuffle()
+		self.assertEqual(deck.version, version + 1)
+
+	def test_invalid_and_collect(self):
+		# 8 cards for 7 players is too many, nothing should change
+		self.assertFalse(Dealer().deal(self.gamestate, 8))
+		self.assertEqual(len(self.deck), 52)
+		self.assertEqual(self.gamestate.attributes, {})
+
+		# Deal every card, no trump left
+		players = self.players[:4]
+		gamestate = Gamestate(self.deck, players)
+		dealer = Dealer(ShuffleEngine(3))
+		self.assertTrue(dealer.deal(gamestate, 13))
+		self.assertEqual(gamestate.attributes.get("trump"), None)
+		self.assertEqual(gamestate.attributes.get("trump_suit"), None)
+
+		dealer.collect(gamestate)
+		self.assertEqual(len(self.deck), 52)
+		self.assertEqual(sum(len(p) for p in players), 0)
+		self.assertEqual(self.deck.counts, [1] * 52)
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
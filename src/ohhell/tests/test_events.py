@@ -0,0 +1,112 @@
+import unittest
+
+# Local imports
+from ..card import Card
+from ..headless import newGame
+from ..actionlog import MOVE, ATTRIBUTE, REMOVE_PILE, POINT, TURN, MISSING
+from ..events import Event, EventBus, REVERT
+
+"""=================================================================================
+Event Unit Tests
+================================================================================="""
+
+class TestEvents(unittest.TestCase):
+	def setUp(self):
+		self.gamestate = newGame(3)
+		self.events = []
+		self.batches = []
+
+	def test_noSubscribers(self):
+		self.assertIsNone(self.gamestate.events)
+		self.gamestate.dealHands(2)
+		self.gamestate.subscribe(self.events.append)
+		self.assertFalse(self.gamestate.unsubscribe(self.batches.append))
+		self.assertTrue(self.gamestate.unsubscribe(self.events.append))
+		self.assertIsNone(self.gamestate.events)
+
+	def test_single(self):
+		self.gamestate.subscribe(self.events.append)
+		card = self.gamestate.deck.cards[0]
+		player = self.gamestate.players[0]
+		self.gamestate.deckToPlayer(card, player)
+		self.gamestate.setGameAttribute("trump_suit", 1)
+		self.gamestate.addPoint(player, 10)
+		self.gamestate.newTurn()
+		self.assertEqual(self.events, [
+			Event(MOVE, False, 0, 1, card.id, 0),
+			Event(ATTRIBUTE, False, 0, 0, 0, ("trump_suit", MISSING, 1)),
+			Event(POINT, False, 1, 0, 0, 10),
+			Event(TURN)])
+
+		# Undoing sends the undone event
+		self.gamestate.revertLastAction()
+		self.gamestate.revertLastAction()
+		self.assertEqual(self.events[4:], [Event(REVERT, False, 0, 0, 0, Event(TURN)), Event(REVERT, False, 1, 0, 0, Event(POINT, False, 1, 0, 0, 10))])
+
+	def test_batched(self):
+		self.gamestate.subscribe(self.batches.append, batched=True)
+		self.gamestate.subscribe(self.events.append, types=(TURN,))
+		self.gamestate.dealHands(2)
+		self.assertEqual(len(self.batches[0]), 6)
+		self.assertEqual([event.linked for event in self.batches[0]], [False] + [True] * 5)
+		self.gamestate.newTurn()
+		self.assertEqual(self.batches[1], [Event(TURN)])
+		self.assertEqual(self.events, [Event(TURN)])
+
+		# A pile cleared: the moves and the removal come together
+		player = self.gamestate.players[0]
+		self.gamestate.playerToPile(player, 0, player.hand.cards[0])
+		self.gamestate.removePile(0)
+		self.assertEqual([event.type_ for event in self.batches[3]], [MOVE, REMOVE_PILE])
+		self.gamestate.revertLastAction()
+		self.assertEqual([event.value.type_ for event in self.batches[4]], [REMOVE_PILE, MOVE])
+
+	def test_attributesSeen(self):
+		# Subscribers are called after the change, like moves
+		gamestate = self.gamestate
+		seen = []
+		gamestate.subscribe(lambda event: seen.append((event.type_, dict(gamestate.attributes))))
+		gamestate.setGameAttribute("trump_suit", 2)
+		gamestate.setGameAttribute("trump_suit", 3)
+		gamestate.removeGameAttribute("trump_suit")
+		gamestate.setGameAttribute("leader", 1)
+		gamestate.resetAttributes()
+		self.assertEqual([attributes for type_, attributes in seen], [{"trump_suit": 2}, {"trump_suit": 3}, {}, {"leader": 1}, {}])
+		gamestate.revertLastAction()
+		self.assertEqual(seen[-1], (REVERT, {"leader": 1}))
+
+	def test_types(self):
+		self.gamestate.subscribe(self.batches.append, types=(ATTRIBUTE,), batched=True)
+		self.gamestate.dealHands(2)
+		self.gamestate.setGameAttribute("trump_suit", 1)
+		self.assertEqual(self.batches, [[Event(ATTRIBUTE, False, 0, 0, 0, ("trump_suit", MISSING, 1))]])
+
+	def test_raising(self):
+		# A subscriber raising in the middle of an action doesn't leave the action open
+		gamestate = self.gamestate
+		gamestate.subscribe(self.batches.append, batched=True)
+		def fail(event):
+			raise RuntimeError("subscriber")
+		gamestate.subscribe(fail, types=(MOVE, REVERT))
+		self.assertRaises(RuntimeError, gamestate.dealHands, 2)
+		self.assertEqual(gamestate.events.depth, 0)
+		self.assertRaises(RuntimeError, gamestate.revertLastAction)
+		self.assertEqual(gamestate.events.depth, 0)
+		gamestate.unsubscribe(fail)
+		gamestate.newTurn()
+		self.assertEqual([event.type_ for event in self.batches[-1]], [TURN])
+
+	def test_bus(self):
+		bus = EventBus()
+		bus.subscribe(self.batches.append, batched=True)
+		bus.begin()
+		bus.begin()
+		bus.emit(Event(TURN))
+		bus.end()
+		self.assertEqual(self.batches, [])
+		bus.end()
+		self.assertEqual(self.batches, [[Event(TURN)]])
+		self.assertEqual(len(bus), 1)
+
+if __name__ == '__main__':
+	unittest.main()
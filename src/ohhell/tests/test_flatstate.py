@@ -0,0 +1,91 @@
+import unittest
+from io import StringIO
+
+# Local imports
+from ..card import Card
+from ..deck import Deck
+from ..player import Player
+from ..gamestate import Gamestate
+from ..flatstate import FlatState
+from ..error import ERROR
+
+"""=================================================================================
+FlatState Class Unit Tests
+================================================================================="""
+
+class TestFlatStateClass(unittest.TestCase):
+	def setUp(self):
+		deck = Deck(104)
+		for i in range(0, 52):
+			deck.append(Card.fromID(i))
+		self.players = [Player("Arron","A-1"), Player("Becky","B-1"), Player("Chris", "C-1")]
+		self.gamestate = Gamestate(deck, self.players)
+		self.gamestate.dealHands(5)
+		self.gamestate.playerToPile(self.players[0], 0, self.players[0].hand.cards[0])
+		self.gamestate.playerToPile(self.players[1], 0, self.players[1].hand.cards[0])
+		self.gamestate.setGameAttribute("trump_suit", 2)
+		self.gamestate.addPoint(self.players[2], 3)
+
+	def test_fromGamestate(self):
+		state = self.gamestate.fork()
+		for i, player in enumerate(self.players):
+			self.assertEqual(state.hand(i), sorted(card.id for card in player))
+			self.assertEqual(state.handMask(i), sum(1 << card.id for card in player))
+		self.assertEqual(state.pile(0), tuple(card.id for card in self.gamestate.piles[0].cards))
+		self.assertEqual(state.pile(1), ())
+		self.assertEqual(len(state.cardsAt(0)), 37)
+		self.assertEqual(state.getAttribute("trump_suit"), 2)
+		self.assertEqual(state.getPoints(2), 3)
+
+	def test_fork(self):
+		root = self.gamestate.fork()
+		card = self.players[2].hand.cards[0].id
+		child = root.fork()
+		self.assertEqual(child, root)
+
+		# The child changes on its own
+		self.assertTrue(child.move(3, -1, card))
+		self.assertFalse(child.move(3, -1, card))
+		child.setAttribute("trump_suit", 0)
+		child.addPoint(2)
+		child.newTurn()
+		self.assertEqual(child.pile(0)[0], card)
+		self.assertEqual(child.whereIs(card), [-1])
+		self.assertEqual(root.whereIs(card), [3])
+		self.assertEqual(len(root.pile(0)), 2)
+		self.assertEqual(root.getAttribute("trump_suit"), 2)
+		self.assertEqual(root.getPoints(2), 3)
+		self.assertEqual(root.turns, 0)
+
+		# So does the parent, and the Gamestate never changes
+		grandchild = child.fork()
+		child.move(-1, 0, card)
+		self.assertEqual(grandchild.whereIs(card), [-1])
+		self.assertEqual(grandchild.pile(0)[0], card)
+		self.assertEqual(len(child.pile(0)), 2)
+		self.assertTrue(card in [c.id for c in self.players[2]])
+		self.assertFalse(root.move(3, -128, card))
+		self.assertRaises(ValueError, root.move, 3, len(root.points) + 1, card)
+		self.assertRaises(ValueError, root.move, 3, 9, card)
+
+	def test_copies(self):
+		deck = Deck(104)
+		for i in range(0, 52):
+			deck.append(Card.fromID(i))
+			deck.append(Card.fromID(i))
+		players = [Player("Arron","A-1"), Player("Becky","B-1")]
+		gamestate = Gamestate(deck, players)
+		gamestate.deckToPlayer(Card(14,3), players[1])
+		state = gamestate.fork()
+		self.assertEqual(state.copies, 2)
+		self.assertEqual(sorted(state.whereIs(Card(14,3).id)), [0, 2])
+		self.assertTrue(state.move(0, 2, Card(14,3).id))
+		self.assertEqual(state.whereIs(Card(14,3).id), [2, 2])
+		self.assertEqual(state.hand(1), [Card(14,3).id, Card(14,3).id])
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
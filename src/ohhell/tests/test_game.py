@@ -0,0 +1,54 @@
+import unittest
+
+# Local imports
+from ..game import Game
+from ..shuffle import ShuffleEngine
+
+"""=================================================================================
+Game Unit Tests
+================================================================================="""
+
+class TestGame(unittest.TestCase):
+	def test_init(self):
+		game = Game("Oh Hell", players=["Ann", "Bob", "Cy"], seed=1)
+		self.assertEqual([player.getName() for player in game.gamestate.players], ["Ann", "Bob", "Cy"])
+		self.assertEqual([player.getID() for player in game.gamestate.players], ["P1", "P2", "P3"])
+		self.assertEqual(len(game.gamestate.deck), 52)
+		self.assertFalse(game.interactive)
+
+		game = Game("Oh Hell", players=4, num_decks=2)
+		self.assertEqual(game.gamestate.getPlayer("P4").getName(), "Player 4")
+		self.assertEqual(len(game.gamestate.deck), 104)
+
+		self.assertRaises(ValueError, Game, "Oh Hell", 2)
+		self.assertRaises(ValueError, Game, "Oh Hell", 8)
+
+	def test_roundSizes(self):
+		self.assertEqual(Game("Oh Hell", 4).roundSizes(), list(range(1, 13)) + list(range(11, 0, -1)))
+		self.assertEqual(max(Game("Oh Hell", 7).roundSizes()), 7)
+
+	def test_play(self):
+		game = Game("Oh Hell", 5, seed=7)
+		gamestate = game.play()
+		self.assertEqual(gamestate.rounds, len(game.roundSizes()))
+		self.assertEqual(gamestate.turns, sum(game.roundSizes()))
+		self.assertEqual(len(gamestate.deck), 52)
+		self.assertEqual(gamestate.piles, {})
+
+		# The same seed plays the same game
+		again = Game("Oh Hell", 5, seed=ShuffleEngine(7)).play()
+		self.assertEqual(list(again.history), list(gamestate.history))
+		self.assertEqual(again.hash, gamestate.hash)
+
+	def test_noRules(self):
+		# Only Oh Hell has rules, other games are set up but never played
+		game = Game("Rummy", 3, seed=1)
+		self.assertIsNone(game.rules)
+		self.assertFalse(game.playRound(3))
+		self.assertIsNone(game.play())
+		self.assertEqual(len(game.gamestate.deck), 52)
+		self.assertEqual(game.gamestate.rounds, 0)
+		self.assertEqual(len(game.gamestate.history), 0)
+
+if __name__ == '__main__':
+	unittest.main()
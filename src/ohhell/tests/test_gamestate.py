@@ -0,0 +1,451 @@
+import unittest
+from io import StringIO
+
+# Local imports
+from ..card import Card
+from ..pile import Pile
+from ..deck import Deck
+from ..player import Player
+from ..gamestate import Gamestate, DECK, PLAYER, PILE
+from ..actionlog import ActionLog, pack, TURN
+from ..error import ERROR
+
+"""=================================================================================
+Gamestate Class Unit Tests
+=================================================================================""" 
+
+class TestGamestateClass(unittest.TestCase):
+
+	def setUp(self):
+		# Build the deck
+		regular_deck = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51]
+		deck = Deck(52)
+		deck2 = Deck(104)
+		for i in regular_deck:
+			deck.append(Card.fromID(i))
+			deck2.append(Card.fromID(i))
+			deck2.append(Card.fromID(i))
+
+		# Build the players
+		self.players = [Player("Arron","A-1"), Player("Becky","B-1"), Player("Chris", "C-1"), Player("Danny", "D-1",2)]
+		self.single = Gamestate(deck, self.players)
+		self.double = Gamestate(deck2, self.players)
+
+	# ------------------------------------------------------------------------------
+	# Gamestate - ActionFactory interactions
+
+	def test_revertLastAction(self):
+		self.assertFalse(self.single.revertLastAction())
+		before = str(self.single)
+		deck = list(self.single.deck.cards)
+
+		# A round of play, undone one action at a time
+		self.single.setGameAttribute("trump_suit", 2)
+		self.single.setGameAttribute("trump_suit", 3)
+		self.assertTrue(self.single.dealHands(2))
+		self.single.newRound()
+		self.single.newTurn()
+		played = self.players[0].hand.cards[0]
+		self.assertTrue(self.single.playerToPile(self.players[0], 0, played))
+		self.assertTrue(self.single.moveCards([(self.players[1], 0, self.players[1].hand.cards[0]), (0, 4, played)]))
+		self.single.addPoint(self.players[1], 2)
+		self.single.removeGameAttribute("trump_suit")
+		removed = self.single.deck.cards[0]
+		self.assertTrue(self.single.removeCard(removed))
+		self.single.removePile(4)
+		self.single.resetAttributes()
+		self.single.resetCards()
+		self.assertEqual(len(self.single.history), 29)
+
+		while self.single.revertLastAction():
+			pass
+		self.assertEqual(str(self.single), before)
+		self.assertEqual(self.single.deck.cards, deck)
+		self.assertEqual(self.single.attributes, {})
+		self.assertEqual(self.single.getPileNumbers(), [])
+		self.assertEqual(self.players[1].getPoints(), 0)
+		self.assertEqual(self.single.whereIs(removed), [(DECK, 0, 1)])
+
+		# Batches are undone as a whole
+		self.single.setGameAttribute("trump_suit", 1)
+		self.assertTrue(self.single.dealHands(2))
+		self.assertTrue(self.single.revertLastAction())
+		self.assertEqual(sum(len(p) for p in self.players), 0)
+		self.assertEqual(self.single.attributes, {"trump_suit": 1})
+		self.assertEqual(self.single.whereIs(self.single.deck.cards[0]), [(DECK, 0, 1)])
+
+	def test_revertLimitedHistory(self):
+		deck = Deck(52)
+		for i in range(0, 52):
+			deck.append(Card.fromID(i))
+		players = [Player("Arron", "A-1"), Player("Becky", "B-1"), Player("Chris", "C-1")]
+		gamestate = Gamestate(deck, players, ActionLog(5))
+		self.assertTrue(gamestate.dealHands(1)) # One action of 3 linked moves
+		gamestate.newTurn()
+		gamestate.newTurn()
+		gamestate.newTurn()
+
+		# Pushing the deal's first move out of the log forgets the whole deal, it is
+		# never undone in part
+		self.assertEqual(len(gamestate.history), 3)
+		for i in range(0, 3):
+			self.assertTrue(gamestate.revertLastAction())
+		self.assertFalse(gamestate.revertLastAction())
+		self.assertEqual([len(player) for player in players], [1, 1, 1])
+
+	def test_storeAction(self):
+		self.single.storeAction(pack(TURN))
+		self.assertEqual(len(self.single.history), 1)
+		self.single.turns = 1
+		self.single.revertLastAction()
+		self.assertEqual(self.single.turns, 0)
+
+	def test_getPlayers(self):
+		self.assertEqual(self.single.getPlayers(), self.players)
+		self.assertTrue(self.single.getPlayer("C-1") is self.players[2])
+		self.assertEqual(self.single.getPlayer("Z-1"), None)
+		self.assertEqual(self.single.playerIndex(self.players[3]), 3)
+		self.assertEqual(self.single.playerIndex(Player("Zulu", "Z-1")), None)
+
+	# ------------------------------------------------------------------------------
+	# Gamestate - Action interactions
+
+	def test_setGameAttribute(self):
+		pass
+
+	def test_removeGameAttribute(self):
+		pass
+
+	def test_deckToPlayer(self):
+		# Test dealing post conditions
+		test1 = self.single.deckToPlayer(Card(2,2), self.players[0])
+		test2 = self.single.deckToPlayer(Card(2,2), self.players[0])
+		test3 = self.single.deckToPlayer(Card(3,3), Player("Zulu", "Z-1"))
+		self.assertTrue(test1)
+		self.assertFalse(test2)
+		self.assertFalse(test3)
+		self.assertTrue(Card(2,2) not in self.single.deck)
+		self.assertTrue(Card(2,2) in self.players[0])
+		self.assertTrue(Card(3,3) in self.single.deck)
+
+		# Test dealing same card with 2 decks
+		test4 = self.double.deckToPlayer(Card(2,2), self.players[0])
+		test5 = self.double.deckToPlayer(Card(2,2), self.players[0])
+		self.assertTrue(test4)
+		self.assertTrue(test5)
+
+	def test_moveCards(self):
+		# Deal a round in one batch
+		deal = [(self.single.deck, p, Card.fromID(i * 4 + j)) for j,p in enumerate(self.players) for i in range(0, 2)]
+		self.assertTrue(self.single.moveCards(deal))
+		self.assertEqual(len(self.single.deck), 44)
+		for j,p in enumerate(self.players):
+			self.assertEqual(len(p), 2)
+			self.assertTrue(Card.fromID(j) in p)
+			self.assertTrue(Card.fromID(j) not in self.single.deck)
+
+		# One bad move and nothing happens: card not in the deck, unknown player, too many cards, bad pile number
+		for bad in [(self.single.deck, self.players[0], Card.fromID(0)),
+				(self.single.deck, Player("Zulu", "Z-1"), Card.fromID(40)),
+				(self.single.deck, self.players[3], Card.fromID(41)),
+				(self.single.deck, -1, Card.fromID(42))]:
+			self.assertFalse(self.single.moveCards([(self.single.deck, self.players[1], Card.fromID(50)), bad]))
+			self.assertEqual(len(self.single.deck), 44)
+			self.assertTrue(Card.fromID(50) in self.single.deck)
+			self.assertEqual(len(self.players[1]), 2)
+
+		# Moves see the moves before them in the batch
+		self.assertTrue(self.single.moveCards([(self.single.deck, self.players[0], Card.fromID(50)),
+			(self.players[0], self.players[1], Card.fromID(50)),
+			(self.players[3], self.single.deck, Card.fromID(3)),
+			(self.single.deck, self.players[3], Card.fromID(51))]))
+		self.assertTrue(Card.fromID(50) in self.players[1])
+		self.assertTrue(Card.fromID(51) in self.players[3])
+		self.assertTrue(Card.fromID(3) in self.single.deck)
+		self.assertFalse(self.single.moveCards([(self.players[1], self.single.deck, Card.fromID(50)),
+			(self.players[1], self.single.deck, Card.fromID(50))]))
+
+		# Two decks, two copies
+		self.assertTrue(self.double.moveCards([(self.double.deck, self.players[0], Card(2,2)),
+			(self.double.deck, self.players[0], Card(2,2))]))
+		self.assertEqual(self.double.deck.count(Card(2,2)), 0)
+
+	def test_whereIs(self):
+		self.assertEqual(self.single.whereIs(Card(2,2)), [(DECK, 0, 1)])
+		self.single.deckToPlayer(Card(2,2), self.players[1])
+		self.assertEqual(self.single.whereIs(Card(2,2)), [(PLAYER, 1, 1)])
+		self.single.moveCards([(self.players[1], self.players[3], Card(2,2))])
+		self.assertEqual(self.single.whereIs(Card(2,2)), [(PLAYER, 3, 1)])
+
+		# Failed moves leave the index alone
+		self.assertFalse(self.single.moveCards([(self.players[3], self.single.deck, Card(2,2)),
+			(self.players[3], self.single.deck, Card(2,2))]))
+		self.assertEqual(self.single.whereIs(Card(2,2)), [(PLAYER, 3, 1)])
+
+		# Dealing and collecting keep the index in step
+		self.assertTrue(self.single.dealHands(1))
+		for i, player in enumerate(self.players):
+			for card in player:
+				self.assertTrue((PLAYER, i, 1) in self.single.whereIs(card))
+		self.single.resetCards()
+		self.assertEqual(len(self.single.deck), 52)
+		self.assertEqual(self.single.whereIs(Card(2,2)), [(DECK, 0, 1)])
+
+		# Two decks, copies are counted per location
+		self.assertEqual(self.double.whereIs(Card(5,1)), [(DECK, 0, 2)])
+		self.double.deckToPlayer(Card(5,1), self.players[0])
+		self.assertEqual(sorted(self.double.whereIs(Card(5,1))), [(DECK, 0, 1), (PLAYER, 0, 1)])
+		self.double.deckToPlayer(Card(5,1), self.players[0])
+		self.assertEqual(self.double.whereIs(Card(5,1)), [(PLAYER, 0, 2)])
+
+	def test_playerToDeck(self):
+		# Test moving a card from the deck to the player and back with error
+		test1 = self.single.deckToPlayer(Card(2,2), self.players[0])
+		self.assertTrue(Card(2,2) not in self.single.deck)
+		self.assertTrue(Card(2,2) in self.players[0])
+		test2 = self.single.playerToDeck(self.players[0], Card(2,2))
+		test3 = self.single.playerToDeck(self.players[0], Card(2,2))
+		self.assertTrue(test1)
+		self.assertTrue(test2)
+		self.assertFalse(test3)
+		self.assertTrue(Card(2,2) in self.single.deck)
+		self.assertTrue(Card(2,2) not in self.players[0])
+
+		# Test dealing same card with 2 decks
+		test4 = self.double.deckToPlayer(Card(2,2), self.players[0])
+		test5 = self.double.deckToPlayer(Card(2,2), self.players[0])
+		self.assertTrue(test4)
+		self.assertTrue(test5)
+		test6 = self.double.playerToDeck(self.players[0], Card(2,2))
+		test7 = self.double.playerToDeck(self.players[0], Card(2,2))
+		self.assertTrue(test6)
+		self.assertTrue(test7)
+
+	def test_pileToPlayer(self):
+		# Setup piles
+		self.single.piles[0] = Pile(max_size=2)
+		self.single.piles[1] = Pile(enforce_order=True)
+		self.single.piles[0].push(Card(2,1))
+		self.single.piles[1].push(Card(2,2))
+		self.single.piles[1].push(Card(2,3))
+
+		# Pile doesn't exist
+		test1 = self.single.pileToPlayer(2, self.players[0], Card(2,1))
+		self.assertFalse(test1)
+		self.assertTrue(Card(2,1) not in self.players[0])
+
+		# Player doesn't exist
+		test2 = self.single.pileToPlayer(0, Player("Zulu", "Z-1"), Card(2,1))
+		self.assertFalse(test2)
+		self.assertTrue(Card(2,1) in self.single.piles[0])
+
+		# Card doesn't exist
+		test3 = self.single.pileToPlayer(0, self.players[0], Card(2,0))
+		self.assertFalse(test3)
+		self.assertTrue(Card(2,0) not in self.players[0])
+		self.assertTrue(Card(2,0) not in self.single.piles[0])
+
+		# Player with max_size
+		test3 = self.single.pileToPlayer(0, self.players[3], Card(2,1))
+		test4 = self.single.pileToPlayer(1, self.players[3], Card(2,2))
+		test5 = self.single.pileToPlayer(1, self.players[3], Card(2,3))
+		self.assertTrue(test3)
+		self.assertTrue(test4)
+		self.assertFalse(test5)
+		self.assertTrue(Card(2,1) in self.players[3])
+		self.assertTrue(Card(2,2) in self.players[3])
+		self.assertTrue(Card(2,3) not in self.players[3])
+		self.assertTrue(Card(2,1) not in self.single.piles[0])
+		self.assertTrue(Card(2,2) not in self.single.piles[1])
+		self.assertTrue(Card(2,3) in self.single.piles[1])
+
+		# Postconditions
+		test6 = self.single.pileToPlayer(1, self.players[0], Card(2,3))
+		self.assertTrue(test6)
+		self.assertTrue(Card(2,3) in self.players[0])
+		self.assertTrue(Card(2,3) not in self.single.piles[1])
+
+	def test_playerToPile(self):
+		# Setup piles
+		self.single.piles[0] = Pile(max_size=2)
+		self.single.piles[1] = Pile(enforce_order=True)
+		self.single.players[0].push(Card(2,1))
+		self.single.players[1].push(Card(2,2))
+		self.single.players[1].push(Card(2,3))
+		self.single.players[0].push(Card(14,3))
+
+		# Pile doesn't exist, card should move!
+		test1 = self.single.playerToPile(self.players[0], 3, Card(14,3))
+		self.assertTrue(test1)
+		self.assertTrue(Card(14,3) not in self.players[0])
+		self.assertTrue(Card(14,3) in self.single.piles[3])
+		self.assertTrue(self.single.piles[2] == None)
+
+		# Player doesn't exist
+		test2 = self.single.playerToPile(Player("Zulu", "Z-1"), 0, Card(2,1))
+		self.assertFalse(test2)
+		self.assertTrue(Card(2,1) not in self.single.piles[0])
+
+		# Card doesn't exist
+		test3 = self.single.playerToPile(self.players[0], 0, Card(2,0))
+		self.assertFalse(test3)
+		self.assertTrue(Card(2,0) not in self.players[0])
+		self.assertTrue(Card(2,0) not in self.single.piles[0])
+
+		# Pile with max_size
+		test3 = self.single.playerToPile(self.players[0], 0, Card(2,1))
+		test4 = self.single.playerToPile(self.players[1], 0, Card(2,2))
+		test5 = self.single.playerToPile(self.players[1], 0, Card(2,3))
+		self.assertTrue(test3)
+		self.assertTrue(test4)
+		self.assertFalse(test5)
+		self.assertTrue(Card(2,1) not in self.players[0])
+		self.assertTrue(Card(2,2) not in self.players[1])
+		self.assertTrue(Card(2,3) in self.players[1])
+		self.assertTrue(Card(2,1) in self.single.piles[0])
+		self.assertTrue(Card(2,2) in self.single.piles[0])
+		self.assertTrue(Card(2,3) not in self.single.piles[0])
+
+		# Postconditions
+		test6 = self.single.playerToPile(self.players[1], 1, Card(2,3))
+		self.assertTrue(test6)
+		self.assertTrue(Card(2,3) not in self.players[1])
+		self.assertTrue(Card(2,3) in self.single.piles[1])
+
+	def test_hash(self):
+		start = self.single.hash
+		self.single.setGameAttribute("trump_suit", 2)
+		self.single.dealHands(2)
+		self.single.newTurn()
+		self.single.playerToPile(self.players[0], 0, self.players[0].hand.cards[0])
+		self.single.removeCard(self.single.deck.cards[0])
+		played = self.single.hash
+
+		# Incremental updates match a hash built from scratch
+		self.single._buildIndex()
+		self.assertEqual(self.single.hash, played)
+		self.assertNotEqual(played, start)
+
+		# A flat copy hashes the same and follows the same moves
+		state = self.single.fork()
+		self.assertEqual(state.hash, played)
+		card = self.players[1].hand.cards[0]
+		state.move(2, -1, card.id)
+		state.setAttribute("lead_suit", card.getSuit())
+		self.single.playerToPile(self.players[1], 0, card)
+		self.single.setGameAttribute("lead_suit", card.getSuit())
+		self.assertEqual(state.hash, self.single.hash)
+
+		# Undo restores every hash on the way back
+		self.single.revertLastAction()
+		self.single.revertLastAction()
+		self.assertEqual(self.single.hash, played)
+		while self.single.revertLastAction():
+			pass
+		self.assertEqual(self.single.hash, start)
+
+		# Same cards in the same places hash the same, whatever the order of moves
+		self.single.deckToPlayer(Card(3,1), self.players[0])
+		self.single.deckToPlayer(Card(4,1), self.players[1])
+		first = self.single.hash
+		while self.single.revertLastAction():
+			pass
+		self.single.deckToPlayer(Card(4,1), self.players[1])
+		self.single.deckToPlayer(Card(3,1), self.players[0])
+		self.assertEqual(self.single.hash, first)
+
+		# Copies in multi deck games don't cancel out
+		before = self.double.hash
+		self.double.deckToPlayer(Card(2,2), self.players[0])
+		self.double.deckToPlayer(Card(2,2), self.players[0])
+		self.assertNotEqual(self.double.hash, before)
+		self.double.revertLastAction()
+		self.double.revertLastAction()
+		self.assertEqual(self.double.hash, before)
+
+		# Attribute values that could change later are refused before anything changes
+		before = self.single.hash
+		records = len(self.single.history)
+		self.assertRaises(TypeError, self.single.setGameAttribute, "bids", [1, 2])
+		self.assertRaises(TypeError, self.single.fork().setAttribute, "bids", [1, 2])
+		self.assertEqual(self.single.hash, before)
+		self.assertEqual(len(self.single.history), records)
+		self.assertNotIn("bids", self.single.attributes)
+
+	def test_resetCards(self):
+		game = self.single
+		self.assertTrue(game.dealHands(1))
+		game.deckToPile(0, game.deck.cards[0])
+		game.resetCards()
+		self.assertEqual(len(game.deck), 52)
+		self.assertEqual(game.piles, {})
+
+		# A deck with no room for the cards refuses them all before anything moves
+		self.assertTrue(game.dealHands(1))
+		game.deckToPile(0, game.deck.cards[0])
+		game.deck.max_size = len(game.deck) + 2
+		before = (game.hash, len(game.history), len(game.deck), list(game.locations))
+		self.assertRaises(ValueError, game.resetCards)
+		self.assertEqual((game.hash, len(game.history), len(game.deck), list(game.locations)), before)
+		self.assertEqual([len(player) for player in self.players], [1, 1, 1, 1])
+		self.assertEqual(len(game.piles[0]), 1)
+
+	def test_deckToPile(self):
+		# Piles are made on demand and numbers don't have to be contiguous
+		self.assertTrue(self.single.deckToPile(5, Card(14,2)))
+		self.assertTrue(self.single.deckToPile(1, Card(13,2)))
+		self.assertFalse(self.single.deckToPile(1, Card(13,2)))
+		self.assertFalse(self.single.deckToPile(-1, Card(12,2)))
+		self.assertEqual(self.single.getPileNumbers(), [1, 5])
+		self.assertEqual(self.single.whereIs(Card(14,2)), [(PILE, 5, 1)])
+
+		self.assertTrue(self.single.pileToDeck(5, Card(14,2)))
+		self.assertFalse(self.single.pileToDeck(5, Card(14,2)))
+		self.assertFalse(self.single.pileToDeck(3, Card(13,2)))
+		self.assertEqual(self.single.whereIs(Card(14,2)), [(DECK, 0, 1)])
+
+		# Removing a pile puts its cards back in the deck
+		self.assertTrue(self.single.removePile(1))
+		self.assertFalse(self.single.removePile(1))
+		self.assertEqual(self.single.getPileNumbers(), [5])
+		self.assertTrue(Card(13,2) in self.single.deck)
+		self.assertEqual(self.single.whereIs(Card(13,2)), [(DECK, 0, 1)])
+
+		# Removing a card takes it out of the game
+		self.assertTrue(self.single.removeCard(Card(2,0)))
+		self.assertFalse(self.single.removeCard(Card(2,0)))
+		self.assertEqual(len(self.single.deck), 51)
+		self.assertEqual(self.single.whereIs(Card(2,0)), [])
+
+	def test_roundMethods(self):
+		self.assertEqual(self.single.newTurn(), 1)
+		self.assertEqual(self.single.newTurn(), 2)
+		self.assertEqual(self.single.newRound(), 1)
+		self.assertTrue(self.single.addPoint(self.players[2], 3))
+		self.assertTrue(self.single.addPoint(self.players[2]))
+		self.assertFalse(self.single.addPoint(Player("Zulu", "Z-1")))
+		self.assertEqual(self.players[2].getPoints(), 4)
+
+		self.single.setGameAttribute("trump_suit", 2)
+		self.single.resetAttributes()
+		self.assertEqual(self.single.attributes, {})
+
+		# Cards in piles go back to the deck and the piles are cleared away
+		self.single.deckToPlayer(Card(9,1), self.players[0])
+		self.single.playerToPile(self.players[0], 0, Card(9,1))
+		self.single.resetCards()
+		self.assertEqual(len(self.single.deck), 52)
+		self.assertEqual(self.single.getPileNumbers(), [])
+		self.assertEqual(self.single.piles[0], None)
+
+	def tearDown(self):
+		self.single = None
+		self.double = None
+		self.players = None
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
\ No newline at end of file
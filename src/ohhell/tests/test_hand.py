@@ -0,0 +1,95 @@
+import unittest
+import random
+from io import StringIO
+
+# Local imports
+from ..card import Card
+from ..pile import Pile
+from ..hand import SortedHand
+from ..error import ERROR
+
+"""=================================================================================
+SortedHand Class Unit Tests
+================================================================================="""
+
+class TestSortedHandClass(unittest.TestCase):
+	def setUp(self):
+		self.hand = SortedHand()
+
+	def test_push_sorted(self):
+		self.hand.push(Card.fromID(33))
+		self.hand.push(Card.fromID(47))
+		self.hand.push(Card.fromID(21))
+		self.assertEqual(self.hand.__str__(), "[10 of Diamonds, 9 of Clubs, 10 of Hearts]")
+		small = SortedHand(1)
+		self.assertTrue(small.push(Card.fromID(2)))
+		self.assertFalse(small.push(Card.fromID(1)))
+		self.assertEqual(small.cards, [Card.fromID(2)])
+
+	def test_matches_sorted_pile(self):
+		# Random inserts and removes from two decks should match a Pile sorted after every change
+		pile = Pile()
+		for step in range(0, 300):
+			card = Card.fromID(random.randrange(0, 52))
+			if random.randrange(0, 3) and card in pile:
+				pile.remove(card)
+				self.hand.remove(card)
+			else:
+				pile.push(card)
+				self.hand.push(card)
+			pile.sort()
+			self.assertEqual(self.hand.cards, pile.cards)
+			self.assertEqual(self.hand.counts, pile.counts)
+			for s in range(0, 4):
+				cards = [c for c in pile if c.getSuit() == s]
+				self.assertEqual(self.hand.getSuit(s), cards)
+				self.assertEqual(self.hand.hasSuit(s), len(cards) > 0)
+				self.assertEqual(self.hand.lowest(s), cards[0] if cards else None)
+				self.assertEqual(self.hand.highest(s), cards[-1] if cards else None)
+
+	def test_extend(self):
+		self.hand.push(Card.fromID(20))
+		self.assertTrue(self.hand.extend([Card.fromID(i) for i in [51, 3, 20, 40]]))
+		self.assertEqual(self.hand.ids, [3, 20, 20, 40, 51])
+		self.assertEqual(self.hand.suitRange(1), (1, 3))
+		self.assertEqual(self.hand.highest(3), Card.fromID(51))
+		self.assertFalse(SortedHand(1).extend([Card.fromID(1), Card.fromID(2)]))
+
+	def test_queries(self):
+		for i in [0, 5, 12, 14, 40, 51]:
+			self.hand.push(Card.fromID(i))
+		self.assertEqual(self.hand.suitRange(0), (0, 3))
+		self.assertEqual(self.hand.suitRange(2), (4, 4))
+		self.assertEqual(self.hand.highest(0), Card(14,0))
+		self.assertEqual(self.hand.lowest(3), Card(3,3))
+		self.assertEqual(self.hand.highest(2), None)
+		self.assertEqual(self.hand.lowestAbove(Card(3,0)), Card(7,0))
+		self.assertEqual(self.hand.lowestAbove(Card(7,0)), Card(14,0))
+		self.assertEqual(self.hand.lowestAbove(Card(14,0)), None)
+		self.assertEqual(self.hand.lowestAbove(Card(2,1)), Card(3,1))
+		self.assertEqual(self.hand.lowestAbove(Card(5,2)), None)
+
+		self.assertEqual(self.hand.pop(), Card(2,0))
+		self.assertEqual(self.hand.suitRange(3), (3, 5))
+		with self.assertRaises(ValueError):
+			self.hand.remove(Card(2,0))
+		self.hand.clear()
+		self.assertFalse(self.hand.hasSuit(3))
+		with self.assertRaises(IndexError):
+			self.hand.pop()
+
+	def test_version(self):
+		version = self.hand.version
+		self.hand.push(Card(4,2))
+		self.hand.remove(Card(4,2))
+		self.hand.extend([Card(5,2), Card(6,2)])
+		self.hand.pop()
+		self.hand.clear()
+		self.assertEqual(self.hand.version, version + 5)
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
@@ -0,0 +1,125 @@
+import os
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+
+# Local imports
+from ..card import Card
+from ..actionlog import MOVE, ATTRIBUTE, TURN
+from ..journal import JournalWriter, JournalReader, GAME, UNDO, MAGIC, _records
+from ..headless import newGame
+from ..error import ERROR
+
+"""=================================================================================
+Journal Unit Tests
+================================================================================="""
+
+class TestJournal(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.path = os.path.join(self.directory, "games.ohj")
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	""" playGames(writer, count)
+	Plays count short games into the journal
+	@return : [Gamestate] - the games as they ended
+	"""
+	def playGames(self, writer, count):
+		games = []
+		for i in range(0, count):
+			writer.startGame({"game": i, "players": 3})
+			gamestate = newGame(3, 1, writer.log())
+			gamestate.setGameAttribute("trump_suit", i)
+			gamestate.dealHands(2)
+			gamestate.newTurn()
+			player = gamestate.players[0]
+			gamestate.playerToPile(player, 0, player.hand.cards[0])
+			gamestate.playerToPile(player, 0, player.hand.cards[0])
+			gamestate.revertLastAction()
+			gamestate.addPoint(player, 2)
+			games.append(gamestate)
+		return games
+
+	def test_write_read(self):
+		with JournalWriter(self.path, sync_every=8) as writer:
+			played = self.playGames(writer, 3)
+
+		with JournalReader(self.path) as reader:
+			games = reader.games()
+			self.assertEqual(len(games), 3)
+			self.assertEqual(reader.info(games[1]), {"game": 1, "players": 3})
+			actions = list(reader.actions(*games[2]))
+			self.assertEqual([a[1] for a in actions[:3]], [GAME, ATTRIBUTE, MOVE])
+			self.assertEqual(actions[1][6], "('trump_suit', 2)")
+			self.assertEqual(sum(1 for a in actions if a[1] == UNDO), 1)
+			self.assertEqual(len(reader.effective(games[2])), 1 + 6 + 1 + 1 + 1)
+
+			# Replaying onto a fresh game ends where the real game did
+			for game, gamestate in zip(games, played):
+				state = reader.replay(game, newGame(3).fork())
+				for i in range(0, 3):
+					self.assertEqual(state.hand(i), sorted(card.id for card in gamestate.players[i]))
+				self.assertEqual(state.pile(0), tuple(card.id for card in gamestate.piles[0].cards))
+				self.assertEqual(state.getPoints(0), 2)
+				self.assertEqual(state.turns, 1)
+
+	def test_append(self):
+		with JournalWriter(self.path) as writer:
+			self.playGames(writer, 1)
+		with JournalWriter(self.path) as writer:
+			self.playGames(writer, 2)
+		with JournalReader(self.path) as reader:
+			self.assertEqual([reader.info(game)["game"] for game in reader.games()], [0, 0, 1])
+
+	def test_truncated(self):
+		with JournalWriter(self.path) as writer:
+			self.playGames(writer, 2)
+		size = os.path.getsize(self.path)
+		with JournalReader(self.path) as reader:
+			whole = list(reader.actions())
+
+		# Cut into the last record, and into the payload of the second game's attribute
+		for cut in [size - 3, size - 8, size - 1 - 8 * (len(whole) // 2)]:
+			with open(self.path, "r+b") as f:
+				f.truncate(cut)
+			with JournalReader(self.path) as reader:
+				actions = list(reader.actions())
+				self.assertTrue(len(actions) < len(whole))
+				self.assertEqual(actions, whole[:len(actions)])
+			end = JournalReader.validEnd(self.path)
+			self.assertTrue(end <= cut and (end - len(MAGIC)) % 8 == 0)
+
+		# Appending after a crash starts from the last whole record
+		with JournalWriter(self.path) as writer:
+			self.playGames(writer, 1)
+		with JournalReader(self.path) as reader:
+			self.assertEqual(reader.info(reader.games()[-1]), {"game": 0, "players": 3})
+
+	def test_byteorder(self):
+		# The words are little endian on disk, a big endian machine gets swapped copies
+		words = (1).to_bytes(8, "little") + (0x0102030405060708).to_bytes(8, "little")
+		self.assertEqual(list(_records(memoryview(words), "little")), [1, 0x0102030405060708])
+		self.assertEqual(list(_records(memoryview(words), "big")), [1 << 56, 0x0807060504030201])
+		self.assertEqual(len(_records(memoryview(b""), "big")), 0)
+
+	def test_not_a_journal(self):
+		with open(self.path, "wb") as f:
+			f.write(b"hello world, not a journal")
+		self.assertRaises(ValueError, JournalReader, self.path)
+		self.assertRaises(ValueError, JournalWriter, self.path)
+		with open(self.path, "wb") as f:
+			f.write(MAGIC[:3])
+		with JournalWriter(self.path) as writer:
+			writer.startGame()
+		with JournalReader(self.path) as reader:
+			self.assertEqual(len(reader.games()), 1)
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
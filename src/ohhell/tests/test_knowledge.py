@@ -0,0 +1,183 @@
+import unittest
+
+# Local imports
+from ..card import Card
+from ..dealer import Dealer
+from ..shuffle import ShuffleEngine
+from ..headless import newGame
+from ..rules import OhHellRules, GreedyStrategy
+from ..bitpile import SUIT_MASKS
+from ..actionlog import ActionLog
+from ..knowledge import Knowledge, CardTracker, higherCards
+
+"""=================================================================================
+Knowledge Unit Tests
+================================================================================="""
+
+""" mask(*cards)
+@return : int - the card mask of the Cards
+"""
+def mask(*cards):
+	return sum(1 << card.id for card in cards)
+
+""" CheckingStrategy
+GreedyStrategy that checks every player's knowledge against the real hands before it
+	plays
+"""
+class CheckingStrategy(GreedyStrategy):
+	def __init__(self, test):
+		self.test = test
+		self.checks = 0
+
+	def play(self, rules, index, legal, lead):
+		players = rules.gamestate.players
+		for player in players:
+			for i, other in enumerate(players):
+				held = mask(*other.hand.cards)
+				self.test.assertEqual(player.knowledge.possibleCards(i) & held, held)
+				self.checks += 1
+		return GreedyStrategy.play(self, rules, index, legal, lead)
+
+class TestKnowledge(unittest.TestCase):
+	def setUp(self):
+		self.gamestate = newGame(3)
+		deal = [
+			[Card(2, 0), Card(9, 0), Card(5, 2)],
+			[Card(3, 1), Card(14, 1), Card(7, 3)],
+			[Card(10, 0), Card(4, 3), Card(6, 2)],
+		]
+		for player, cards in zip(self.gamestate.players, deal):
+			for card in cards:
+				self.gamestate.deckToPlayer(card, player)
+		self.gamestate.setGameAttribute("trump", Card(12, 3))
+		self.gamestate.setGameAttribute("trump_suit", 3)
+		self.knowledge = self.gamestate.players[0].knowledge
+		self.knowledge.attach(self.gamestate, 0)
+
+	def test_higherCards(self):
+		# Spades led, hearts trump
+		self.assertEqual(higherCards(Card(12, 0), 0, 3), mask(Card(13, 0), Card(14, 0)) | SUIT_MASKS[3])
+		self.assertEqual(higherCards(Card(13, 3), 0, 3), mask(Card(14, 3)))
+		# Off suit can't win, anything of the suit led or trump beats it
+		self.assertEqual(higherCards(Card(14, 1), 0, 3), SUIT_MASKS[0] | SUIT_MASKS[3])
+		# Leading without trump
+		self.assertEqual(higherCards(Card(13, 2), None, None), mask(Card(14, 2)))
+
+	def test_attach(self):
+		knowledge = self.knowledge
+		self.assertEqual(knowledge.possibleCards(0), mask(Card(2, 0), Card(9, 0), Card(5, 2)))
+		self.assertFalse(knowledge.mayHold(1, Card(9, 0)))
+		self.assertFalse(knowledge.mayHold(2, Card(12, 3))) # Turned up
+		self.assertTrue(knowledge.mayHold(1, Card(10, 0)))
+		self.assertEqual(knowledge.unseen().bit_count(), 52 - 4)
+		self.assertEqual(knowledge.tracker.trump_suit, 3)
+		self.assertTrue(knowledge.detach())
+		self.assertFalse(knowledge.detach())
+		self.assertIsNone(self.gamestate.events)
+
+	def test_play(self):
+		knowledge = self.knowledge
+		gamestate = self.gamestate
+		players = gamestate.players
+		gamestate.newTurn()
+		gamestate.playerToPile(players[0], 0, Card(9, 0))
+		self.assertEqual(knowledge.leadSuit(), 0)
+		self.assertTrue(knowledge.canBeat(Card(9, 0))) # The 10 of spades or any heart
+		self.assertFalse(knowledge.canBeat(Card(14, 3), 0))
+
+		# Player 2 doesn't follow spades
+		gamestate.playerToPile(players[1], 0, Card(3, 1))
+		self.assertTrue(knowledge.isVoid(1, 0))
+		self.assertFalse(knowledge.isVoid(2, 0))
+		self.assertFalse(knowledge.mayHold(1, Card(10, 0)))
+		self.assertTrue(knowledge.mayHold(1, Card(14, 1)))
+		self.assertTrue(knowledge.canBeat(Card(9, 0), 0, [1])) # Only with a heart now
+		self.assertFalse(knowledge.mayHold(2, Card(3, 1)))
+		self.assertEqual(knowledge.possibleCards(0), mask(Card(2, 0), Card(5, 2)))
+
+		gamestate.playerToPile(players[2], 0, Card(10, 0))
+		gamestate.removePile(0)
+		self.assertIsNone(knowledge.leadSuit())
+		self.assertIn("void in S", str(knowledge))
+
+	def test_pickup(self):
+		knowledge = self.knowledge
+		gamestate = self.gamestate
+		players = gamestate.players
+		card = Card(3, 1)
+		gamestate.playerToPile(players[1], 3, card)
+		self.assertFalse(knowledge.mayHold(2, card))
+		# Player 3 takes it from the pile, and isn't void in diamonds for holding it
+		gamestate.pileToPlayer(3, players[2], card)
+		self.assertTrue(knowledge.mayHold(2, card))
+		self.assertFalse(knowledge.isVoid(2, 1))
+		self.assertEqual(knowledge.unseen() & mask(card), mask(card))
+
+		# Taking it back puts it on the pile again
+		self.assertTrue(gamestate.revertLastAction())
+		self.assertFalse(knowledge.mayHold(2, card))
+
+	def test_revert(self):
+		knowledge = self.knowledge
+		tracker = knowledge.tracker
+		gamestate = self.gamestate
+		players = gamestate.players
+		gamestate.playerToPile(players[0], 0, Card(9, 0))
+		before = (list(tracker.candidates), list(tracker.voids), list(tracker.hands), tracker.gone, dict(tracker.leads))
+		gamestate.playerToPile(players[1], 0, Card(3, 1))
+		gamestate.removePile(0)
+		self.assertTrue(knowledge.isVoid(1, 0))
+
+		# Undo the removal and the discard: back to one card on the trick
+		self.assertTrue(gamestate.revertLastAction())
+		self.assertEqual(knowledge.leadSuit(), 0)
+		self.assertTrue(gamestate.revertLastAction())
+		self.assertEqual((tracker.candidates, tracker.voids, tracker.hands, tracker.gone, tracker.leads), before)
+		self.assertFalse(knowledge.isVoid(1, 0))
+
+		# A new round forgets everything, reverting it brings it all back
+		gamestate.newRound()
+		self.assertEqual(knowledge.unseen(), (1 << 52) - 1)
+		self.assertTrue(gamestate.revertLastAction())
+		self.assertEqual(knowledge.leadSuit(), 0)
+		self.assertFalse(knowledge.mayHold(2, Card(9, 0)))
+
+		# Past the snapshots of the round it starts again from what can be seen
+		gamestate.newRound()
+		self.assertEqual(len(tracker.undo), 1)
+		self.assertTrue(gamestate.revertLastAction())
+		self.assertTrue(gamestate.revertLastAction())
+		self.assertEqual(tracker.leads, {})
+		self.assertEqual(knowledge.possibleCards(1) & mask(Card(3, 1)), mask(Card(3, 1)))
+		self.assertEqual(knowledge.possibleCards(0), mask(Card(2, 0), Card(9, 0), Card(5, 2)))
+
+	def test_bounded(self):
+		# The snapshots for REVERT don't pile up over many rounds, nor outgrow the history
+		for history, bound in ((None, 80), (ActionLog(30), 30)):
+			gamestate = newGame(4, history=history)
+			tracker = Knowledge.attachAll(gamestate)
+			sizes = []
+			strategy = GreedyStrategy()
+			strategy.play = lambda rules, index, legal, lead: sizes.append(len(tracker.undo)) or GreedyStrategy.play(strategy, rules, index, legal, lead)
+			rules = OhHellRules(gamestate, Dealer(ShuffleEngine(5)), strategy)
+			for round_ in range(0, 20):
+				self.assertTrue(rules.playRound(6, round_ % 4))
+				self.assertEqual(len(tracker.undo), 1) # Only the new round
+			self.assertEqual(len(sizes), 20 * 6 * 4)
+			self.assertLessEqual(max(sizes), bound)
+
+	def test_round(self):
+		# Every player tracks a whole round, their knowledge never rules out a real card
+		gamestate = newGame(4)
+		tracker = Knowledge.attachAll(gamestate)
+		self.assertEqual(len(gamestate.events), 1) # One subscription for the table
+		strategy = CheckingStrategy(self)
+		rules = OhHellRules(gamestate, Dealer(ShuffleEngine(8)), strategy)
+		self.assertTrue(rules.playRound(6, 0))
+		self.assertEqual(strategy.checks, 6 * 4 * 16)
+		self.assertEqual(gamestate.players[0].knowledge.unseen(), (1 << 52) - 1) # Forgotten at the new round
+		self.assertIsInstance(gamestate.players[1].getKnowledge(), Knowledge)
+		for player in gamestate.players:
+			self.assertTrue(player.knowledge.detach())
+		self.assertFalse(tracker.subscribed)
+		self.assertIsNone(gamestate.events)
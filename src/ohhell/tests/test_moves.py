@@ -0,0 +1,90 @@
+import unittest
+
+# Local imports
+from ..card import Card
+from ..headless import newGame
+from ..moves import MoveGenerator
+from ..bitpile import BitPile, SUIT_MASKS
+from ..arraypile import ArrayPile
+
+"""=================================================================================
+MoveGenerator Unit Tests
+================================================================================="""
+
+class TestMoveGenerator(unittest.TestCase):
+	def setUp(self):
+		self.gamestate = newGame(3)
+		deal = [
+			[Card(2, 0), Card(9, 0), Card(5, 2)],
+			[Card(3, 1), Card(14, 1), Card(7, 3)],
+			[Card(10, 0), Card(4, 3), Card(6, 2)],
+		]
+		for player, cards in zip(self.gamestate.players, deal):
+			for card in cards:
+				self.gamestate.deckToPlayer(card, player)
+		self.moves = MoveGenerator(self.gamestate)
+
+	def test_masks(self):
+		suits, mask = self.moves.suitMasks(0)
+		self.assertEqual(mask, (1 << 0) | (1 << 7) | (1 << 29))
+		self.assertEqual(suits, [(1 << 0) | (1 << 7), 0, 1 << 29, 0])
+		self.assertEqual(sum(suits), mask)
+		self.assertEqual(SUIT_MASKS[3], ((1 << 13) - 1) << 39)
+
+	def test_legalMoves(self):
+		# Nothing led yet, anything goes
+		self.assertIsNone(self.moves.leadSuit())
+		self.assertEqual(self.moves.legalMoves(1), (Card(3, 1), Card(14, 1), Card(7, 3)))
+
+		# Spades led: follow if you can
+		players = self.gamestate.players
+		self.gamestate.playerToPile(players[0], 0, Card(9, 0))
+		self.assertEqual(self.moves.leadSuit(), 0)
+		self.assertEqual(self.moves.legalMoves(2), (Card(10, 0),))
+		self.assertEqual(self.moves.legalMoves(1), (Card(3, 1), Card(14, 1), Card(7, 3)))
+		self.assertTrue(self.moves.isLegal(2, Card(10, 0)))
+		self.assertFalse(self.moves.isLegal(2, Card(6, 2)))
+		self.assertFalse(self.moves.isLegal(2, Card(9, 0)))
+
+		# Later cards on the trick don't change the lead
+		self.gamestate.playerToPile(players[1], 0, Card(7, 3))
+		self.assertEqual(self.moves.leadSuit(), 0)
+		self.assertEqual(self.moves.allLegalMoves(), [(Card(2, 0),), (Card(3, 1), Card(14, 1)), (Card(10, 0),)])
+		self.assertEqual(self.moves.allLegalMasks(3), [(1 << 0) | (1 << 29), (1 << 14) | (1 << 25), 1 << 41])
+
+	def test_cache(self):
+		first = self.moves.legalMoves(0, 2)
+		self.assertIs(self.moves.legalMoves(0, 2), first)
+		self.assertIsNot(self.moves.legalMoves(0, 0), first)
+
+		# A change to the hand is seen right away
+		self.gamestate.deckToPlayer(Card(8, 2), self.gamestate.players[0])
+		self.assertEqual(self.moves.legalMoves(0, 2), (Card(5, 2), Card(8, 2)))
+		self.gamestate.revertLastAction()
+		self.assertEqual(self.moves.legalMoves(0, 2), (Card(5, 2),))
+
+		# A fresh hand after resetCards
+		self.gamestate.resetCards()
+		self.assertEqual(self.moves.legalMoves(0), ())
+		self.assertEqual(self.moves.legalMask(0), 0)
+
+	def test_copies(self):
+		gamestate = newGame(3, 2)
+		player = gamestate.players[0]
+		gamestate.deckToPlayer(Card(5, 1), player)
+		gamestate.deckToPlayer(Card(5, 1), player)
+		self.assertEqual(MoveGenerator(gamestate).legalMoves(0, 1), (Card(5, 1),))
+
+	def test_piles(self):
+		# Any kind of pile works as a hand
+		for pile in (BitPile(), ArrayPile()):
+			player = self.gamestate.players[0]
+			player.hand = pile
+			pile.extend([Card(2, 0), Card(5, 2)])
+			self.assertEqual(self.moves.legalMoves(0, 0), (Card(2, 0),))
+			pile.push(Card(9, 0))
+			self.assertEqual(self.moves.legalMoves(0, 0), (Card(2, 0), Card(9, 0)))
+			self.assertEqual(self.moves.legalMask(0, 3), (1 << 0) | (1 << 7) | (1 << 29))
+
+if __name__ == '__main__':
+	unittest.main()
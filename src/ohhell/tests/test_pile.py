@@ -1,167 +1,11 @@
-import sys
 import unittest
 import random
 from io import StringIO
 
 # Local imports
-from card import Card
-from error import *
-
-# Globals
-MAX_SIZE = sys.maxsize
-
-"""=================================================================================
-Pile Class
-================================================================================="""
-
-""" Pile Class
-A class representing a real life "pile" of cards.
-
-@author Chris P.
-@created 2020-12-21 YMD
-"""
-class Pile():
-	"""__init__
-	Default Constructor - creates an empty pile object with the optional max_size parameter
-	@param max_size : INT coressponding to the maximum size of the pile
-	"""
-	def __init__(self, max_size=MAX_SIZE, enforce_order=False):
-		self.enforce_order = enforce_order
-		self.max_size = max_size
-		self.cards = []
-
-	# ------------------------------------------------------------------------------
-	# Static Methods
-
-	""" fromList(lis)
-	"Overloaded" constructor - Creates a pile object containing cards with IDs corresponding to the ints in lis
-	@param lis : [int] - list of card IDs
-	@return a corresponding Pile object
-	"""
-	@classmethod
-	def fromList(cls, lis, max_size=MAX_SIZE):
-		output = cls(max_size)
-		for i in lis:
-			output.append(Card.fromID(i))
-		return output
-
-	# ------------------------------------------------------------------------------
-	# Public Methods
-
-	""" insert(card, location)
-	Inserts a card at the given location. Default location is 0.
-	@param card : Card - the card to insert into the deck. Cards are "immutable" and singletons so shallow copy
-	@param location : INT - the location in the pile to insert the card. Default is 0
-	@returns true if successful, false if failed
-	"""
-	def insert(self, card, location=0):
-		if self.getSize() < self.max_size:
-			self.cards.insert(location,card)
-			return True #Isn't certain to be a successful insert, but list.insert returns nothing...
-		else:
-			ERROR.write("Invalid Insert: Inserting into pile would violate max_size.")
-			return False
-
-	""" remove(card)
-	Removes a specified card from the list if present. It will only remove one instance of the card. 
-		Potentially unsafe if List.remove() features change...
-	@param card : Card that represents the card to remove
-	"""
-	def remove(self, card):
-		self.cards.remove(card)
-
-	""" push(card)
-	Push a card to the front (location 0) of the list. Carried out by calling Pile.insert()
-	@param card : Card - the card to push to the front. See the notes for Pile.insert()
-	"""
-	def push(self, card):
-		return self.insert(card,0)
-
-	""" pop()
-	Pop a card from the front of the list
-	@return Card that was at the front of the list
-	"""
-	def pop(self):
-		return self.cards.pop(0)
-
-	""" append(card)
-	Append a card to the end of the list
-	@param card : Card - The card to append to the end of the list. See the notes for Pile.insert() about copies
-	"""
-	def append(self, card):
-		if self.getSize() < self.max_size:
-			self.cards.append(card)
-			return True
-		else:
-			ERROR.write("Invalid Append: Inserting into pile would violate max_size.")
-			return False
-
-	""" sort()
-	Numerically sorts the contents of self.cards if self.enforce_order == False
-	"""
-	def sort(self):
-		if self.enforce_order == False:
-			self.cards.sort()
-		else:
-			ERROR.write("WARNING: Trying to sort pile with an enforced order. Not sorting.")
-
-	""" clear()
-	Removes all of contents from self.hand
-	"""
-	def clear(self):
-		self.cards.clear()
-
-	""" getSize()
-	Returns the size of hand list in a Pile object
-	@return length of self.hand
-	"""
-	def getSize(self):
-		return len(self.cards)
-
-	# ------------------------------------------------------------------------------
-	# Python Methods
-
-	""" __len__()
-	Overrides the __len__ method and returns the size of hand list in a Pile object
-	@return length of self.hand
-	"""
-	def __len__(self):
-		return self.getSize()
-
-	""" __str__()
-	Overrides the __str__ method and returns a string 
-	@return string representation of self.hand
-	"""
-	def __str__(self):
-		return self.cards.__str__()
-
-	""" __repr__()
-	Overrides the __repr__ method and returns a string 
-	@return string representation of self.hand
-	"""
-	def __repr__(self):
-		return self.__str__()
-
-	""" __contains__(other)
-	Checks if other (a card Object...) is contained within the pile
-	Precondition: type(other) == Card
-	@param other : Card - the card to check the presence of.
-	"""
-	def __contains__(self, other):
-		if type(other) != type(Card(2,0)): # Confirm types are the same
-			return False
-		elif other in self.cards: #Check if the card is contained
-			return True
-		else:
-			return False
-
-	def __iter__(self):
-		return self.cards.__iter__()
-
-	def __next__(self):
-		return self.cards.__next__()
-
-
+from ..card import Card
+from ..pile import Pile
+from ..error import ERROR
 
 """=================================================================================
 Pile Class Unit Tests
@@ -240,6 +84,43 @@ class TestPileClass(unittest.TestCase):
 		deck.sort()
 		self.assertEqual(deck.__str__(),"""[2 of Spades, 2 of Spades, 3 of Spades, 3 of Spades, 4 of Spades, 4 of Spades, 5 of Spades, 5 of Spades, 6 of Spades, 6 of Spades, 7 of Spades, 7 of Spades, 8 of Spades, 8 of Spades, 9 of Spades, 9 of Spades, 10 of Spades, 10 of Spades, Jack of Spades, Jack of Spades, Queen of Spades, Queen of Spades, King of Spades, King of Spades, Ace of Spades, Ace of Spades, 2 of Diamonds, 2 of Diamonds, 3 of Diamonds, 3 of Diamonds, 4 of Diamonds, 4 of Diamonds, 5 of Diamonds, 5 of Diamonds, 6 of Diamonds, 6 of Diamonds, 7 of Diamonds, 7 of Diamonds, 8 of Diamonds, 8 of Diamonds, 9 of Diamonds, 9 of Diamonds, 10 of Diamonds, 10 of Diamonds, Jack of Diamonds, Jack of Diamonds, Queen of Diamonds, Queen of Diamonds, King of Diamonds, King of Diamonds, Ace of Diamonds, Ace of Diamonds, 2 of Clubs, 2 of Clubs, 3 of Clubs, 3 of Clubs, 4 of Clubs, 4 of Clubs, 5 of Clubs, 5 of Clubs, 6 of Clubs, 6 of Clubs, 7 of Clubs, 7 of Clubs, 8 of Clubs, 8 of Clubs, 9 of Clubs, 9 of Clubs, 10 of Clubs, 10 of Clubs, Jack of Clubs, Jack of Clubs, Queen of Clubs, Queen of Clubs, King of Clubs, King of Clubs, Ace of Clubs, Ace of Clubs, 2 of Hearts, 2 of Hearts, 3 of Hearts, 3 of Hearts, 4 of Hearts, 4 of Hearts, 5 of Hearts, 5 of Hearts, 6 of Hearts, 6 of Hearts, 7 of Hearts, 7 of Hearts, 8 of Hearts, 8 of Hearts, 9 of Hearts, 9 of Hearts, 10 of Hearts, 10 of Hearts, Jack of Hearts, Jack of Hearts, Queen of Hearts, Queen of Hearts, King of Hearts, King of Hearts, Ace of Hearts, Ace of Hearts]""")
 
+	# Test the copy and suit counts with two decks
+	def test_counts(self):
+		deck = Pile.fromList(list(range(0, 52)) * 2)
+		self.assertEqual(deck.count(Card(2,2)), 2)
+		self.assertEqual(deck.countSuit(3), 26)
+
+		deck.remove(Card(2,2))
+		self.assertEqual(deck.count(Card(2,2)), 1)
+		self.assertTrue(Card(2,2) in deck)
+		deck.remove(Card(2,2))
+		self.assertEqual(deck.count(Card(2,2)), 0)
+		self.assertFalse(Card(2,2) in deck)
+		self.assertEqual(deck.countSuit(2), 24)
+		with self.assertRaises(ValueError):
+			deck.remove(Card(2,2))
+
+		top = deck.pop()
+		self.assertEqual(deck.count(top), 1)
+		deck.push(top)
+		deck.insert(top, 5)
+		self.assertEqual(deck.count(top), 3)
+		self.assertEqual(sum(deck.counts), len(deck))
+		self.assertEqual(sum(deck.suit_counts), len(deck))
+
+		deck.clear()
+		self.assertEqual(deck.count(top), 0)
+		self.assertEqual(deck.countSuit(0), 0)
+
+	def test_extend_draw(self):
+		self.rumy1.extend([Card.fromID(33), Card.fromID(47)])
+		self.assertFalse(self.poker1.extend([Card.fromID(1), Card.fromID(2), Card.fromID(3)]))
+		self.assertEqual(len(self.poker1), 0)
+		self.assertEqual(self.rumy1.draw(1), [Card.fromID(33)])
+		self.assertEqual(self.rumy1.draw(5), [Card.fromID(47)])
+		self.assertEqual(self.rumy1.count(Card.fromID(47)), 0)
+		self.assertEqual(self.rumy1.draw(5), [])
+
 	def test_iteration(self):
 		self.rumy1.push(Card.fromID(33))
 		self.rumy1.push(Card.fromID(47))
@@ -262,5 +143,5 @@ class TestPileClass(unittest.TestCase):
 
 if __name__ == '__main__':
 	# Divert stderr so unittest output isn't cluttered
-	ERROR = StringIO() 
+	ERROR.setErrorLocation(StringIO())
 	unittest.main()
\ No newline at end of file
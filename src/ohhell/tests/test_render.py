@@ -0,0 +1,65 @@
+import unittest
+
+# Local imports
+from ..card import Card
+from ..headless import newGame
+from ..gamestate import SUMMARY, ATTRIBUTE_LINE
+from ..render import DeltaRenderer
+
+"""=================================================================================
+DeltaRenderer Unit Tests
+================================================================================="""
+
+class TestDeltaRenderer(unittest.TestCase):
+	def setUp(self):
+		self.gamestate = newGame(3)
+		self.gamestate.dealHands(2)
+		self.renderer = DeltaRenderer(self.gamestate)
+
+	def test_firstRender(self):
+		lines = self.renderer.render()
+		self.assertEqual([key for key, line in lines], self.gamestate.lineOrder())
+		self.assertEqual("\n".join(line for key, line in lines) + "\n", str(self.gamestate))
+		self.assertEqual(self.renderer.render(), [])
+
+	def test_move(self):
+		self.renderer.render()
+		player = self.gamestate.players[1]
+		self.gamestate.playerToPile(player, 0, player.hand.cards[0])
+		lines = dict(self.renderer.render())
+		self.assertEqual(set(lines), {SUMMARY, 2, -1})
+		self.assertEqual(lines[-1], self.gamestate.locationLine(-1))
+		self.assertEqual(self.renderer.full(), str(self.gamestate))
+
+		# Undoing removes the pile line and puts the player line back
+		self.gamestate.revertLastAction()
+		lines = dict(self.renderer.render())
+		self.assertEqual(set(lines), {SUMMARY, 2, -1})
+		self.assertIsNone(lines[-1])
+		self.assertEqual(self.renderer.full(), str(self.gamestate))
+
+	def test_attributes(self):
+		self.renderer.render()
+		self.gamestate.setGameAttribute("trump_suit", 2)
+		self.assertEqual(self.renderer.render(), [(SUMMARY, self.gamestate.summaryLine()), ((ATTRIBUTE_LINE, "trump_suit"), "trump_suit: 2")])
+		self.gamestate.resetAttributes()
+		self.assertIn(((ATTRIBUTE_LINE, "trump_suit"), None), self.renderer.render())
+		self.assertEqual(self.renderer.full(), str(self.gamestate))
+
+	def test_unchanged(self):
+		self.renderer.render()
+		# A pile made and removed between renders never shows up
+		self.gamestate.deckToPile(3, self.gamestate.deck.cards[0])
+		self.gamestate.revertLastAction()
+		self.assertEqual(self.renderer.render(), [])
+
+	def test_roundTrip(self):
+		self.renderer.render()
+		self.gamestate.newTurn()
+		self.gamestate.newRound()
+		self.gamestate.resetCards()
+		self.renderer.render()
+		self.assertEqual(self.renderer.full(), str(self.gamestate))
+
+if __name__ == '__main__':
+	unittest.main()
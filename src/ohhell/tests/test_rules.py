@@ -0,0 +1,105 @@
+import unittest
+from io import StringIO
+
+# Local imports
+from ..card import Card
+from ..dealer import Dealer
+from ..shuffle import ShuffleEngine
+from ..headless import newGame
+from ..rules import *
+from ..error import ERROR
+
+"""=================================================================================
+Rules Unit Tests
+================================================================================="""
+
+""" LowestStrategy
+Bids 2 and always plays the lowest card ID it holds, legal or not
+"""
+class LowestStrategy():
+	def bid(self, rules, index, legal):
+		return 2
+
+	def play(self, rules, index, legal, lead):
+		return rules.gamestate.players[index].hand.cards[0]
+
+class TestRules(unittest.TestCase):
+	def test_trickWinner(self):
+		ids = lambda *cards: [card.id for card in cards]
+		# Highest of the suit led
+		self.assertEqual(trickWinner(0, 3, ids(Card(5, 0), Card(14, 1), Card(9, 0))), 2)
+		# Any trump beats the suit led
+		self.assertEqual(trickWinner(0, 3, ids(Card(14, 0), Card(2, 3), Card(13, 0))), 1)
+		self.assertEqual(trickWinner(0, 3, ids(Card(14, 0), Card(2, 3), Card(3, 3))), 2)
+		# Trump led, and no trump at all
+		self.assertEqual(trickWinner(3, 3, ids(Card(10, 3), Card(14, 0), Card(11, 3))), 2)
+		self.assertEqual(trickWinner(1, None, ids(Card(3, 1), Card(14, 0), Card(14, 2))), 0)
+		self.assertEqual(trickWinner(1, NO_TRUMP, ids(Card(3, 1), Card(4, 1))), 1)
+		# The first of two copies wins
+		self.assertEqual(trickWinner(2, 0, ids(Card(12, 2), Card(12, 2))), 0)
+
+	def test_legal(self):
+		self.assertEqual(legalBids(3, [1], False), [0, 1, 2, 3])
+		self.assertEqual(legalBids(3, [1, 1], True), [0, 2, 3])
+		self.assertEqual(legalBids(3, [3, 2], True), [0, 1, 2, 3])
+		self.assertEqual(score(2, 2), 12)
+		self.assertEqual(score(0, 0), 10)
+		self.assertEqual(score(2, 1), 0)
+
+	def test_playRound(self):
+		gamestate = newGame(4)
+		rules = OhHellRules(gamestate, Dealer(ShuffleEngine(3)))
+		self.assertTrue(rules.playRound(5, 3))
+		self.assertEqual(sum(rules.tricks), 5)
+		self.assertNotEqual(sum(rules.bids), 5)
+		self.assertEqual(gamestate.attributes["dealer"], 3)
+		for i, player in enumerate(gamestate.players):
+			self.assertEqual(gamestate.attributes["bid_{}".format(i)], rules.bids[i])
+			self.assertEqual(gamestate.attributes["tricks_{}".format(i)], rules.tricks[i])
+			self.assertEqual(player.getPoints(), score(rules.bids[i], rules.tricks[i]))
+		self.assertEqual(len(gamestate.deck), 52)
+		self.assertEqual(gamestate.turns, 5)
+		self.assertEqual(gamestate.rounds, 1)
+		self.assertFalse(rules.playRound(14, 0))
+
+	def test_leadSuit(self):
+		# The suit led is an attribute while the trick is played, and what the
+		# MoveGenerator of the rules goes by
+		gamestate = newGame(4)
+		strategy = GreedyStrategy()
+		rules = OhHellRules(gamestate, Dealer(ShuffleEngine(4)), strategy)
+		seen = []
+		def play(rules, index, legal, lead):
+			seen.append((lead, rules.gamestate.attributes.get("lead_suit"), rules.moves.leadSuit()))
+			self.assertEqual(legal, rules.moves.legalMoves(index))
+			return GreedyStrategy.play(strategy, rules, index, legal, lead)
+		strategy.play = play
+		self.assertTrue(rules.playRound(5, 0))
+		self.assertEqual(len(seen), 20)
+		for lead, attribute, generated in seen:
+			self.assertEqual(attribute, lead)
+			self.assertEqual(generated, lead)
+		self.assertEqual(seen[0][0], None)
+		self.assertNotIn("lead_suit", gamestate.attributes)
+
+	def test_invalidPlays(self):
+		self.addCleanup(ERROR.setErrorLocation, ERROR.write_location)
+		ERROR.setErrorLocation(StringIO())
+		gamestate = newGame(3)
+		strategy = LowestStrategy()
+		rules = OhHellRules(gamestate, Dealer(ShuffleEngine(8)), strategy)
+		legal = []
+		strategy.play = lambda rules, index, cards, lead: legal.append(list(cards)) or rules.gamestate.players[index].hand.cards[0]
+		played = []
+		gamestate.subscribe(lambda event: played.append(Card.fromID(event.card)) if event.dst == -1 else None, types=(0,))
+		self.assertTrue(rules.playRound(6, 0))
+		# The dealer may not bid 2 after the others bid 2 each of the 6 tricks
+		self.assertEqual(rules.bids, [0, 2, 2])
+		# Every card actually played was a legal one
+		self.assertEqual(len(played), 18)
+		for card, cards in zip(played, legal):
+			self.assertIn(card, cards)
+		self.assertEqual(sum(rules.tricks), 6)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import importlib.util
+from io import StringIO
+
+# Local imports
+from ..shuffle import ShuffleEngine
+from ..error import ERROR
+
+"""=================================================================================
+ShuffleEngine Class Unit Tests
+================================================================================="""
+
+class TestShuffleEngineClass(unittest.TestCase):
+	def test_same_seed_same_deal(self):
+		a = ShuffleEngine(42)
+		b = ShuffleEngine(42)
+		self.assertEqual(a.permutation(), b.permutation())
+		cards_a, cards_b = list(range(0, 104)), list(range(0, 104))
+		a.shuffle(cards_a)
+		b.shuffle(cards_b)
+		self.assertEqual(cards_a, cards_b)
+		self.assertEqual(sorted(cards_a), list(range(0, 104)))
+		self.assertNotEqual(ShuffleEngine(43).permutation(), ShuffleEngine(42).permutation())
+
+	def test_spawn(self):
+		root = ShuffleEngine(7)
+		children = root.spawn(3) + root.spawn(2)
+		self.assertEqual([c.path for c in children], [(0,), (1,), (2,), (3,), (4,)])
+		deals = [tuple(c.permutation()) for c in children]
+		self.assertEqual(len(set(deals)), 5)
+		self.assertEqual(deals[3], tuple(ShuffleEngine(7).spawn(4)[3].permutation()))
+		self.assertNotEqual(tuple(root.permutation()), deals[0])
+		grandchild = children[0].spawn(1)[0]
+		self.assertEqual(grandchild.path, (0, 0))
+		self.assertIsNotNone(ShuffleEngine().seed)
+
+	@unittest.skipIf(importlib.util.find_spec("numpy") is None, "numpy is not installed")
+	def test_permutations(self):
+		import numpy
+		a = ShuffleEngine(42).permutations(1000)
+		b = ShuffleEngine(42).permutations(1000)
+		self.assertEqual(a.shape, (1000, 52))
+		self.assertTrue((a == b).all())
+		self.assertTrue((numpy.sort(a, axis=1) == numpy.arange(52)).all())
+		self.assertFalse((a[0] == a[1]).all())
+		self.assertFalse((ShuffleEngine(42).spawn(1)[0].permutations(1000) == a).all())
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
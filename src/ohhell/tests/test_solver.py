@@ -0,0 +1,130 @@
+import unittest
+import random
+
+# Local imports
+from ..card import Card
+from ..dealer import Dealer
+from ..shuffle import ShuffleEngine
+from ..headless import newGame
+from ..bitpile import SUIT_MASKS
+from ..rules import trickWinner
+from ..solver import DoubleDummySolver
+
+"""=================================================================================
+DoubleDummySolver Unit Tests
+================================================================================="""
+
+""" bruteForce(hands, trump, leader, target, played)
+Plain minimax over every legal card, the answer DoubleDummySolver has to match
+"""
+def bruteForce(hands, trump, leader, target, played=()):
+	count = len(hands)
+	mover = (leader + len(played)) % count
+	hand = hands[mover]
+	if not hand:
+		return 0
+	lead = played[0] // 13 if played else None
+	legal = hand & SUIT_MASKS[lead] if lead is not None and hand & SUIT_MASKS[lead] else hand
+	values = []
+	for card in range(0, 52):
+		if not legal >> card & 1:
+			continue
+		rest = list(hands)
+		rest[mover] = hand & ~(1 << card)
+		trick = tuple(played) + (card,)
+		if len(trick) == count:
+			winner = (leader + trickWinner(trick[0] // 13, trump, trick)) % count
+			values.append((winner == target) + bruteForce(rest, trump, winner, target))
+		else:
+			values.append(bruteForce(rest, trump, leader, target, trick))
+	return max(values) if mover == target else min(values)
+
+""" mask(*cards)
+@return : int - the card mask of the Cards
+"""
+def mask(*cards):
+	return sum(1 << card.id for card in cards)
+
+class TestDoubleDummySolver(unittest.TestCase):
+	def setUp(self):
+		self.solver = DoubleDummySolver(1 << 10)
+
+	def test_simple(self):
+		# Player 0 holds every trump that is left
+		hands = [mask(Card(14, 3), Card(13, 3)), mask(Card(14, 0), Card(13, 0)), mask(Card(2, 1), Card(3, 1))]
+		self.assertEqual(self.solver.solveAll(hands, 3, 1), [2, 0, 0])
+		# Without trump, leading the Aces takes both tricks
+		self.assertEqual(self.solver.solveAll(hands, None, 1), [0, 2, 0])
+		self.assertEqual(self.solver.solve(hands, None, 0, 0), 2)
+
+		# Halfway through a trick: the Ace of spades takes it and player 0 leads the last
+		# spade left
+		hands = [mask(Card(2, 0)), mask(Card(5, 1)), mask(Card(3, 2), Card(4, 2))]
+		self.assertEqual(self.solver.solveAll(hands, None, 0, [Card(14, 0).id, Card(13, 0).id]), [2, 0, 0])
+		self.assertRaises(ValueError, self.solver.solve, hands, None, 0, 0)
+
+	def test_bruteForce(self):
+		rand = random.Random(7)
+		for deal in range(0, 25):
+			count = rand.choice([2, 3, 4])
+			size = rand.choice([1, 2, 3])
+			ids = rand.sample(range(0, 52), count * size + 1)
+			hands = [sum(1 << id_ for id_ in ids[i * size:(i + 1) * size]) for i in range(0, count)]
+			trump = rand.choice([None, ids[-1] // 13])
+			leader = rand.randrange(0, count)
+			expected = [bruteForce(hands, trump, leader, target) for target in range(0, count)]
+			self.assertEqual(self.solver.solveAll(hands, trump, leader), expected, (hands, trump, leader))
+
+	def test_collisions(self):
+		# Entries of other positions with the same key are not used, even if they claim
+		# every trick
+		rand = random.Random(3)
+		ids = rand.sample(range(0, 52), 13)
+		hands = [sum(1 << id_ for id_ in ids[i * 3:(i + 1) * 3]) for i in range(0, 4)]
+		expected = [bruteForce(hands, 2, 1, target) for target in range(0, 4)]
+		self.assertEqual(self.solver.solveAll(hands, 2, 1), expected)
+		table = self.solver.table
+		filled = 0
+		for i, depth in enumerate(table.depths):
+			if depth >= 0:
+				table.values[i] = (depth, depth, ("another position",))
+				filled += 1
+		self.assertTrue(filled > 0)
+		self.assertEqual(self.solver.solveAll(hands, 2, 1), expected)
+
+	def test_midTrick(self):
+		# Starting part way through a trick: the cards on it count as played, for the
+		# winner so far and for the cards still in the hands
+		rand = random.Random(11)
+		for deal in range(0, 25):
+			count = rand.choice([3, 4])
+			size = rand.choice([2, 3])
+			ids = rand.sample(range(0, 52), count * size + 1)
+			hands = [sum(1 << id_ for id_ in ids[i * size:(i + 1) * size]) for i in range(0, count)]
+			trump = rand.choice([None, ids[-1] // 13])
+			leader = rand.randrange(0, count)
+			played = []
+			for k in range(0, rand.randrange(1, count)):
+				i = (leader + k) % count
+				lead = played[0] // 13 if played else None
+				legal = hands[i] & SUIT_MASKS[lead] if lead is not None and hands[i] & SUIT_MASKS[lead] else hands[i]
+				card = rand.choice([id_ for id_ in range(0, 52) if legal >> id_ & 1])
+				hands[i] &= ~(1 << card)
+				played.append(card)
+			expected = [bruteForce(hands, trump, leader, target, tuple(played)) for target in range(0, count)]
+			self.assertEqual(self.solver.solveAll(hands, trump, leader, played), expected, (hands, trump, leader, played))
+
+	def test_solveGame(self):
+		gamestate = newGame(4)
+		self.assertTrue(Dealer(ShuffleEngine(5)).deal(gamestate, 3))
+		gamestate.setGameAttribute("leader", 2)
+		hands = [mask(*player.hand.cards) for player in gamestate.players]
+		trump = gamestate.attributes["trump_suit"]
+		self.assertEqual(self.solver.solveGame(gamestate), [bruteForce(hands, trump, 2, target) for target in range(0, 4)])
+
+		# Player 2 leads a card, the solver picks the trick up from pile 0
+		card = gamestate.players[2].hand.cards[0]
+		gamestate.playerToPile(gamestate.players[2], 0, card)
+		hands[2] &= ~(1 << card.id)
+		self.assertEqual(self.solver.solveGame(gamestate, 1), bruteForce(hands, trump, 2, 1, (card.id,)))
+		self.assertTrue(self.solver.nodes > 0)
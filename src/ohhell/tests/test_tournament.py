@@ -0,0 +1,50 @@
+import unittest
+
+# Local imports
+from ..headless import newGame
+from ..tournament import Tournament, TournamentStats, playBatch
+
+"""=================================================================================
+Tournament Unit Tests
+================================================================================="""
+
+class TestTournament(unittest.TestCase):
+	def test_stats(self):
+		stats = TournamentStats(3)
+		gamestate = newGame(3)
+		for player, points in zip(gamestate.players, (12, 30, 30)):
+			player.points = points
+		stats.add(gamestate)
+		self.assertEqual(stats.points, [12, 30, 30])
+		self.assertEqual(stats.wins, [0.0, 0.5, 0.5])
+
+		other = TournamentStats(3)
+		gamestate.players[0].points = 40
+		other.add(gamestate)
+		other.seconds = 1.5
+		stats.merge(other)
+		self.assertEqual(stats.games, 2)
+		self.assertEqual(stats.points, [52, 60, 60])
+		self.assertEqual(stats.wins, [1.0, 0.5, 0.5])
+		self.assertEqual(stats.averages(), [26, 30, 30])
+		self.assertEqual(stats.seconds, 1.5)
+
+	def test_run(self):
+		stats = Tournament("Oh Hell", 3, seed=5, workers=1, batch_size=2).run(5)
+		self.assertEqual(stats.games, 5)
+		self.assertAlmostEqual(sum(stats.wins), 5)
+		self.assertGreater(stats.actions, 0)
+
+		# The same seed gives the same results in a pool of workers
+		pooled = Tournament("Oh Hell", 3, seed=5, workers=2, batch_size=2).run(5)
+		self.assertEqual(pooled.points, stats.points)
+		self.assertEqual(pooled.wins, stats.wins)
+		self.assertEqual(pooled.actions, stats.actions)
+
+		# A batch is its own stream
+		self.assertEqual(playBatch(("Oh Hell", 3, None, None, 5, 2, 1)).points, playBatch(("Oh Hell", 3, None, None, 5, 2, 1)).points)
+
+		self.assertRaises(ValueError, Tournament("Oh Hell", 9, workers=1).run, 1)
+
+if __name__ == '__main__':
+	unittest.main()
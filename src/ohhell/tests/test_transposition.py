@@ -0,0 +1,60 @@
+import unittest
+from io import StringIO
+
+# Local imports
+from ..transposition import TranspositionTable
+from ..error import ERROR
+
+"""=================================================================================
+TranspositionTable Class Unit Tests
+================================================================================="""
+
+class TestTranspositionTableClass(unittest.TestCase):
+	def test_store_lookup(self):
+		table = TranspositionTable(100)
+		self.assertEqual(table.mask, 127)
+		self.assertEqual(table.lookup(5), None)
+		table.store(5, 3, "five")
+		self.assertEqual(table.lookup(5), "five")
+		self.assertEqual(table.lookup(5, 3), "five")
+		self.assertEqual(table.lookup(5, 4), None)
+		self.assertEqual(table.probe(5), (3, "five"))
+		self.assertTrue(5 in table)
+		self.assertFalse(5 + 128 in table)
+
+		# Same position again replaces the old result
+		table.store(5, 1, "again")
+		self.assertEqual(table.probe(5), (1, "again"))
+		self.assertEqual(len(table), 1)
+
+	def test_replacement(self):
+		table = TranspositionTable(4)
+		# Keys 1, 5, 9 and 13 all share bucket 1
+		table.store(1, 5, "deep")
+		table.store(5, 2, "shallow")
+		self.assertEqual(table.lookup(1), "deep")
+		self.assertEqual(table.lookup(5), "shallow")
+
+		# Shallower results only take the always-replace slot
+		table.store(9, 1, "newest")
+		self.assertEqual(table.lookup(1), "deep")
+		self.assertEqual(table.lookup(5), None)
+		self.assertEqual(table.lookup(9), "newest")
+
+		# A deeper result takes the first slot and pushes the old one down
+		table.store(13, 8, "deeper")
+		self.assertEqual(table.lookup(13), "deeper")
+		self.assertEqual(table.lookup(1), "deep")
+		self.assertEqual(table.lookup(9), None)
+		self.assertEqual(len(table), 2)
+
+		table.clear()
+		self.assertEqual(len(table), 0)
+		self.assertEqual(table.hits, 0)
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from io import StringIO
+
+# Local imports
+from ..card import Card
+from ..zobrist import *
+from ..zobrist import _attributeKey, _cachedAttributeKey
+from ..error import ERROR
+
+"""=================================================================================
+Zobrist Keys Unit Tests
+================================================================================="""
+
+class TestZobristKeys(unittest.TestCase):
+	def test_splitmix64(self):
+		# Reference values for seed 0 of the splitmix64 generator
+		self.assertEqual(splitmix64(0), 0xE220A8397B1DCDAF)
+		self.assertEqual(splitmix64(0x9E3779B97F4A7C15), 0x6E789E6AA1B965F4)
+
+	def test_keys(self):
+		keys = set()
+		for id_ in range(0, 52):
+			for code in [-3, -1, 0, 1, 4]:
+				for copy in [0, 1]:
+					keys.add(cardKey(id_, code, copy))
+		keys.update(turnKey(i) for i in range(0, 50))
+		keys.update(roundKey(i) for i in range(0, 50))
+		self.assertEqual(len(keys), 52 * 5 * 2 + 100)
+		self.assertTrue(all(0 <= key < 1 << 64 for key in keys))
+		self.assertEqual(cardKey(7, -1, 1), cardKey(7, -1, 1))
+
+	def test_attributeKey(self):
+		self.assertEqual(attributeKey("trump_suit", 2), attributeKey("trump_suit", 2))
+		self.assertNotEqual(attributeKey("trump_suit", 2), attributeKey("trump_suit", 3))
+		self.assertNotEqual(attributeKey("trump_suit", 2), attributeKey("lead_suit", 2))
+		self.assertEqual(attributeKey("trump", Card(14,3)), attributeKey("trump", Card(14,3)))
+		self.assertEqual(attributeKey("bids", (1, 2)), attributeKey("bids", (1, 2)))
+		self.assertEqual(attributeKey("trump", None), attributeKey("trump", None))
+
+		# Values that could change after they are set have no key
+		self.assertRaises(TypeError, attributeKey, "bids", [1, 2])
+		self.assertRaises(TypeError, attributeKey, "bids", (1, [2]))
+		self.assertRaises(TypeError, attributeKey, "seen", frozenset((1, 2)))
+
+		# Equal values of other types get their own keys, whichever comes first
+		self.assertEqual(attributeKey("flag", 1), _attributeKey("flag", 1))
+		self.assertEqual(attributeKey("flag", True), _attributeKey("flag", True))
+		self.assertEqual(attributeKey("flag", 1.0), _attributeKey("flag", 1.0))
+		self.assertNotEqual(attributeKey("flag", True), attributeKey("flag", 1))
+
+		# The cache stays bounded
+		for i in range(0, ATTRIBUTE_CACHE_SIZE + 10):
+			attributeKey("count", i)
+		self.assertLessEqual(_cachedAttributeKey.cache_info().currsize, ATTRIBUTE_CACHE_SIZE)
+
+
+
+if __name__ == '__main__':
+	# Divert stderr so unittest output isn't cluttered
+	ERROR.setErrorLocation(StringIO())
+	unittest.main()
@@ -0,0 +1,167 @@
+import os
+import timeit
+
+# Local imports
+from .game import Game
+from .shuffle import ShuffleEngine
+
+"""=================================================================================
+TournamentStats Class
+================================================================================="""
+
+""" TournamentStats Class
+The merged results of many games, by seat. A game won by several players at once
+	counts as a share of a win for each of them, so the wins add up to the games.
+
+@author Chris P.
+@created 2021-01-31 YMD
+"""
+class TournamentStats():
+	"""__init__
+	@param seats : int - players at every table
+	"""
+	def __init__(self, seats):
+		self.seats = seats
+		self.games = 0
+		self.points = [0] * seats # total Player.points by seat
+		self.wins = [0.0] * seats
+		self.actions = 0
+		self.seconds = 0.0 # time spent playing, summed over the workers
+		self.wall = 0.0 # time the whole run took
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" add(gamestate)
+	Counts a finished game
+	@param gamestate : Gamestate - the game once it is over
+	"""
+	def add(self, gamestate):
+		points = [player.points for player in gamestate.players]
+		best = max(points)
+		winners = points.count(best)
+		for i in range(0, self.seats):
+			self.points[i] += points[i]
+			if points[i] == best:
+				self.wins[i] += 1 / winners
+		self.games += 1
+		self.actions += len(gamestate.history)
+
+	""" merge(other)
+	Adds the results of another run, eg. from another worker
+	@param other : TournamentStats - results for the same number of seats
+	@return : TournamentStats - self, for chaining
+	"""
+	def merge(self, other):
+		self.games += other.games
+		self.points = [a + b for a, b in zip(self.points, other.points)]
+		self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+		self.actions += other.actions
+		self.seconds += other.seconds
+		return self
+
+	""" averages()
+	@return : [float] - the average points by seat
+	"""
+	def averages(self):
+		return [points / max(self.games, 1) for points in self.points]
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __str__(self):
+		wall = self.wall if self.wall > 0 else self.seconds
+		lines = ["{} games in {:.2f} s ({:.2f} s of play): {:.1f} games/s, {:.0f} actions/s".format(
+			self.games, wall, self.seconds, self.games / max(wall, 1e-9), self.actions / max(wall, 1e-9))]
+		for i, average in enumerate(self.averages()):
+			lines.append("Seat {}: {:.2f} points/game, {:.1%} wins".format(i + 1, average, self.wins[i] / max(self.games, 1)))
+		return "\n".join(lines)
+
+	def __repr__(self):
+		return "TournamentStats({} seats, {} games)".format(self.seats, self.games)
+
+"""=================================================================================
+Tournament Class
+================================================================================="""
+
+""" Tournament Class
+Plays many games of one kind over a pool of processes and merges the results. The
+	games are split into batches of batch_size. Batch k plays with the engines spawned
+	from ShuffleEngine(seed, (k,)), so every game has its own stream and a run gives
+	the same results for the same seed whatever the number of workers.
+
+	tournament = Tournament("Oh Hell", 4, seed=42)
+	print(tournament.run(100000))
+
+	Strategies have to be picklable to reach the workers, eg. instances of a class
+	defined at module level.
+
+@author Chris P.
+@created 2021-01-31 YMD
+"""
+class Tournament():
+	"""__init__
+	@param game_name : String - the type of game, see Game
+	@param players : int - players at every table
+	@param seed : int - the root seed. Default is None, a random seed
+	@param num_decks : int - decks per game. Default is None, the usual number for the game
+	@param strategies : strategy or [strategy] - see Game. Default is None
+	@param workers : int - processes to play in. Default is None, one per CPU. 1 plays
+		in this process
+	@param batch_size : int - games per batch sent to a worker. Default is 100
+	"""
+	def __init__(self, game_name, players, seed=None, num_decks=None, strategies=None, workers=None, batch_size=100):
+		self.game_name = game_name
+		self.players = players
+		self.seed = ShuffleEngine(seed).seed
+		self.num_decks = num_decks
+		self.strategies = strategies
+		self.workers = workers if workers is not None else os.cpu_count() or 1
+		self.batch_size = batch_size
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" run(games)
+	@param games : int - how many games to play
+	@return : TournamentStats - the merged results
+	@raise ValueError if the game can't be played by that many players
+	"""
+	def run(self, games):
+		# Fail here rather than in every worker
+		Game(self.game_name, self.players, self.seed, self.num_decks, self.strategies)
+		batches = [(self.game_name, self.players, self.num_decks, self.strategies, self.seed, k, min(self.batch_size, games - start))
+			for k, start in enumerate(range(0, games, self.batch_size))]
+		stats = TournamentStats(self.players)
+		start = timeit.default_timer()
+		if self.workers == 1 or len(batches) <= 1:
+			results = map(playBatch, batches)
+			for result in results:
+				stats.merge(result)
+		else:
+			from concurrent.futures import ProcessPoolExecutor
+			with ProcessPoolExecutor(max_workers=self.workers) as pool:
+				for result in pool.map(playBatch, batches):
+					stats.merge(result)
+		stats.wall = timeit.default_timer() - start
+		return stats
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	def __repr__(self):
+		return "Tournament({!r}, {}, seed={}, workers={})".format(self.game_name, self.players, self.seed, self.workers)
+
+""" playBatch(batch)
+Plays one batch of games, in a worker process
+@param batch : (game_name, players, num_decks, strategies, seed, index, games)
+@return : TournamentStats - the results of the batch
+"""
+def playBatch(batch):
+	game_name, players, num_decks, strategies, seed, index, games = batch
+	stats = TournamentStats(players)
+	start = timeit.default_timer()
+	for engine in ShuffleEngine(seed, (index,)).spawn(games):
+		stats.add(Game(game_name, players, engine, num_decks, strategies).play())
+	stats.seconds = timeit.default_timer() - start
+	return stats
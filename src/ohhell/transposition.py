@@ -0,0 +1,115 @@
+"""=================================================================================
+TranspositionTable Class
+================================================================================="""
+
+""" TranspositionTable Class
+A fixed size cache of search results keyed by a 64 bit position hash (Gamestate.hash
+	or FlatState.hash). The table never grows: it has size buckets of two slots, picked
+	by the low bits of the hash.
+
+	The first slot of a bucket is depth-preferred, it keeps the result that took the
+	deepest search and is only replaced by one at least as deep. The second slot is
+	always-replace and holds the newest result that didn't win the first slot, so
+	recent positions still hit while deep results survive.
+
+	table = TranspositionTable(1 << 16)
+	table.store(state.hash, depth, value)
+	value = table.lookup(state.hash, depth)		# None unless searched at least as deep
+
+@author Chris P.
+@created 2021-01-27 YMD
+"""
+class TranspositionTable():
+	"""__init__
+	@param size : int - number of buckets, rounded up to a power of 2. Default is 65536
+	"""
+	def __init__(self, size=1 << 16):
+		buckets = 1
+		while buckets < size:
+			buckets <<= 1
+		self.mask = buckets - 1
+		self.keys = [0] * (2 * buckets)
+		self.depths = [-1] * (2 * buckets) # -1 marks an empty slot
+		self.values = [None] * (2 * buckets)
+		self.hits = 0
+		self.misses = 0
+
+	# ------------------------------------------------------------------------------
+	# Public Methods
+
+	""" store(key, depth, value)
+	@param key : int - the position hash
+	@param depth : int - how deep the search behind value went, 0 or more
+	@param value : Any - the result to keep
+	"""
+	def store(self, key, depth, value):
+		i = (key & self.mask) << 1
+		if self.keys[i] == key or depth >= self.depths[i]:
+			if self.keys[i] != key and self.depths[i] >= 0:
+				# Keep the result being pushed out in the always-replace slot
+				self.keys[i + 1] = self.keys[i]
+				self.depths[i + 1] = self.depths[i]
+				self.values[i + 1] = self.values[i]
+			elif self.keys[i + 1] == key:
+				self.depths[i + 1] = -1
+		else:
+			i += 1
+		self.keys[i] = key
+		self.depths[i] = depth
+		self.values[i] = value
+
+	""" probe(key)
+	@param key : int - the position hash
+	@return : (int, Any) - (depth, value) stored for the position, None if there isn't one
+	"""
+	def probe(self, key):
+		i = (key & self.mask) << 1
+		if self.keys[i] == key and self.depths[i] >= 0:
+			self.hits += 1
+			return (self.depths[i], self.values[i])
+		if self.keys[i + 1] == key and self.depths[i + 1] >= 0:
+			self.hits += 1
+			return (self.depths[i + 1], self.values[i + 1])
+		self.misses += 1
+		return None
+
+	""" lookup(key, depth)
+	@param key : int - the position hash
+	@param depth : int - the depth the caller is about to search
+	@return : Any - the stored value if it came from a search at least depth deep, else None
+	"""
+	def lookup(self, key, depth=0):
+		entry = self.probe(key)
+		if entry is None or entry[0] < depth:
+			return None
+		return entry[1]
+
+	""" clear()
+	Empties every slot and resets the hit counters
+	"""
+	def clear(self):
+		size = len(self.keys)
+		self.keys = [0] * size
+		self.depths = [-1] * size
+		self.values = [None] * size
+		self.hits = 0
+		self.misses = 0
+
+	# ------------------------------------------------------------------------------
+	# Python Methods
+
+	""" __len__()
+	@return : int - number of filled slots (O(size))
+	"""
+	def __len__(self):
+		return sum(1 for depth in self.depths if depth >= 0)
+
+	def __contains__(self, key):
+		i = (key & self.mask) << 1
+		return (self.keys[i] == key and self.depths[i] >= 0) or (self.keys[i + 1] == key and self.depths[i + 1] >= 0)
+
+	def __str__(self):
+		return "TranspositionTable of {} buckets, {} hits, {} misses".format(self.mask + 1, self.hits, self.misses)
+
+	def __repr__(self):
+		return "TranspositionTable({})".format(self.mask + 1)
@@ -0,0 +1,123 @@
+"""=================================================================================
+Zobrist Keys
+================================================================================="""
+
+""" Zobrist Keys
+64 bit keys for Zobrist hashing of a game. The hash of a position is the XOR of the
+	keys of everything in it, so a change to the position updates the hash with one or
+	two XORs instead of hashing the whole game again:
+
+	cardKey(card ID, location code, copy)	one per copy of a card in a location. The
+		n-th copy of a card in a location (n from 0) gets copy n, so two copies don't
+		cancel each other out
+	turnKey(turns), roundKey(rounds)		the turn and round counters
+	attributeKey(key, value)				one per game attribute. Values have to be
+		immutable (None, bool, int, float, str, bytes, Card or tuples of them), a
+		value changed after it was set would XOR out another key than it XORed in
+
+	Keys are the same in every process and every run: card, turn and round keys come
+	from splitmix64, attribute keys from blake2b of repr((key, value)). Card, turn and
+	round keys are cached after the first use, attribute keys in an LRU of the latest
+	ATTRIBUTE_CACHE_SIZE.
+
+@author Chris P.
+@created 2021-01-27 YMD
+"""
+
+from functools import lru_cache
+
+# Local imports
+from .card import Card
+
+MASK_64 = (1 << 64) - 1
+
+# Domains, so the card, turn and round keys never collide
+_CARD = 0
+_TURN = 1 << 60
+_ROUND = 2 << 60
+
+_KEYS = {}
+
+# Attribute keys kept, the values of long games are not all kept forever
+ATTRIBUTE_CACHE_SIZE = 4096
+
+# Types of the attribute values that can't change once made, see attributeKey()
+_SCALARS = frozenset((type(None), bool, int, float, str, bytes, Card))
+
+""" splitmix64(x)
+@param x : int - any 64 bit value
+@return : int - the splitmix64 mix of x, a well spread 64 bit value
+"""
+def splitmix64(x):
+	x = (x + 0x9E3779B97F4A7C15) & MASK_64
+	x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+	x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK_64
+	return x ^ (x >> 31)
+
+""" cardKey(card_id, code, copy)
+@param card_id : int - the card ID
+@param code : int - the location code, see Gamestate
+@param copy : int - which copy of the card in that location, from 0
+@return : int - the key
+"""
+def cardKey(card_id, code, copy=0):
+	packed = card_id | ((code & 0xFFFF) << 6) | (copy << 22)
+	key = _KEYS.get(packed)
+	if key is None:
+		key = _KEYS[packed] = splitmix64(packed)
+	return key
+
+""" turnKey(turns)
+@param turns : int - the turn counter
+@return : int - the key
+"""
+def turnKey(turns):
+	packed = _TURN | turns
+	key = _KEYS.get(packed)
+	if key is None:
+		key = _KEYS[packed] = splitmix64(packed)
+	return key
+
+""" roundKey(rounds)
+@param rounds : int - the round counter
+@return : int - the key
+"""
+def roundKey(rounds):
+	packed = _ROUND | rounds
+	key = _KEYS.get(packed)
+	if key is None:
+		key = _KEYS[packed] = splitmix64(packed)
+	return key
+
+""" attributeKey(key, value)
+@param key : String - the attribute key
+@param value : Any - the attribute value: None, a bool, int, float, str, bytes or Card,
+	or a tuple of them
+@return : int - the key
+@raise TypeError if the value could change after it is set, eg. a list or a Pile
+"""
+def attributeKey(key, value):
+	if not _immutable(value):
+		raise TypeError("attributeKey: the value of {!r} has to be immutable, not {}".format(key, type(value).__name__))
+	# type(value) keeps equal values of other types apart, eg. True, 1 and 1.0
+	return _cachedAttributeKey(key, value, type(value))
+
+""" _immutable(value)
+@return : boolean - True if value is one of _SCALARS or a tuple of immutable values
+"""
+def _immutable(value):
+	if type(value) is tuple:
+		for item in value:
+			if not _immutable(item):
+				return False
+		return True
+	return type(value) in _SCALARS
+
+@lru_cache(maxsize=ATTRIBUTE_CACHE_SIZE)
+def _cachedAttributeKey(key, value, type_):
+	return _attributeKey(key, value)
+
+def _attributeKey(key, value):
+	import hashlib # Only needed once attributes are hashed, keeps it out of "import ohhell.gamestate"
+	digest = hashlib.blake2b(repr((key, value)).encode(), digest_size=8).digest()
+	return int.from_bytes(digest, "little")
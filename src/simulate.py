@@ -0,0 +1,61 @@
+import os
+import sys
+
+# Local imports
+from ohhell.tournament import Tournament
+
+"""=================================================================================
+Batch Simulation
+================================================================================="""
+
+""" Batch Simulation
+Plays complete games headlessly over a pool of processes and reports how many games a
+	second were played, with the points and wins of every seat. Nothing is printed
+	while the games run. The games are seeded from the root seed the same way whatever
+	the number of workers, so a run can be repeated exactly
+
+	python3 simulate.py --games 100000 --players 4 --seed 42 --workers 8
+
+@author Chris P.
+@created 2021-01-30 YMD
+"""
+
+""" simulate(game_name, games, players, seed, num_decks, workers)
+@param game_name : String - the type of game, see Game
+@param games : int - how many games to play
+@param players : int - players at every table
+@param seed : int - the root seed. Default is None, a random seed
+@param num_decks : int - decks per game. Default is None, the usual number for the game
+@param workers : int - processes to play in. Default is 1
+@return : TournamentStats - the merged results
+"""
+def simulate(game_name, games, players, seed=None, num_decks=None, workers=1):
+	return Tournament(game_name, players, seed, num_decks, workers=workers).run(games)
+
+""" main(argv)
+@param argv : [String] - the command line arguments. Default is sys.argv[1:]
+@return : int - exit code
+"""
+def main(argv=None):
+	import argparse
+	parser = argparse.ArgumentParser(prog="python3 simulate.py", description="Play complete games without any prompts and report games per second.")
+	parser.add_argument("--games", type=int, default=1000, help="number of games to play (default 1000)")
+	parser.add_argument("--game", default="Oh Hell", help="type of game (default \"Oh Hell\")")
+	parser.add_argument("--players", type=int, default=4, help="number of players (default 4)")
+	parser.add_argument("--decks", type=int, default=None, help="number of stacked decks (default: the game's own)")
+	parser.add_argument("--seed", type=int, default=None, help="root seed for a reproducible run")
+	parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes to play in (default: one per CPU)")
+	args = parser.parse_args(argv)
+	if args.games < 1:
+		parser.error("--games has to be at least 1")
+
+	try:
+		stats = simulate(args.game, args.games, args.players, args.seed, args.decks, args.workers)
+	except ValueError as error:
+		sys.stderr.write("{}\n".format(error))
+		return 1
+	print(stats)
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())